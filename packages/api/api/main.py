@@ -19,6 +19,7 @@ from pydantic import BaseModel
 
 # Import retriever
 from rag_pipeline.rag.retriever import HybridRetriever, FAISSRetriever, ZeroEntropyReranker
+from rag_pipeline.storage.s3 import create_s3_client
 from openai import OpenAI
 from litellm import completion
 from api.prompts import SYSTEM_PROMPT, RAG_PROMPT_TEMPLATE, format_sources_for_prompt
@@ -48,6 +49,7 @@ FAISS_CANDIDATES = int(os.environ.get("FAISS_CANDIDATES", "75"))
 
 retriever: Optional[HybridRetriever] = None
 openai_client: Optional[OpenAI] = None
+s3_client = None  # Shared by all requests, so presigning reuses one connection pool
 
 
 # ============================================================================
@@ -58,7 +60,7 @@ openai_client: Optional[OpenAI] = None
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Load FAISS index on startup."""
-    global retriever, openai_client
+    global retriever, openai_client, s3_client
 
     print("=" * 60)
     print("Loading RAG retriever...")
@@ -69,6 +71,7 @@ async def lifespan(app: FastAPI):
 
     # Initialize OpenAI client for chat completions
     openai_client = OpenAI(api_key=OPENAI_API_KEY)
+    s3_client = create_s3_client()
 
     start = time.time()
 
@@ -276,11 +279,8 @@ def get_pdf_url(paper_id: str):
 
     Returns a temporary URL valid for 1 hour.
     """
-    import boto3
     from botocore.exceptions import ClientError
 
-    s3_client = boto3.client("s3")
-
     # Try to find the PDF in raw_pdfs/
     # The filename pattern is: {index}_{work_id}_*.pdf
     # e.g., 02596_W1962380625_Some_Title.pdf
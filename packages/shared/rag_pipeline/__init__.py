@@ -4,21 +4,37 @@ __version__ = "1.0.1"
 __author__ = "Elie Bruno"
 __description__ = "RAG pipeline for academic papers with OpenAlex and Dolphin"
 
-# Make key classes easily importable
-from .openalex.fetcher import MetadataFetcher
-from .openalex.downloader import PDFDownloader
-
-# RAG components
-from .rag.chunking import DocumentChunker
-from .rag.openai_embedder import OpenAIEmbedder
+# Key classes are importable from the package root but loaded lazily, so
+# consumers such as the API server don't pay for pandas/requests/openai imports
+# they never use.
+_LAZY_IMPORTS = {
+    "MetadataFetcher": ".openalex.fetcher",
+    "PDFDownloader": ".openalex.downloader",
+    # RAG components
+    "DocumentChunker": ".rag.chunking",
+    "OpenAIEmbedder": ".rag.openai_embedder",
+    "AsyncOpenAIEmbedder": ".rag.openai_embedder",
+}
 
 __all__ = [
     "MetadataFetcher",
     "PDFDownloader",
     "DocumentChunker",
     "OpenAIEmbedder",
+    "AsyncOpenAIEmbedder",
 ]
 
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        from importlib import import_module
+
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # PDF parsing exports (optional - only available with [pdf] extra)
 # Import these directly when needed:
 #   from rag_pipeline.pdf_parsing import DolphinModel, PDFParsingPipeline, PDFParsingConfig
@@ -10,6 +10,7 @@ from .metrics import (
     calculate_chunk_statistics,
     calculate_coherence_score,
     calculate_boundary_quality,
+    embed_sentences,
     evaluate_citation_integrity,
 )
 from .visualizations import (
@@ -28,6 +29,7 @@ __all__ = [
     "calculate_chunk_statistics",
     "calculate_coherence_score",
     "calculate_boundary_quality",
+    "embed_sentences",
     "evaluate_citation_integrity",
     # Visualizations
     "create_size_distribution_plot",
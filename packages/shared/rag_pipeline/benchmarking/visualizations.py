@@ -11,6 +11,8 @@ from plotly.subplots import make_subplots
 import numpy as np
 import pandas as pd
 
+from .metrics import normalize_array
+
 
 # Color scheme for consistent branding
 COLORS = {
@@ -23,6 +25,37 @@ COLORS = {
 
 STRATEGY_NAMES = {"hybrid": "Hybrid Semantic", "fixed": "Fixed-Size", "semantic": "Pure Semantic"}
 
+# Upper bound on raw points shipped per violin trace; larger samples are reduced to quantiles
+MAX_VIOLIN_POINTS = 500
+
+
+def _box_stats(scores: np.ndarray) -> Dict[str, List[float]]:
+    """
+    Precompute box plot statistics so Plotly does not need the raw points.
+
+    Fences follow Plotly's default: the most extreme points within 1.5 IQR.
+
+    Args:
+        scores: 1-D array of scores
+
+    Returns:
+        Keyword arguments for the precomputed ``go.Box`` interface
+    """
+    q1, median, q3 = np.quantile(scores, [0.25, 0.5, 0.75])
+    iqr = q3 - q1
+    lowerfence = scores[scores >= q1 - 1.5 * iqr].min()
+    upperfence = scores[scores <= q3 + 1.5 * iqr].max()
+
+    return {
+        "q1": [float(q1)],
+        "median": [float(median)],
+        "q3": [float(q3)],
+        "lowerfence": [float(lowerfence)],
+        "upperfence": [float(upperfence)],
+        "mean": [float(scores.mean())],
+        "sd": [float(scores.std())],
+    }
+
 
 def create_size_distribution_plot(
     strategy_data: Dict[str, List], title: str = "Chunk Size Distribution by Strategy"
@@ -43,13 +76,17 @@ def create_size_distribution_plot(
         display_name = STRATEGY_NAMES.get(strategy_name, strategy_name.capitalize())
         color = COLORS.get(strategy_name, COLORS["primary"])
 
+        # Pre-bin in numpy so the figure carries 30 counts instead of every chunk size
+        counts, edges = np.histogram(np.asarray(sizes), bins=30)
+
         fig.add_trace(
-            go.Histogram(
-                x=sizes,
+            go.Bar(
+                x=(edges[:-1] + edges[1:]) / 2,
+                y=counts,
+                width=np.diff(edges),
                 name=display_name,
                 marker_color=color,
                 opacity=0.7,
-                nbinsx=30,
                 hovertemplate="<b>%{x:.0f} chars</b><br>Count: %{y}<extra></extra>",
             )
         )
@@ -100,28 +137,18 @@ def create_comparison_heatmap(
     Returns:
         Plotly Figure object
     """
-    # Normalize metrics to 0-1 scale for comparison
-    normalized_df = metrics_df.copy()
-
     # Invert metrics where lower is better
     invert_metrics = ["std_size_chars", "boundary_quality"]
 
-    for col in normalized_df.columns:
-        if col != "strategy_name":
-            min_val = normalized_df[col].min()
-            max_val = normalized_df[col].max()
-
-            if max_val > min_val:
-                if col in invert_metrics:
-                    # Lower is better - invert normalization
-                    normalized_df[col] = 1 - ((normalized_df[col] - min_val) / (max_val - min_val))
-                else:
-                    normalized_df[col] = (normalized_df[col] - min_val) / (max_val - min_val)
+    # Extract the numeric matrix once and normalize every column in one broadcast
+    strategies = metrics_df["strategy_name"].tolist()
+    metrics = [col for col in metrics_df.columns if col != "strategy_name"]
 
-    # Prepare data for heatmap
-    strategies = normalized_df["strategy_name"].tolist()
-    metrics = [col for col in normalized_df.columns if col != "strategy_name"]
-    values = normalized_df[metrics].values
+    # float32 is ample for a [0, 1] heatmap and halves the serialized figure payload
+    invert_mask = np.array([m in invert_metrics for m in metrics], dtype=bool)
+    values = normalize_array(
+        metrics_df[metrics].to_numpy(dtype=np.float32), invert=invert_mask, axis=0
+    )
 
     fig = go.Figure(
         data=go.Heatmap(
@@ -179,13 +206,17 @@ def create_coherence_boxplot(
         display_name = STRATEGY_NAMES.get(strategy_name, strategy_name.capitalize())
         color = COLORS.get(strategy_name, COLORS["primary"])
 
+        scores = np.asarray(scores, dtype=float)
+        if scores.size == 0:
+            continue
+
         fig.add_trace(
             go.Box(
-                y=scores,
+                x=[display_name],
                 name=display_name,
                 marker_color=color,
                 boxmean="sd",  # Show mean and standard deviation
-                hovertemplate="<b>%{y:.3f}</b><extra></extra>",
+                **_box_stats(scores),
             )
         )
 
@@ -242,6 +273,11 @@ def create_boundary_quality_plot(
         display_name = STRATEGY_NAMES.get(strategy_name, strategy_name.capitalize())
         color = COLORS.get(strategy_name, COLORS["primary"])
 
+        scores = np.asarray(scores, dtype=float)
+        if scores.size > MAX_VIOLIN_POINTS:
+            # Representative quantiles keep the density shape without shipping every point
+            scores = np.quantile(scores, np.linspace(0, 1, MAX_VIOLIN_POINTS))
+
         fig.add_trace(
             go.Violin(
                 y=scores,
@@ -292,6 +328,7 @@ def create_citation_analysis_plot(
     """
     strategies = list(citation_data.keys())
     display_names = [STRATEGY_NAMES.get(s, s.capitalize()) for s in strategies]
+    colors_list = [COLORS.get(s, COLORS["primary"]) for s in strategies]
 
     total_citations = [citation_data[s]["total_citations"] for s in strategies]
     coverage_pct = [citation_data[s]["citation_coverage"] * 100 for s in strategies]
@@ -309,7 +346,7 @@ def create_citation_analysis_plot(
             x=display_names,
             y=total_citations,
             name="Total Citations",
-            marker_color=[COLORS.get(s, COLORS["primary"]) for s in strategies],
+            marker_color=colors_list,
             hovertemplate="<b>%{x}</b><br>Citations: %{y}<extra></extra>",
         ),
         row=1,
@@ -322,7 +359,7 @@ def create_citation_analysis_plot(
             x=display_names,
             y=coverage_pct,
             name="Coverage %",
-            marker_color=[COLORS.get(s, COLORS["primary"]) for s in strategies],
+            marker_color=colors_list,
             hovertemplate="<b>%{x}</b><br>Coverage: %{y:.1f}%<extra></extra>",
         ),
         row=1,
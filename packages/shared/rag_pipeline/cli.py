@@ -197,12 +197,19 @@ def parse_pdfs(
 
     # Initialize PDF parsing pipeline
     console.print("[yellow]Loading PDF parsing pipeline...[/yellow]")
-    from .pdf_parsing.config import PDFParsingConfig, DolphinModelConfig, OutputConfig
+    from .pdf_parsing.config import (
+        PDFParsingConfig,
+        DolphinModelConfig,
+        OutputConfig,
+        ProcessingConfig,
+    )
     from pathlib import Path as PathLib
 
+    # Outputs are written in the background while the next PDF is parsed
     config = PDFParsingConfig(
         model=DolphinModelConfig(model_path=PathLib(model_path)),
         output=OutputConfig(output_dir=output_dir),
+        processing=ProcessingConfig(background_output=True),
     )
     pipeline = PDFParsingPipeline(config)
 
@@ -233,6 +240,12 @@ def parse_pdfs(
                 failed += 1
                 console.print(f"[red]✗[/red] {pdf_path.name}: {str(e)}")
 
+        status.update("[bold green]Writing remaining outputs...")
+        for pdf_path, e in pipeline.flush_outputs().items():
+            successful -= 1
+            failed += 1
+            console.print(f"[red]✗[/red] {pdf_path.name}: {str(e)}")
+
     # Summary
     table = Table(title="Parsing Summary")
     table.add_column("Status", style="cyan")
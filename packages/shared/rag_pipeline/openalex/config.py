@@ -40,6 +40,14 @@ class OpenAlexConfig(BaseSettings):
         default=200, ge=1, le=200, description="Number of results per page (max 200)"
     )
 
+    # Parsing
+    validation_workers: int = Field(
+        default=0,
+        ge=0,
+        le=64,
+        description="Worker processes for validating fetched works (0 validates in-process)",
+    )
+
     # Output Configuration
     output_dir: Path = Field(
         default=Path("openalex_data"), description="Base output directory for all data"
@@ -85,10 +93,19 @@ class OpenAlexConfig(BaseSettings):
 
     # Parquet Options
     parquet_compression: str = Field(
-        default="snappy",
+        default="zstd",
         description="Compression algorithm for parquet (snappy, gzip, brotli, zstd)",
     )
 
+    parquet_compression_level: Optional[int] = Field(
+        default=3,
+        description="Compression level for parquet (None for the codec default)",
+    )
+
+    parquet_row_group_size: int = Field(
+        default=500_000, ge=1, description="Maximum number of rows per parquet row group"
+    )
+
     # Logging
     log_level: str = Field(
         default="INFO", description="Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)"
@@ -13,7 +13,7 @@ import requests
 from loguru import logger
 
 from .config import OpenAlexConfig
-from .models import DownloadStats, OpenAlexWork
+from .models import DownloadStats, OpenAlexWork, validate_work
 from .utils import (
     create_pdf_filename,
     validate_pdf_content,
@@ -390,7 +390,7 @@ class PDFDownloader:
                 # If full_json is available, use it
                 if "full_json" in row and pd.notna(row["full_json"]):
                     work_data = json.loads(row["full_json"])
-                    work = OpenAlexWork(**work_data)
+                    work = validate_work(work_data)
                 else:
                     # Reconstruct from flat data (limited information)
                     # This is a simplified reconstruction
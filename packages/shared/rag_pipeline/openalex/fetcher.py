@@ -1,19 +1,121 @@
 """Metadata fetcher service for OpenAlex API."""
 
 import time
+import typing
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
+import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import requests
 from loguru import logger
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from .config import OpenAlexConfig
-from .models import OpenAlexWork, FlatWork
+from .models import OpenAlexWork, FlatWork, validate_work
 from .utils import format_duration
 
 
+# Free-text columns (titles, full_json) use 64-bit offsets so a large page
+# can never overflow a 2 GiB string buffer
+_ARROW_TYPES = {int: pa.int64(), float: pa.float64(), bool: pa.bool_(), str: pa.large_string()}
+
+# Small integer columns stored as int32
+INT32_COLUMNS = [
+    "publication_year",
+    "cited_by_count",
+    "num_locations",
+    "num_pdf_urls",
+    "num_oa_locations",
+    "num_authors",
+]
+
+# Concept score columns
+FLOAT_COLUMNS = ["concept_1_score", "concept_2_score", "concept_3_score"]
+
+BOOL_COLUMNS = [
+    "is_retracted",
+    "is_paratext",
+    "is_oa",
+    "any_repository_has_fulltext",
+    "has_any_pdf",
+]
+
+# Low-cardinality string columns stored dictionary-encoded (read back as pandas categoricals)
+CATEGORICAL_COLUMNS = [
+    "oa_status",
+    "type",
+    "language",
+    "best_oa_source_type",
+    "primary_source_type",
+    "topic_domain",
+    "topic_field",
+]
+
+
+def _flatwork_schema() -> pa.Schema:
+    """Build the parquet schema from the FlatWork field annotations."""
+    fields = []
+    for name, field in FlatWork.model_fields.items():
+        if name in INT32_COLUMNS:
+            arrow_type = pa.int32()
+        elif name in CATEGORICAL_COLUMNS:
+            arrow_type = pa.dictionary(pa.int16(), pa.string())
+        else:
+            annotation = field.annotation
+            # Unwrap Optional[X] to X; every column is nullable in parquet anyway
+            args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+            if args:
+                annotation = args[0]
+            arrow_type = _ARROW_TYPES[annotation]
+        fields.append(pa.field(name, arrow_type))
+    return pa.schema(fields)
+
+
+# Fixed schema so every page is written with identical column types, even
+# when a page happens to have only nulls in some column
+FLATWORK_SCHEMA = _flatwork_schema()
+
+
+# Validates a whole page in a single call into pydantic-core
+_WORKS_ADAPTER = TypeAdapter(List[OpenAlexWork])
+
+
+def _parse_page(results: List[dict], page: int) -> List[OpenAlexWork]:
+    """
+    Validate one page of API results into OpenAlexWork objects.
+
+    The page is validated as a whole; only if that fails are the items
+    validated one by one, so that valid works are kept and each invalid one is
+    logged. Module-level so it can run in a worker process.
+
+    Args:
+        results: Raw work dicts from the API
+        page: Page number, for log messages
+
+    Returns:
+        Works that validated successfully
+    """
+    try:
+        return _WORKS_ADAPTER.validate_python(results)
+    except ValidationError:
+        pass
+
+    page_works = []
+    for i, result in enumerate(results):
+        try:
+            work = validate_work(result)
+            page_works.append(work)
+        except ValidationError as e:
+            logger.warning(f"Failed to parse work on page {page}, item {i}: {e}")
+            logger.debug(f"Problematic data: {result.get('id', 'unknown')}")
+
+    return page_works
+
+
 class MetadataFetcher:
     """Fetches metadata from OpenAlex API and saves to Parquet."""
 
@@ -30,6 +132,20 @@ class MetadataFetcher:
             {"User-Agent": f"OpenAlexFetcher/1.0 ({config.email or 'no-email-provided'})"}
         )
 
+        # Pydantic validation is CPU-bound and holds the GIL; optionally move it
+        # off the main process
+        self.validation_pool: Optional[ProcessPoolExecutor] = (
+            ProcessPoolExecutor(max_workers=config.validation_workers)
+            if config.validation_workers > 0
+            else None
+        )
+
+    def close(self) -> None:
+        """Shut down the validation worker processes, if any."""
+        if self.validation_pool is not None:
+            self.validation_pool.shutdown()
+            self.validation_pool = None
+
     def fetch_page(self, cursor: str = "*") -> tuple[List[dict], Optional[str]]:
         """
         Fetch a single page of results from OpenAlex API.
@@ -59,81 +175,133 @@ class MetadataFetcher:
 
         return results, next_cursor
 
-    def fetch_all_works(self) -> List[OpenAlexWork]:
+    def _fetch_page_after_delay(self, cursor: str) -> tuple[List[dict], Optional[str]]:
+        """Wait for the configured request delay, then fetch the page at cursor."""
+        time.sleep(self.config.request_delay)
+        return self.fetch_page(cursor)
+
+    def iter_work_pages(self) -> Iterator[List[OpenAlexWork]]:
         """
-        Fetch all works matching the configured filters.
+        Fetch works matching the configured filters, one page at a time.
 
-        Returns:
-            List of OpenAlexWork objects
+        Yields:
+            List of OpenAlexWork objects parsed from each page
 
         Raises:
             requests.exceptions.RequestException: If API request fails
         """
-        all_works: List[OpenAlexWork] = []
+        total_works = 0
         cursor = "*"
         page = 0
-        start_time = datetime.now()
+        start_time = time.monotonic()
 
         logger.info("Starting metadata fetch from OpenAlex API")
         logger.info(f"Filters: {self.config.filter_string}")
         logger.info(f"Results per page: {self.config.per_page}")
 
-        while cursor:
-            page += 1
-
-            try:
-                # Fetch page
-                results, next_cursor = self.fetch_page(cursor)
-
-                # Parse results into Pydantic models
-                page_works = []
-                for i, result in enumerate(results):
-                    try:
-                        work = OpenAlexWork(**result)
-                        page_works.append(work)
-                    except ValidationError as e:
-                        logger.warning(f"Failed to parse work on page {page}, item {i}: {e}")
-                        logger.debug(f"Problematic data: {result.get('id', 'unknown')}")
-
-                all_works.extend(page_works)
-
-                # Calculate progress
-                elapsed = (datetime.now() - start_time).total_seconds()
-                rate = len(all_works) / elapsed if elapsed > 0 else 0
-
-                logger.info(
-                    f"📄 Page {page:4d}: {len(page_works):3d} works | "
-                    f"Total: {len(all_works):5d} | "
-                    f"Rate: {rate:.1f} works/sec | "
-                    f"Elapsed: {format_duration(elapsed)}"
-                )
+        # Cursors are strictly sequential, but the request for the next page can
+        # be in flight while the current one is parsed and consumed.
+        prefetcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="openalex-prefetch")
+        pending: Optional[Future] = prefetcher.submit(self.fetch_page, cursor)
+
+        try:
+            while pending is not None:
+                page += 1
+
+                try:
+                    # Fetch page
+                    results, next_cursor = pending.result()
+                    pending = None
+
+                    # Start fetching the next page; rate limiting happens in the prefetch
+                    # thread. Stop if no more results.
+                    if next_cursor and results:
+                        pending = prefetcher.submit(self._fetch_page_after_delay, next_cursor)
+
+                    # Parse results into Pydantic models
+                    if self.validation_pool is not None:
+                        future = self.validation_pool.submit(_parse_page, results, page)
+                        page_works = future.result()
+                    else:
+                        page_works = _parse_page(results, page)
+
+                    total_works += len(page_works)
+
+                    # Report progress; with lazy=True the callables (and the message
+                    # formatting) only run when INFO is enabled
+                    elapsed = time.monotonic() - start_time
+                    logger.opt(lazy=True).info(
+                        "📄 Page {page:4d}: {count:3d} works | "
+                        "Total: {total:5d} | "
+                        "Rate: {rate:.1f} works/sec | "
+                        "Elapsed: {elapsed}",
+                        page=lambda: page,
+                        count=lambda: len(page_works),
+                        total=lambda: total_works,
+                        rate=lambda: total_works / elapsed if elapsed > 0 else 0,
+                        elapsed=lambda: format_duration(elapsed),
+                    )
 
-                # Update cursor
-                cursor = next_cursor
+                    if page_works:
+                        yield page_works
 
-                # Rate limiting
-                if cursor:  # Don't delay after last page
-                    time.sleep(self.config.request_delay)
+                    if not results:
+                        logger.info("No more results available")
 
-                # Stop if no more results
-                if not results:
-                    logger.info("No more results available")
+                except requests.exceptions.RequestException as e:
+                    logger.error(f"Failed to fetch page {page}: {e}")
+                    logger.warning("Stopping pagination due to error")
                     break
+                except KeyboardInterrupt:
+                    logger.warning("Fetch interrupted by user")
+                    break
+        finally:
+            prefetcher.shutdown(wait=False, cancel_futures=True)
+
+        total_time = time.monotonic() - start_time
+        logger.success(f"✅ Fetched {total_works} works in {format_duration(total_time)}")
+        if total_time > 0:
+            logger.info(f"   Average: {total_works / total_time:.1f} works/sec")
+
+    def fetch_all_works(self) -> List[OpenAlexWork]:
+        """
+        Fetch all works matching the configured filters.
 
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Failed to fetch page {page}: {e}")
-                logger.warning("Stopping pagination due to error")
-                break
-            except KeyboardInterrupt:
-                logger.warning("Fetch interrupted by user")
-                break
+        Returns:
+            List of OpenAlexWork objects
 
-        total_time = (datetime.now() - start_time).total_seconds()
-        logger.success(f"✅ Fetched {len(all_works)} works in {format_duration(total_time)}")
-        logger.info(f"   Average: {len(all_works) / total_time:.1f} works/sec")
+        Raises:
+            requests.exceptions.RequestException: If API request fails
+        """
+        all_works: List[OpenAlexWork] = []
+        extend = all_works.extend
+        for page_works in self.iter_work_pages():
+            extend(page_works)
 
         return all_works
 
+    def _flatten_works(self, works: List[OpenAlexWork], include_full_json: bool) -> List[dict]:
+        """Flatten works into row dicts, skipping (and logging) any that fail."""
+        # Same output as FlatWork.model_dump(), minus its per-call argument handling
+        to_dict = FlatWork.__pydantic_serializer__.to_python
+
+        # Final length is known up front; failed works leave a None hole that is
+        # compacted out afterwards
+        flat_works: List[Optional[dict]] = [None] * len(works)
+        failed = False
+        for i, work in enumerate(works):
+            try:
+                flat_works[i] = to_dict(
+                    FlatWork.from_work(work, include_full_json=include_full_json)
+                )
+            except Exception as e:
+                failed = True
+                logger.warning(f"Failed to flatten work {work.openalex_id}: {e}")
+
+        if failed:
+            return [row for row in flat_works if row is not None]
+        return flat_works
+
     def works_to_dataframe(
         self, works: List[OpenAlexWork], include_full_json: bool = True
     ) -> pd.DataFrame:
@@ -149,19 +317,47 @@ class MetadataFetcher:
         """
         logger.info(f"Converting {len(works)} works to DataFrame...")
 
-        flat_works = []
-        for work in works:
-            try:
-                flat = FlatWork.from_work(work, include_full_json=include_full_json)
-                flat_works.append(flat.model_dump())
-            except Exception as e:
-                logger.warning(f"Failed to flatten work {work.openalex_id}: {e}")
+        flat_works = self._flatten_works(works, include_full_json)
 
         df = pd.DataFrame(flat_works)
         logger.success(f"✅ Created DataFrame with {len(df)} rows and {len(df.columns)} columns")
 
         return df
 
+    def works_to_record_batch(
+        self, works: List[OpenAlexWork], include_full_json: bool = True
+    ) -> pa.RecordBatch:
+        """
+        Convert list of works directly to an Arrow record batch.
+
+        Skips the pandas round-trip: rows go through Arrow's builders straight into
+        FLATWORK_SCHEMA, which already carries the storage dtypes applied by
+        optimize_dataframe.
+
+        Args:
+            works: List of OpenAlexWork objects
+            include_full_json: Include full JSON in the batch
+
+        Returns:
+            Record batch with flattened work data
+        """
+        flat_works = self._flatten_works(works, include_full_json)
+        return pa.RecordBatch.from_pylist(flat_works, schema=FLATWORK_SCHEMA)
+
+    def works_to_table(self, works: List[OpenAlexWork], include_full_json: bool = True) -> pa.Table:
+        """
+        Convert list of works directly to an Arrow table.
+
+        Args:
+            works: List of OpenAlexWork objects
+            include_full_json: Include full JSON in the table
+
+        Returns:
+            Table with flattened work data
+        """
+        batch = self.works_to_record_batch(works, include_full_json=include_full_json)
+        return pa.Table.from_batches([batch])
+
     def optimize_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Optimize DataFrame dtypes for efficient storage.
@@ -174,52 +370,30 @@ class MetadataFetcher:
         """
         logger.info("Optimizing DataFrame dtypes...")
 
-        # Convert numeric columns
-        numeric_cols = [
-            "publication_year",
-            "cited_by_count",
-            "num_locations",
-            "num_pdf_urls",
-            "num_oa_locations",
-            "num_authors",
-            "concept_1_score",
-            "concept_2_score",
-            "concept_3_score",
-        ]
-        for col in numeric_cols:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors="coerce")
-
-        # Convert boolean columns
-        bool_cols = [
-            "is_retracted",
-            "is_paratext",
-            "is_oa",
-            "any_repository_has_fulltext",
-            "has_any_pdf",
-        ]
-        for col in bool_cols:
-            if col in df.columns:
-                df[col] = df[col].astype(bool)
-
-        # Convert categorical columns (saves memory)
-        categorical_cols = [
-            "oa_status",
-            "type",
-            "language",
-            "best_oa_source_type",
-            "primary_source_type",
-            "topic_domain",
-            "topic_field",
-        ]
-        for col in categorical_cols:
-            if col in df.columns and df[col].notna().any():
-                df[col] = df[col].astype("category")
+        # One astype over every known column; nullable Int32/Float64/boolean keep
+        # missing values without a separate to_numeric coercion pass
+        dtype_map = {
+            **{col: "Int32" for col in INT32_COLUMNS},
+            **{col: "Float64" for col in FLOAT_COLUMNS},
+            **{col: "boolean" for col in BOOL_COLUMNS},
+            **{col: "category" for col in CATEGORICAL_COLUMNS},
+        }
+        df = df.astype({col: dtype for col, dtype in dtype_map.items() if col in df.columns})
 
         logger.success("✅ DataFrame optimization complete")
 
         return df
 
+    def _compression_level(self) -> Optional[int]:
+        """Get the configured compression level, or None if the codec takes no level."""
+        try:
+            supported = pa.Codec.supports_compression_level(self.config.parquet_compression)
+        except ValueError:
+            # e.g. "none" or an unknown codec name; let the writer report it
+            supported = False
+
+        return self.config.parquet_compression_level if supported else None
+
     def save_to_parquet(self, df: pd.DataFrame) -> None:
         """
         Save DataFrame to Parquet file.
@@ -232,9 +406,18 @@ class MetadataFetcher:
         # Optimize before saving
         df = self.optimize_dataframe(df)
 
-        # Save to parquet
-        df.to_parquet(
-            self.config.parquet_path, index=False, compression=self.config.parquet_compression
+        # Save to parquet. Dictionary encoding suits the many low-cardinality
+        # columns, and column statistics allow predicate pushdown on read.
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pq.write_table(
+            table,
+            self.config.parquet_path,
+            compression=self.config.parquet_compression,
+            compression_level=self._compression_level(),
+            use_dictionary=True,
+            row_group_size=self.config.parquet_row_group_size,
+            data_page_size=1 << 20,
+            write_statistics=True,
         )
 
         # Log file info
@@ -245,6 +428,73 @@ class MetadataFetcher:
         logger.info(f"   File size: {size_mb:.2f} MB")
         logger.info(f"   Columns: {len(df.columns)}")
 
+    def stream_to_parquet(self, include_full_json: bool = True) -> int:
+        """
+        Fetch all works and write them to the Parquet file page by page.
+
+        Pages are flattened straight into Arrow record batches and buffered only until a
+        full row group is available, so memory stays bounded by the row group
+        size rather than by the total number of works.
+
+        Args:
+            include_full_json: Include full JSON in the parquet file
+
+        Returns:
+            Number of rows written
+        """
+        path = self.config.parquet_path
+        row_group_size = self.config.parquet_row_group_size
+
+        writer: Optional[pq.ParquetWriter] = None
+        buffered: List[pa.RecordBatch] = []
+        buffered_rows = 0
+        total_rows = 0
+
+        def flush() -> None:
+            nonlocal buffered, buffered_rows
+            table = pa.Table.from_batches(buffered, schema=FLATWORK_SCHEMA)
+            writer.write_table(table, row_group_size=row_group_size)
+            buffered, buffered_rows = [], 0
+
+        try:
+            for page_works in self.iter_work_pages():
+                batch = self.works_to_record_batch(page_works, include_full_json=include_full_json)
+                if not batch.num_rows:
+                    continue
+
+                if writer is None:
+                    logger.info(f"Streaming works to {path}...")
+                    writer = pq.ParquetWriter(
+                        path,
+                        FLATWORK_SCHEMA,
+                        compression=self.config.parquet_compression,
+                        compression_level=self._compression_level(),
+                        use_dictionary=True,
+                        data_page_size=1 << 20,
+                        write_statistics=True,
+                    )
+
+                buffered.append(batch)
+                buffered_rows += batch.num_rows
+                total_rows += batch.num_rows
+
+                if buffered_rows >= row_group_size:
+                    flush()
+
+            if buffered:
+                flush()
+        finally:
+            if writer is not None:
+                writer.close()
+
+        if total_rows:
+            size_mb = path.stat().st_size / (1024 * 1024)
+            logger.success(f"✅ Saved {total_rows} rows to {path}")
+            logger.info(f"   File size: {size_mb:.2f} MB")
+            logger.info(f"   Columns: {len(FLATWORK_SCHEMA)}")
+
+        return total_rows
+
     def generate_summary_stats(self, df: pd.DataFrame) -> dict:
         """
         Generate summary statistics from DataFrame.
@@ -265,43 +515,49 @@ class MetadataFetcher:
             stats["oa_status_counts"] = df["oa_status"].value_counts().to_dict()
 
         # PDF availability
+        if "has_any_pdf" in df.columns:
+            pdf_counts = df["has_any_pdf"].value_counts()
+            works_with_pdf = int(pdf_counts.get(True, 0))
+            works_without_pdf = int(pdf_counts.get(False, 0))
+        else:
+            works_with_pdf = works_without_pdf = 0
+
         stats["pdf_availability"] = {
-            "works_with_pdf": int(df["has_any_pdf"].sum()) if "has_any_pdf" in df.columns else 0,
-            "works_without_pdf": int((~df["has_any_pdf"]).sum())
-            if "has_any_pdf" in df.columns
-            else 0,
+            "works_with_pdf": works_with_pdf,
+            "works_without_pdf": works_without_pdf,
             "works_with_best_oa_pdf": int(df["best_oa_pdf_url"].notna().sum()),
             "works_with_primary_pdf": int(df["primary_pdf_url"].notna().sum()),
         }
 
         # DOI availability
         if "doi" in df.columns:
+            with_doi = int(df["doi"].notna().sum())
             stats["doi_availability"] = {
-                "with_doi": int(df["doi"].notna().sum()),
-                "without_doi": int(df["doi"].isna().sum()),
+                "with_doi": with_doi,
+                "without_doi": len(df) - with_doi,
             }
 
-        # Publication years
+        # Publication years and citations, aggregated in a single pass
+        numeric_cols = [col for col in ("publication_year", "cited_by_count") if col in df.columns]
+        if numeric_cols:
+            agg = df[numeric_cols].agg(["min", "max", "mean", "median", "sum", "count"])
+
         if "publication_year" in df.columns:
+            years = agg["publication_year"]
+            has_years = years["count"] > 0
             stats["publication_years"] = {
-                "min": int(df["publication_year"].min())
-                if df["publication_year"].notna().any()
-                else None,
-                "max": int(df["publication_year"].max())
-                if df["publication_year"].notna().any()
-                else None,
-                "mean": float(df["publication_year"].mean())
-                if df["publication_year"].notna().any()
-                else None,
+                "min": int(years["min"]) if has_years else None,
+                "max": int(years["max"]) if has_years else None,
+                "mean": float(years["mean"]) if has_years else None,
             }
 
-        # Citations
         if "cited_by_count" in df.columns:
+            citations = agg["cited_by_count"]
             stats["citations"] = {
-                "total": int(df["cited_by_count"].sum()),
-                "mean": float(df["cited_by_count"].mean()),
-                "median": float(df["cited_by_count"].median()),
-                "max": int(df["cited_by_count"].max()),
+                "total": int(citations["sum"]),
+                "mean": float(citations["mean"]),
+                "median": float(citations["median"]),
+                "max": int(citations["max"]),
             }
 
         # Top sources
@@ -321,21 +577,24 @@ class MetadataFetcher:
         Args:
             df: DataFrame to analyze
         """
-        import json
-
         logger.info("Generating summary statistics...")
 
         stats = self.generate_summary_stats(df)
 
-        # Save as JSON
+        # Save as JSON (orjson handles numpy scalars from pandas reductions natively)
         stats_file = self.config.output_dir / "summary_stats.json"
-        with open(stats_file, "w") as f:
-            json.dump(stats, f, indent=2)
+        stats_file.write_bytes(
+            orjson.dumps(
+                stats,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+            )
+        )
 
         logger.success(f"✅ Summary statistics saved to {stats_file}")
 
         # Also save as text for easy reading
         txt_file = self.config.output_dir / "summary_stats.txt"
+        total = stats["total_works"] or 1
         with open(txt_file, "w") as f:
             f.write("=" * 80 + "\n")
             f.write("OpenAlex Metadata Summary\n")
@@ -349,25 +608,23 @@ class MetadataFetcher:
                 pdf = stats["pdf_availability"]
                 f.write("PDF Availability:\n")
                 f.write(
-                    f"  Works with PDF URLs:      {pdf['works_with_pdf']:6,} ({pdf['works_with_pdf'] / stats['total_works'] * 100:5.1f}%)\n"
+                    f"  Works with PDF URLs:      {pdf['works_with_pdf']:6,} ({pdf['works_with_pdf'] / total * 100:5.1f}%)\n"
                 )
                 f.write(
-                    f"  Works without PDF URLs:   {pdf['works_without_pdf']:6,} ({pdf['works_without_pdf'] / stats['total_works'] * 100:5.1f}%)\n"
+                    f"  Works without PDF URLs:   {pdf['works_without_pdf']:6,} ({pdf['works_without_pdf'] / total * 100:5.1f}%)\n"
                 )
                 f.write(
-                    f"  Works with best_oa PDF:   {pdf['works_with_best_oa_pdf']:6,} ({pdf['works_with_best_oa_pdf'] / stats['total_works'] * 100:5.1f}%)\n"
+                    f"  Works with best_oa PDF:   {pdf['works_with_best_oa_pdf']:6,} ({pdf['works_with_best_oa_pdf'] / total * 100:5.1f}%)\n"
                 )
                 f.write(
-                    f"  Works with primary PDF:   {pdf['works_with_primary_pdf']:6,} ({pdf['works_with_primary_pdf'] / stats['total_works'] * 100:5.1f}%)\n\n"
+                    f"  Works with primary PDF:   {pdf['works_with_primary_pdf']:6,} ({pdf['works_with_primary_pdf'] / total * 100:5.1f}%)\n\n"
                 )
 
             # OA Status
             if "oa_status_counts" in stats:
                 f.write("Open Access Status:\n")
                 for status, count in stats["oa_status_counts"].items():
-                    f.write(
-                        f"  {status:15s}: {count:6,} ({count / stats['total_works'] * 100:5.1f}%)\n"
-                    )
+                    f.write(f"  {status:15s}: {count:6,} ({count / total * 100:5.1f}%)\n")
                 f.write("\n")
 
             # Citations
@@ -403,20 +660,19 @@ class MetadataFetcher:
         self.config.create_directories()
         logger.info(f"Output directory: {self.config.output_dir.absolute()}")
 
-        # Fetch all works
-        works = self.fetch_all_works()
+        # Fetch all works, streaming them to parquet
+        try:
+            total_rows = self.stream_to_parquet(
+                include_full_json=self.config.include_full_json_in_parquet
+            )
+        finally:
+            self.close()
 
-        if not works:
+        if not total_rows:
             logger.warning("No works fetched!")
             return pd.DataFrame()
 
-        # Convert to DataFrame
-        df = self.works_to_dataframe(
-            works, include_full_json=self.config.include_full_json_in_parquet
-        )
-
-        # Save to parquet
-        self.save_to_parquet(df)
+        df = pd.read_parquet(self.config.parquet_path)
 
         # Generate and save summary stats
         self.save_summary_stats(df)
@@ -242,6 +242,12 @@ class OpenAlexWork(BaseModel):
         return names[0] if names else None
 
 
+# Bound once at import: validating a raw API dict through the core validator skips
+# OpenAlexWork.__init__'s kwargs unpacking on every record
+WORK_VALIDATOR = OpenAlexWork.__pydantic_validator__
+validate_work = WORK_VALIDATOR.validate_python
+
+
 class FlatWork(BaseModel):
     """Flattened work for DataFrame storage."""
 
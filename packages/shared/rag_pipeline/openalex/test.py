@@ -1,10 +1,11 @@
 import re
+import shutil
 from pathlib import Path
 from typing import Callable, Optional
 from urllib.parse import quote, urljoin
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 
 class PdfNotFoundError(Exception):
@@ -13,6 +14,27 @@ class PdfNotFoundError(Exception):
 
 DEFAULT_SCIHUB_URL = "https://sci-hub.ru/"
 
+HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (iPhone; CPU iPhone OS 11_3_1 like Mac OS X) "
+        "AppleWebKit/603.1.30 (KHTML, like Gecko) Version/10.0 "
+        "Mobile/14E304 Safari/602.1"
+    )
+}
+
+_DOI_PREFIX_RE = re.compile(r"^doi:\s*", re.IGNORECASE)
+_DOI_URL_RE = re.compile(r"doi\.org/(.+)", re.IGNORECASE)
+_FILENAME_UNSAFE_RE = re.compile(r"[^\w\-_.]")
+_NOT_FOUND_RE = re.compile(r"not found|try again|статья не найдена", re.IGNORECASE)
+
+# Shared across DOIs so repeated lookups reuse keep-alive connections instead of
+# paying a TCP + TLS handshake to the mirror on every call
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+
+# Status codes meaning the server does not implement HEAD; fall back to the GET check
+_HEAD_UNSUPPORTED = {405, 501}
+
 
 def normalize_doi(raw_doi: str) -> str:
     """
@@ -24,10 +46,10 @@ def normalize_doi(raw_doi: str) -> str:
     doi = raw_doi.strip()
 
     # Remove common prefixes such as "doi:"
-    doi = re.sub(r"^doi:\s*", "", doi, flags=re.IGNORECASE)
+    doi = _DOI_PREFIX_RE.sub("", doi)
 
     # Extract portion after doi.org/ (case-insensitive)
-    match = re.search(r"doi\.org/(.+)", doi, flags=re.IGNORECASE)
+    match = _DOI_URL_RE.search(doi)
     if match:
         doi = match.group(1)
 
@@ -46,6 +68,7 @@ def download_from_scihub(
     output_path: Optional[Path] = None,
     timeout: int = 20,
     log_hook: Optional[Callable[[str], None]] = None,
+    session: Optional[requests.Session] = None,
 ) -> Path:
     """
     Given a DOI, fetches and downloads the corresponding PDF from Sci-Hub.
@@ -57,6 +80,7 @@ def download_from_scihub(
         output_path: Optional explicit file path for the downloaded PDF.
         timeout: Request timeout in seconds.
         log_hook: Optional callable used for logging messages instead of ``print``.
+        session: Optional session to issue requests with; defaults to a shared module session.
 
     Returns:
         Path: Location of the downloaded PDF file.
@@ -72,13 +96,7 @@ def download_from_scihub(
         else:
             print(message)
 
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (iPhone; CPU iPhone OS 11_3_1 like Mac OS X) "
-            "AppleWebKit/603.1.30 (KHTML, like Gecko) Version/10.0 "
-            "Mobile/14E304 Safari/602.1"
-        )
-    }
+    session = session or _SESSION
 
     normalized_doi = normalize_doi(doi)
     if not normalized_doi:
@@ -88,11 +106,14 @@ def download_from_scihub(
     full_url = urljoin(scihub_url, doi_encoded)
     _log(f"[*] Fetching page: {full_url}")
 
-    response = requests.get(full_url, headers=headers, timeout=timeout)
+    response = session.get(full_url, timeout=timeout)
     if response.status_code != 200:
         raise Exception(f"Sci-Hub returned HTTP {response.status_code}")
 
-    soup = BeautifulSoup(response.content, "html.parser")
+    # Only the PDF viewer tags are needed, so skip building the rest of the tree
+    soup = BeautifulSoup(
+        response.content, "html.parser", parse_only=SoupStrainer(["iframe", "embed"])
+    )
 
     # Try both old (#pdf iframe) and new (embed src) formats
     pdf_src = None
@@ -106,7 +127,7 @@ def download_from_scihub(
 
     if not pdf_src:
         # Detect if PDF not found or CAPTCHA
-        if re.search(r"not found|try again|статья не найдена", soup.text, re.IGNORECASE):
+        if _NOT_FOUND_RE.search(response.text):
             raise PdfNotFoundError(f"PDF not available for DOI: {doi}")
         raise Exception("Captcha or unknown response from Sci-Hub page.")
 
@@ -118,25 +139,34 @@ def download_from_scihub(
 
     _log(f"[*] Found PDF: {pdf_src}")
 
-    # Download PDF
-    pdf_response = requests.get(pdf_src, headers=headers, stream=True, timeout=timeout)
-    if pdf_response.status_code != 200 or "pdf" not in pdf_response.headers.get("Content-Type", ""):
-        raise PdfNotFoundError(f"Could not download PDF from {pdf_src}")
-
     # Determine output location
     if output_path:
         path = Path(output_path)
-        path.parent.mkdir(parents=True, exist_ok=True)
     else:
         save_dir = Path(save_dir)
-        save_dir.mkdir(parents=True, exist_ok=True)
-        filename = re.sub(r"[^\w\-_.]", "_", normalized_doi) + ".pdf"
+        filename = _FILENAME_UNSAFE_RE.sub("_", normalized_doi) + ".pdf"
         path = save_dir / filename
 
-    # Save file
-    with open(path, "wb") as f:
-        for chunk in pdf_response.iter_content(1024 * 32):
-            f.write(chunk)
+    # Probe the Content-Type first so HTML (e.g. a CAPTCHA served from the PDF URL)
+    # is rejected without transferring any body
+    head_response = session.head(pdf_src, timeout=timeout, allow_redirects=True)
+    if head_response.status_code not in _HEAD_UNSUPPORTED:
+        content_type = head_response.headers.get("Content-Type", "")
+        if head_response.status_code != 200 or "pdf" not in content_type:
+            raise PdfNotFoundError(f"Could not download PDF from {pdf_src}")
+
+    # Download PDF; the with-block returns the connection to the pool promptly
+    with session.get(pdf_src, stream=True, timeout=timeout) as pdf_response:
+        content_type = pdf_response.headers.get("Content-Type", "")
+        if pdf_response.status_code != 200 or "pdf" not in content_type:
+            raise PdfNotFoundError(f"Could not download PDF from {pdf_src}")
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Save file with a single C-level copy loop and a 1 MiB buffer
+        pdf_response.raw.decode_content = True
+        with open(path, "wb") as f:
+            shutil.copyfileobj(pdf_response.raw, f, length=1024 * 1024)
 
     _log(f"[+] PDF saved as: {path}")
     return path
@@ -35,6 +35,7 @@ from rag_pipeline.pdf_parsing.data_models import (
     DocumentResult,
     ImageDimensions,
     LayoutElement,
+    LayoutElementBatch,
     PageResult,
     ParsedElement,
 )
@@ -56,6 +57,7 @@ __all__ = [
     "PageResult",
     "ParsedElement",
     "LayoutElement",
+    "LayoutElementBatch",
     "BoundingBox",
     "ImageDimensions",
     # Model
@@ -3,7 +3,7 @@ Pydantic configuration models for PDF parsing pipeline.
 """
 
 from pathlib import Path
-from typing import Literal
+from typing import Literal, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -21,6 +21,10 @@ class DolphinModelConfig(BaseModel):
     use_fp16: bool = Field(
         default=True, description="Use half precision (FP16) on CUDA for faster inference"
     )
+    dtype: Literal["auto", "fp32", "fp16", "bf16"] = Field(
+        default="auto",
+        description="Precision on CUDA ('auto' follows use_fp16); CPU always runs in FP32",
+    )
     max_batch_size: int = Field(
         default=32, ge=1, le=64, description="Maximum batch size for element recognition"
     )
@@ -41,6 +45,11 @@ class ProcessingConfig(BaseModel):
         le=2048,
         description="Target size for longest dimension when converting PDF to images",
     )
+    raster_workers: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Processes used to rasterize PDF pages (None picks from the page count)",
+    )
     save_figures: bool = Field(default=True, description="Save extracted figures to disk")
     save_visualizations: bool = Field(
         default=False, description="Save layout visualizations with bounding boxes"
@@ -49,6 +58,20 @@ class ProcessingConfig(BaseModel):
     chunk_overlap: int = Field(
         default=100, ge=0, description="Overlap between chunks for downstream processing"
     )
+    cache_inference: bool = Field(
+        default=False,
+        description="Cache model outputs on disk, keyed by prompt and image content",
+    )
+    page_batch_size: int = Field(
+        default=4,
+        ge=1,
+        le=64,
+        description="Number of pages parsed concurrently (1 parses pages sequentially)",
+    )
+    background_output: bool = Field(
+        default=False,
+        description="Write Markdown/JSON outputs on a background thread (call flush_outputs)",
+    )
 
 
 class OutputConfig(BaseModel):
@@ -60,6 +83,9 @@ class OutputConfig(BaseModel):
         default="recognition_json", description="Subdirectory for JSON output files"
     )
     markdown_subdir: str = Field(default="markdown", description="Subdirectory for Markdown files")
+    cache_subdir: str = Field(
+        default="inference_cache", description="Subdirectory for cached model outputs"
+    )
 
     @field_validator("output_dir")
     @classmethod
@@ -81,6 +107,10 @@ class OutputConfig(BaseModel):
         """Get the full path to Markdown directory."""
         return self.output_dir / self.markdown_subdir
 
+    def get_cache_dir(self) -> Path:
+        """Get the full path to the inference cache directory."""
+        return self.output_dir / self.cache_subdir
+
     def setup_directories(self) -> None:
         """Create all output subdirectories."""
         self.get_figures_dir().mkdir(parents=True, exist_ok=True)
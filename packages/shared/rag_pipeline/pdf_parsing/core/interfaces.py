@@ -75,6 +75,21 @@ class DocumentParser(ABC):
         """
         pass
 
+    def parse_documents(self, document_paths: List[Path]) -> List[DocumentResult]:
+        """
+        Parse multiple documents.
+
+        Default implementation parses them one after another.
+        Override to batch pages across documents.
+
+        Args:
+            document_paths: Paths to document files
+
+        Returns:
+            Document parsing results, in the order of document_paths
+        """
+        return [self.parse_document(path) for path in document_paths]
+
     @abstractmethod
     def parse_page(self, image: Image.Image, page_num: int) -> PageResult:
         """
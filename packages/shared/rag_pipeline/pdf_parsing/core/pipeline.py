@@ -2,15 +2,27 @@
 Main pipeline orchestrator for PDF parsing.
 """
 
+import logging
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar, Union
 
 from PIL import Image
+from tqdm import tqdm
 
 from rag_pipeline.pdf_parsing.config import PDFParsingConfig
 from rag_pipeline.pdf_parsing.core.interfaces import DocumentParser
-from rag_pipeline.pdf_parsing.model.dolphin import DolphinModel
-from rag_pipeline.pdf_parsing.data_models import DocumentResult, PageResult
+from rag_pipeline.pdf_parsing.model.dolphin import DolphinModel, get_shared_model
+from rag_pipeline.pdf_parsing.data_models import (
+    DocumentResult,
+    LayoutElement,
+    LayoutElementBatch,
+    PageResult,
+)
+from rag_pipeline.pdf_parsing.utils.inference_cache import InferenceCache
 from rag_pipeline.pdf_parsing.processors import (
     ElementRecognizer,
     ImageExtractor,
@@ -19,6 +31,61 @@ from rag_pipeline.pdf_parsing.processors import (
 )
 
 
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Marks the end of the producer's stream
+_DONE = object()
+
+
+def _read_ahead(items: Iterable[T], maxsize: int) -> Iterator[T]:
+    """
+    Produce ``items`` on a background thread, up to ``maxsize`` ahead of the consumer.
+
+    Lets page rendering (CPU) run while the previous window is being parsed (GPU).
+    Exceptions raised by the producer are re-raised in the consumer, and closing
+    the returned iterator stops the producer.
+    """
+    buffer: "queue.Queue[object]" = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+
+    def put(item: object) -> bool:
+        # Poll so an abandoned consumer can't leave the producer blocked forever
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if not put(item):
+                    return
+        except BaseException as e:  # re-raised on the consumer side
+            put(e)
+            return
+        put(_DONE)
+
+    producer = threading.Thread(target=produce, name="page-read-ahead", daemon=True)
+    producer.start()
+
+    try:
+        while True:
+            item = buffer.get()
+            if item is _DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item  # type: ignore[misc]
+    finally:
+        stop.set()
+        producer.join()
+
+
 class PDFParsingPipeline(DocumentParser):
     """
     Main pipeline orchestrator for PDF parsing.
@@ -33,18 +100,31 @@ class PDFParsingPipeline(DocumentParser):
 
         Args:
             config: Pipeline configuration
-            model: Optional pre-loaded Dolphin model (will create if not provided)
+            model: Optional pre-loaded Dolphin model (defaults to the shared model)
         """
         self.config = config
 
-        # Initialize or use provided model
-        self.model = model or DolphinModel(config.model)
+        # Use the provided model, or the process-wide one for this config
+        self.model = model or get_shared_model(config.model)
+
+        # Attach the on-disk inference cache unless the model already has one
+        if config.processing.cache_inference and self.model.cache is None:
+            self.model.cache = InferenceCache(
+                config.output.get_cache_dir(), namespace=str(config.model.model_path)
+            )
 
         # Initialize processors
         self.image_extractor = ImageExtractor(config.processing)
         self.layout_parser = LayoutParser(self.model)
         self.markdown_converter = MarkdownConverter(config.output)
 
+        # Output writes run off the parsing thread when enabled, so the next
+        # document's pages can go to the GPU while this one's files are written
+        self._output_pool: Optional[ThreadPoolExecutor] = None
+        self._pending_outputs: Dict[Future, Path] = {}
+        if config.processing.background_output:
+            self._output_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="write-output")
+
         # Element recognizer needs the figures directory
         self.element_recognizer = ElementRecognizer(
             model=self.model,
@@ -62,58 +142,161 @@ class PDFParsingPipeline(DocumentParser):
         Returns:
             Complete document parsing results
         """
-        print(f"\n{'=' * 60}")
-        print(f"Parsing document: {document_path.name}")
-        print(f"{'=' * 60}\n")
-
-        # Stage 1: Extract images from PDF
-        print("Stage 1: Extracting images from PDF...")
-        images = self.image_extractor.process(document_path)
-        print(f"  ✓ Extracted {len(images)} page(s)\n")
-
-        # Stage 2: Parse each page
-        print("Stage 2: Parsing pages...")
-        pages = []
-        for page_num, image in enumerate(images, start=1):
-            print(f"  Processing page {page_num}/{len(images)}...")
-            page_result = self.parse_page(image, page_num)
-            pages.append(page_result)
-            print(f"    ✓ Found {len(page_result.elements)} element(s)")
-
-        print(f"\n  ✓ Parsed all {len(pages)} page(s)\n")
-
-        # Stage 3: Create document result
-        doc_result = DocumentResult(source_file=document_path, total_pages=len(pages), pages=pages)
-
-        # Stage 4: Generate outputs
-        print("Stage 3: Generating outputs...")
-        self.markdown_converter.process(doc_result)
-        print(f"\n{'=' * 60}")
-        print("✓ Parsing complete!")
-        print(f"{'=' * 60}\n")
-
-        return doc_result
-
-    def parse_page(self, image: Image.Image, page_num: int) -> PageResult:
+        return self.parse_documents([document_path])[0]
+
+    def parse_documents(self, document_paths: List[Path]) -> List[DocumentResult]:
+        """
+        Parse several PDF documents, sharing model batches between them.
+
+        Pages of all documents flow through the same windows of
+        ``page_batch_size``, so a short document's last pages fill a batch
+        together with the next document's first pages instead of running in
+        a part-empty batch.
+
+        Args:
+            document_paths: Paths to PDF files
+
+        Returns:
+            Complete document parsing results, in the order of document_paths
+        """
+        for document_path in document_paths:
+            logger.info("Parsing document: %s", document_path.name)
+
+        # Stages 1-2: Render pages lazily and parse them window by window. The next
+        # window is rendered on a background thread while the current one is on the
+        # GPU, so at most two windows of page images are held in memory.
+        page_images = _read_ahead(
+            (
+                (doc_index, image)
+                for doc_index, document_path in enumerate(document_paths)
+                for image in self.image_extractor.iter_pages(document_path)
+            ),
+            maxsize=self.config.processing.page_batch_size,
+        )
+        document_pages = self._parse_document_pages(page_images, len(document_paths))
+
+        results = []
+        for document_path, pages in zip(document_paths, document_pages):
+            logger.info("Parsed %d page(s) of %s", len(pages), document_path.name)
+
+            # Stage 3: Create document result
+            doc_result = DocumentResult(
+                source_file=document_path, total_pages=len(pages), pages=pages
+            )
+
+            # Stage 4: Generate outputs
+            if self._output_pool is not None:
+                future = self._output_pool.submit(self.markdown_converter.process, doc_result)
+                self._pending_outputs[future] = document_path
+            else:
+                self.markdown_converter.process(doc_result)
+
+            results.append(doc_result)
+
+        return results
+
+    def _parse_document_pages(
+        self, pages: Iterable[Tuple[int, Image.Image]], num_documents: int
+    ) -> List[List[PageResult]]:
+        """
+        Parse pages in windows of ``page_batch_size``.
+
+        Layout detection for a window runs as one batched model call; element
+        recognition for the window's pages then runs on a thread pool (model
+        inference releases the GIL). Images are pulled from ``pages`` one window
+        at a time and released once their window is parsed.
+
+        Args:
+            pages: (document index, page image) pairs, each document's pages in order
+            num_documents: Number of documents the pages belong to
+
+        Returns:
+            Page parsing results of each document, in document order
+        """
+        batch_size = self.config.processing.page_batch_size
+        page_iter = iter(pages)
+        results: List[List[PageResult]] = [[] for _ in range(num_documents)]
+        next_page = [1] * num_documents
+
+        # Load up front so worker threads don't race to load the model lazily
+        if not self.model.is_loaded():
+            self.model.load()
+
+        with (
+            ThreadPoolExecutor(max_workers=batch_size, thread_name_prefix="parse-page") as pool,
+            tqdm(desc="parse", unit="page", leave=False) as progress,
+        ):
+            while True:
+                window = list(islice(page_iter, batch_size))
+                if not window:
+                    break
+
+                doc_indices = [doc_index for doc_index, _ in window]
+                batch = [image for _, image in window]
+
+                page_nums = []
+                for doc_index in doc_indices:
+                    page_nums.append(next_page[doc_index])
+                    next_page[doc_index] += 1
+
+                layouts = self.layout_parser.process_batch(batch)
+
+                # map preserves submission order, so results line up with page numbers
+                parsed = pool.map(self.parse_page, batch, page_nums, layouts)
+                for doc_index, page in zip(doc_indices, parsed):
+                    results[doc_index].append(page)
+                progress.update(len(batch))
+
+                # Drop this window's page images before rendering the next one
+                del window, batch, layouts
+
+        return results
+
+    def parse_page(
+        self,
+        image: Image.Image,
+        page_num: int,
+        layout: Optional[Union[List[LayoutElement], LayoutElementBatch]] = None,
+    ) -> PageResult:
         """
         Parse a single page.
 
         Args:
             image: Page image
             page_num: Page number (1-indexed)
+            layout: Layout elements already detected for this page (detected here if omitted)
 
         Returns:
             Page parsing results
         """
         # Stage 1: Detect layout elements
-        layout_elements = self.layout_parser.process(image)
+        layout_elements = layout if layout is not None else self.layout_parser.process(image)
 
         # Stage 2: Recognize content of each element
         parsed_elements = self.element_recognizer.process((image, layout_elements))
+        logger.debug("Page %d: found %d element(s)", page_num, len(parsed_elements))
 
         return PageResult(page_number=page_num, elements=parsed_elements)
 
+    def flush_outputs(self) -> Dict[Path, Exception]:
+        """
+        Wait for pending background output writes to finish.
+
+        Only relevant with ``background_output`` enabled; output files of a
+        document are not guaranteed to exist until this returns.
+
+        Returns:
+            Errors raised while writing outputs, keyed by source document path
+        """
+        pending, self._pending_outputs = self._pending_outputs, {}
+        wait(pending)
+        return {
+            path: future.exception()
+            for future, path in pending.items()
+            if future.exception() is not None
+        }
+
     def unload_model(self) -> None:
-        """Unload the Dolphin model from memory."""
+        """Unload the Dolphin model from memory (also invalidates the shared model)."""
         if self.model:
             self.model.unload()
@@ -2,9 +2,11 @@
 Pydantic data models for PDF parsing pipeline.
 """
 
+from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Optional
 
+import numpy as np
 from pydantic import BaseModel, Field
 
 
@@ -49,6 +51,52 @@ class LayoutElement(BaseModel):
     confidence: Optional[float] = Field(default=None, ge=0.0, le=1.0)
 
 
+@dataclass
+class LayoutElementBatch:
+    """
+    Structure-of-arrays view of a page's layout elements.
+
+    Keeps every bounding box in one contiguous array so coordinate transforms
+    run as vectorized NumPy operations instead of per-element Python code.
+    """
+
+    bboxes: np.ndarray  # (N, 4) int32: x1, y1, x2, y2
+    labels: np.ndarray  # (N,) object: element type per box
+    reading_order: np.ndarray  # (N,) int32
+
+    @classmethod
+    def from_elements(cls, elements: List[LayoutElement]) -> "LayoutElementBatch":
+        """Build a batch from a list of layout elements."""
+        count = len(elements)
+        bboxes = np.fromiter(
+            (c for e in elements for c in (e.bbox.x1, e.bbox.y1, e.bbox.x2, e.bbox.y2)),
+            dtype=np.int32,
+            count=4 * count,
+        ).reshape(count, 4)
+        labels = np.empty(count, dtype=object)
+        labels[:] = [e.label for e in elements]
+        reading_order = np.fromiter(
+            (e.reading_order for e in elements), dtype=np.int32, count=count
+        )
+        return cls(bboxes=bboxes, labels=labels, reading_order=reading_order)
+
+    def to_elements(self) -> List[LayoutElement]:
+        """Expand the batch back into a list of layout elements."""
+        return [
+            LayoutElement(
+                bbox=BoundingBox(x1=x1, y1=y1, x2=x2, y2=y2),
+                label=label,
+                reading_order=reading_order,
+            )
+            for (x1, y1, x2, y2), label, reading_order in zip(
+                self.bboxes.tolist(), self.labels.tolist(), self.reading_order.tolist()
+            )
+        ]
+
+    def __len__(self) -> int:
+        return len(self.reading_order)
+
+
 class ParsedElement(BaseModel):
     """Fully parsed element with content from stage 2 (element recognition)."""
 
@@ -5,7 +5,7 @@ Factory for creating processors based on configuration.
 from typing import Optional
 
 from rag_pipeline.pdf_parsing.config import PDFParsingConfig, ProcessingConfig
-from rag_pipeline.pdf_parsing.model.dolphin import DolphinModel
+from rag_pipeline.pdf_parsing.model.dolphin import DolphinModel, get_shared_model
 from rag_pipeline.pdf_parsing.processors import (
     ElementRecognizer,
     ImageExtractor,
@@ -86,13 +86,13 @@ class ProcessorFactory:
 
         Args:
             config: Pipeline configuration
-            model: Optional Dolphin model instance
+            model: Optional Dolphin model instance (defaults to the shared model)
 
         Returns:
             Dictionary of processor instances
         """
         if model is None:
-            model = DolphinModel(config.model)
+            model = get_shared_model(config.model)
 
         return {
             "image_extractor": cls.create_image_extractor(config.processing),
@@ -1,5 +1,5 @@
 """Model wrapper for Dolphin."""
 
-from rag_pipeline.pdf_parsing.model.dolphin import DolphinModel
+from rag_pipeline.pdf_parsing.model.dolphin import DolphinModel, get_shared_model
 
-__all__ = ["DolphinModel"]
+__all__ = ["DolphinModel", "get_shared_model"]
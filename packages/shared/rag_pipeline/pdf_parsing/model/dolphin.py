@@ -2,7 +2,8 @@
 Dolphin model wrapper for document understanding.
 """
 
-from typing import List, Union, cast
+import threading
+from typing import List, Optional, Union, cast
 
 import torch
 from PIL import Image
@@ -11,6 +12,37 @@ from transformers import AutoProcessor, VisionEncoderDecoderModel
 from rag_pipeline.pdf_parsing.config import DolphinModelConfig
 from rag_pipeline.pdf_parsing.core.exceptions import ModelLoadError
 from rag_pipeline.pdf_parsing.core.interfaces import ModelWrapper
+from rag_pipeline.pdf_parsing.utils.inference_cache import InferenceCache
+
+
+# Torch dtype for each DolphinModelConfig.dtype precision
+_TORCH_DTYPES = {"fp32": torch.float32, "fp16": torch.float16, "bf16": torch.bfloat16}
+
+# Process-wide model shared by every pipeline built from the same config, so
+# parsing several documents (or building several pipelines) loads weights once
+_MODEL_SINGLETON: Optional["DolphinModel"] = None
+_MODEL_SINGLETON_LOCK = threading.Lock()
+
+
+def get_shared_model(config: DolphinModelConfig) -> "DolphinModel":
+    """
+    Get the process-wide Dolphin model for ``config``, creating it if needed.
+
+    The model itself is still loaded lazily on first inference. A call with a
+    different config replaces the shared instance.
+
+    Args:
+        config: Model configuration
+
+    Returns:
+        Shared DolphinModel instance
+    """
+    global _MODEL_SINGLETON
+
+    with _MODEL_SINGLETON_LOCK:
+        if _MODEL_SINGLETON is None or _MODEL_SINGLETON.config != config:
+            _MODEL_SINGLETON = DolphinModel(config)
+        return _MODEL_SINGLETON
 
 
 class DolphinModel(ModelWrapper):
@@ -20,50 +52,54 @@ class DolphinModel(ModelWrapper):
     Handles model loading, device management, and inference.
     """
 
-    def __init__(self, config: DolphinModelConfig):
+    def __init__(self, config: DolphinModelConfig, cache: Optional[InferenceCache] = None):
         """
         Initialize Dolphin model wrapper.
 
         Args:
             config: Model configuration
+            cache: Optional inference cache; cached (prompt, image) pairs skip the model
         """
         self.config = config
+        self.cache = cache
         self.processor = None
         self.model = None
         self.tokenizer = None
         self.device = None
+        self.dtype = torch.float32
         self._loaded = False
+        self._load_lock = threading.Lock()
 
     def load(self) -> None:
-        """Load model into memory."""
-        if self._loaded:
-            print("Model already loaded")
-            return
-
+        """Load model into memory (idempotent and safe to call from several threads)."""
+        with self._load_lock:
+            if self._loaded:
+                return
+            self._load()
+
+    def _load(self) -> None:
+        """Load weights, processor and tokenizer; caller holds the load lock."""
         try:
             model_path = str(self.config.model_path)
 
-            # Load processor and model
-            print(f"Loading Dolphin model from {model_path}...")
-            self.processor = AutoProcessor.from_pretrained(model_path, use_fast=True)
-            self.model = VisionEncoderDecoderModel.from_pretrained(model_path)
-            self.model.eval()
-
             # Set device
             if self.config.device == "auto":
                 self.device = "cuda" if torch.cuda.is_available() else "cpu"
             else:
                 self.device = self.config.device
 
-            self.model.to(self.device)
+            # Set precision; weights are loaded directly in it rather than cast after
+            self.dtype = _TORCH_DTYPES[self._precision()]
 
-            # Set precision
-            if self.device == "cuda" and self.config.use_fp16:
-                self.model = self.model.half()
-                print("Using FP16 precision on CUDA")
-            else:
-                self.model = self.model.float()
-                print("Using FP32 precision")
+            # Load processor and model
+            print(f"Loading Dolphin model from {model_path}...")
+            self.processor = AutoProcessor.from_pretrained(model_path, use_fast=True)
+            self.model = VisionEncoderDecoderModel.from_pretrained(
+                model_path, torch_dtype=self.dtype
+            )
+            self.model.eval()
+            self.model.to(self.device)
+            print(f"Using {self._precision().upper()} precision")
 
             # Set tokenizer
             self.tokenizer = self.processor.tokenizer
@@ -74,8 +110,22 @@ class DolphinModel(ModelWrapper):
         except Exception as e:
             raise ModelLoadError(f"Failed to load Dolphin model: {str(e)}")
 
+    def _precision(self) -> str:
+        """Resolve the configured precision for the selected device."""
+        if self.device != "cuda":
+            return "fp32"
+        if self.config.dtype == "auto":
+            return "fp16" if self.config.use_fp16 else "fp32"
+        return self.config.dtype
+
     def unload(self) -> None:
-        """Unload model from memory."""
+        """Unload model from memory (and stop sharing it if it is the shared model)."""
+        global _MODEL_SINGLETON
+
+        with _MODEL_SINGLETON_LOCK:
+            if _MODEL_SINGLETON is self:
+                _MODEL_SINGLETON = None
+
         if not self._loaded:
             return
 
@@ -125,20 +175,38 @@ class DolphinModel(ModelWrapper):
         Returns:
             List of model output texts
         """
+        # Ensure prompts and images are lists
+        if not isinstance(images, list):
+            images = [images]
+        if not isinstance(prompts, list):
+            prompts = [prompts]
+
+        # If single prompt for multiple images, replicate it
+        if len(prompts) == 1 and len(images) > 1:
+            prompts = prompts * len(images)
+
+        if self.cache is None:
+            return self._generate(prompts, images)
+
+        # Only run the model on pairs that aren't cached yet
+        keys = [self.cache.key(p, img) for p, img in zip(prompts, images)]
+        results: List[Optional[str]] = [self.cache.get(key) for key in keys]
+        misses = [i for i, result in enumerate(results) if result is None]
+
+        if misses:
+            outputs = self._generate([prompts[i] for i in misses], [images[i] for i in misses])
+            for i, output in zip(misses, outputs):
+                results[i] = output
+                self.cache.put(keys[i], output)
+
+        return results  # type: ignore[return-value]
+
+    def _generate(self, prompts: List[str], images: List[Image.Image]) -> List[str]:
+        """Run the model on matched lists of prompts and images."""
         if not self._loaded:
             self.load()
 
         try:
-            # Ensure prompts and images are lists
-            if not isinstance(images, list):
-                images = [images]
-            if not isinstance(prompts, list):
-                prompts = [prompts]
-
-            # If single prompt for multiple images, replicate it
-            if len(prompts) == 1 and len(images) > 1:
-                prompts = prompts * len(images)
-
             # Ensure model is loaded
             if self.processor is None or self.tokenizer is None or self.model is None:
                 raise RuntimeError("Model not loaded. Call load() first.")
@@ -146,11 +214,8 @@ class DolphinModel(ModelWrapper):
             # Prepare images
             batch_inputs = self.processor(images, return_tensors="pt", padding=True)
 
-            # Set dtype based on device and config
-            if self.device == "cuda" and self.config.use_fp16:
-                batch_pixel_values = batch_inputs.pixel_values.half().to(self.device)
-            else:
-                batch_pixel_values = batch_inputs.pixel_values.float().to(self.device)
+            # Match the model's precision
+            batch_pixel_values = batch_inputs.pixel_values.to(self.device, dtype=self.dtype)
 
             # Prepare prompts
             formatted_prompts = [f"<s>{p} <Answer/>" for p in prompts]
@@ -162,7 +227,7 @@ class DolphinModel(ModelWrapper):
             batch_attention_mask = batch_prompt_inputs.attention_mask.to(self.device)
 
             # Generate text
-            with torch.no_grad():
+            with torch.inference_mode():
                 outputs = self.model.generate(
                     pixel_values=batch_pixel_values,
                     decoder_input_ids=batch_prompt_ids,
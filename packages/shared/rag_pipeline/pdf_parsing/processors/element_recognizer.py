@@ -3,22 +3,28 @@ Element recognition processor for extracting content from layout elements.
 """
 
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Union
 
 from PIL import Image
 
 from rag_pipeline.pdf_parsing.config import ProcessingConfig
 from rag_pipeline.pdf_parsing.core.exceptions import ElementRecognitionError
 from rag_pipeline.pdf_parsing.model.dolphin import DolphinModel
-from rag_pipeline.pdf_parsing.data_models import BoundingBox, LayoutElement, ParsedElement
+from rag_pipeline.pdf_parsing.data_models import (
+    BoundingBox,
+    LayoutElement,
+    LayoutElementBatch,
+    ParsedElement,
+)
 from rag_pipeline.pdf_parsing.processors.base import BaseProcessor
-from rag_pipeline.pdf_parsing.utils.coordinate_utils import process_coordinates
+from rag_pipeline.pdf_parsing.utils.coordinate_utils import process_coordinates_batch
 from rag_pipeline.pdf_parsing.utils.image_utils import crop_image_region, prepare_image, save_image
 
 
-class ElementRecognizer(
-    BaseProcessor[Tuple[Image.Image, List[LayoutElement]], List[ParsedElement]]
-):
+LayoutInput = Union[List[LayoutElement], LayoutElementBatch]
+
+
+class ElementRecognizer(BaseProcessor[Tuple[Image.Image, LayoutInput], List[ParsedElement]]):
     """
     Processor that recognizes content of layout elements.
 
@@ -50,12 +56,13 @@ class ElementRecognizer(
         self.save_dir = save_dir
         super().__init__(config)
 
-    def process(self, input_data: Tuple[Image.Image, List[LayoutElement]]) -> List[ParsedElement]:
+    def process(self, input_data: Tuple[Image.Image, LayoutInput]) -> List[ParsedElement]:
         """
         Recognize content of all layout elements.
 
         Args:
-            input_data: Tuple of (page_image, layout_elements)
+            input_data: Tuple of (page_image, layout_elements), where layout_elements
+                is a list of LayoutElement or a LayoutElementBatch
 
         Returns:
             List of parsed elements with extracted content
@@ -82,16 +89,22 @@ class ElementRecognizer(
             if "fig" in elements_by_type:
                 parsed_elements.extend(self._process_figures(elements_by_type["fig"]))
 
-            # Process other element types with model
+            # Element types that share a prompt (text, title and unknown labels) are
+            # recognized together, so each prompt costs as few model calls as possible
+            elements_by_prompt: Dict[str, List[dict]] = {}
             for element_type, elements in elements_by_type.items():
                 if element_type == "fig":
                     continue
 
                 prompt = self.PROMPTS.get(element_type, self.PROMPTS["text"])
+                elements_by_prompt.setdefault(prompt, []).extend(elements)
+
+            # Process other element types with model
+            for prompt, elements in elements_by_prompt.items():
                 batch_results = self._process_element_batch(elements, prompt)
                 parsed_elements.extend(batch_results)
 
-            # Sort by reading order
+            # Sort by reading order to undo the grouping
             parsed_elements.sort(key=lambda x: x.reading_order)
 
             return parsed_elements
@@ -100,40 +113,41 @@ class ElementRecognizer(
             raise ElementRecognitionError(f"Failed to recognize elements: {str(e)}")
 
     def _group_elements_by_type(
-        self, layout_elements: List[LayoutElement], padded_image, dims
+        self, layout_elements: LayoutInput, padded_image, dims
     ) -> Dict[str, List[dict]]:
         """Group layout elements by type and prepare for processing."""
-        elements_by_type = {}
-        previous_box = None
-
-        for element in layout_elements:
+        elements_by_type: Dict[str, List[dict]] = {}
+
+        # Transform all boxes at once from the structure-of-arrays view
+        if isinstance(layout_elements, LayoutElementBatch):
+            batch = layout_elements
+        else:
+            batch = LayoutElementBatch.from_elements(layout_elements)
+        padded_boxes, original_boxes = process_coordinates_batch(batch.bboxes, dims)
+
+        for label, reading_order, (x1, y1, x2, y2), (orig_x1, orig_y1, orig_x2, orig_y2) in zip(
+            batch.labels.tolist(),
+            batch.reading_order.tolist(),
+            padded_boxes.tolist(),
+            original_boxes.tolist(),
+        ):
             try:
-                # Get normalized coordinates from layout element
-                coords = [element.bbox.x1, element.bbox.y1, element.bbox.x2, element.bbox.y2]
-
-                # Process coordinates
-                x1, y1, x2, y2, orig_x1, orig_y1, orig_x2, orig_y2, previous_box = (
-                    process_coordinates(coords, padded_image, dims, previous_box)
-                )
-
                 # Crop element from padded image
                 pil_crop = crop_image_region(padded_image, x1, y1, x2, y2)
 
                 # Store element info
                 element_info = {
                     "crop": pil_crop,
-                    "label": element.label,
+                    "label": label,
                     "bbox": BoundingBox(x1=orig_x1, y1=orig_y1, x2=orig_x2, y2=orig_y2),
-                    "reading_order": element.reading_order,
+                    "reading_order": reading_order,
                 }
 
                 # Group by label
-                if element.label not in elements_by_type:
-                    elements_by_type[element.label] = []
-                elements_by_type[element.label].append(element_info)
+                elements_by_type.setdefault(label, []).append(element_info)
 
             except Exception as e:
-                print(f"Error processing element {element.reading_order}: {str(e)}")
+                print(f"Error processing element {reading_order}: {str(e)}")
                 continue
 
         return elements_by_type
@@ -203,7 +217,7 @@ class ElementRecognizer(
 
         return results
 
-    def validate_input(self, input_data: Tuple[Image.Image, List[LayoutElement]]) -> None:
+    def validate_input(self, input_data: Tuple[Image.Image, LayoutInput]) -> None:
         """Validate input data."""
         if input_data is None:
             raise ValueError("Input data cannot be None")
@@ -216,5 +230,7 @@ class ElementRecognizer(
         if not isinstance(image, Image.Image):
             raise TypeError(f"Expected PIL Image, got {type(image)}")
 
-        if not isinstance(elements, list):
-            raise TypeError(f"Expected list of LayoutElements, got {type(elements)}")
+        if not isinstance(elements, (list, LayoutElementBatch)):
+            raise TypeError(
+                f"Expected list of LayoutElements or LayoutElementBatch, got {type(elements)}"
+            )
@@ -3,14 +3,14 @@ Image extraction processor for converting PDFs to images.
 """
 
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
 
 from PIL import Image
 
 from rag_pipeline.pdf_parsing.config import ProcessingConfig
 from rag_pipeline.pdf_parsing.core.exceptions import ImageExtractionError
 from rag_pipeline.pdf_parsing.processors.base import BaseProcessor
-from rag_pipeline.pdf_parsing.utils.image_utils import convert_pdf_to_images
+from rag_pipeline.pdf_parsing.utils.image_utils import convert_pdf_to_images, iter_pdf_images
 
 
 class ImageExtractor(BaseProcessor[Path, List[Image.Image]]):
@@ -49,7 +49,11 @@ class ImageExtractor(BaseProcessor[Path, List[Image.Image]]):
             if pdf_path.suffix.lower() != ".pdf":
                 raise ValueError(f"Not a PDF file: {pdf_path}")
 
-            images = convert_pdf_to_images(pdf_path, target_size=self.config.target_image_size)
+            images = convert_pdf_to_images(
+                pdf_path,
+                target_size=self.config.target_image_size,
+                max_workers=self.config.raster_workers,
+            )
 
             if not images:
                 raise ImageExtractionError(f"No pages extracted from PDF: {pdf_path}")
@@ -59,6 +63,43 @@ class ImageExtractor(BaseProcessor[Path, List[Image.Image]]):
         except Exception as e:
             raise ImageExtractionError(f"Failed to extract images from PDF: {str(e)}")
 
+    def iter_pages(self, pdf_path: Path) -> Iterator[Image.Image]:
+        """
+        Lazily extract images from PDF, one page at a time.
+
+        Unlike :meth:`process`, pages are rendered on demand, so callers that
+        consume pages in windows never hold the whole document in memory.
+
+        Args:
+            pdf_path: Path to PDF file
+
+        Yields:
+            PIL Image of each page, in page order
+
+        Raises:
+            ImageExtractionError: If PDF cannot be converted
+        """
+        if not pdf_path.exists():
+            raise ImageExtractionError(f"PDF file not found: {pdf_path}")
+
+        if pdf_path.suffix.lower() != ".pdf":
+            raise ImageExtractionError(f"Not a PDF file: {pdf_path}")
+
+        page_count = 0
+        try:
+            for image in iter_pdf_images(
+                pdf_path,
+                target_size=self.config.target_image_size,
+                max_workers=self.config.raster_workers,
+            ):
+                page_count += 1
+                yield image
+        except Exception as e:
+            raise ImageExtractionError(f"Failed to extract images from PDF: {str(e)}")
+
+        if not page_count:
+            raise ImageExtractionError(f"No pages extracted from PDF: {pdf_path}")
+
     def validate_input(self, pdf_path: Path) -> None:  # type: ignore[override]
         """Validate PDF path."""
         if pdf_path is None:
@@ -4,13 +4,14 @@ Layout parsing processor for detecting document structure.
 
 from typing import List
 
+import numpy as np
 from PIL import Image
 
 from rag_pipeline.pdf_parsing.core.exceptions import LayoutParsingError
 from rag_pipeline.pdf_parsing.model.dolphin import DolphinModel
-from rag_pipeline.pdf_parsing.data_models import BoundingBox, LayoutElement
+from rag_pipeline.pdf_parsing.data_models import LayoutElement, LayoutElementBatch
 from rag_pipeline.pdf_parsing.processors.base import BaseProcessor
-from rag_pipeline.pdf_parsing.utils.coordinate_utils import parse_layout_string
+from rag_pipeline.pdf_parsing.utils.coordinate_utils import parse_layout_arrays
 
 
 class LayoutParser(BaseProcessor[Image.Image, List[LayoutElement]]):
@@ -46,32 +47,64 @@ class LayoutParser(BaseProcessor[Image.Image, List[LayoutElement]]):
             LayoutParsingError: If layout parsing fails
         """
         try:
-            # Ensure model is loaded
-            if not self.model.is_loaded():
-                self.model.load()
-
-            # Get layout output from Dolphin
+            # Get layout output from Dolphin (the model loads itself on first use)
             layout_output = self.model.infer(self.LAYOUT_PROMPT, image)
 
-            # Parse layout string to extract bounding boxes and labels
-            parsed_layout = parse_layout_string(layout_output)
+            return self._to_elements(layout_output)
+
+        except Exception as e:
+            raise LayoutParsingError(f"Failed to parse layout: {str(e)}")
 
-            # Convert to LayoutElement objects
-            elements = []
-            for reading_order, (coords, label) in enumerate(parsed_layout):
-                # Create bounding box (coords are in normalized 896x896 space)
-                bbox = BoundingBox(
-                    x1=int(coords[0]), y1=int(coords[1]), x2=int(coords[2]), y2=int(coords[3])
-                )
+    def process_batch(  # type: ignore[override]
+        self, images: List[Image.Image]
+    ) -> List[LayoutElementBatch]:
+        """
+        Parse layout of several document images with batched model calls.
 
-                element = LayoutElement(bbox=bbox, label=label, reading_order=reading_order)
-                elements.append(element)
+        Args:
+            images: PIL Images of document pages
 
-            return elements
+        Returns:
+            Detected layout elements for each image as a structure-of-arrays
+            batch, in input order
+
+        Raises:
+            LayoutParsingError: If layout parsing fails
+        """
+        try:
+            batch_size = getattr(self.model.config, "max_batch_size", 16)
+
+            results = []
+            for i in range(0, len(images), batch_size):
+                batch = images[i : i + batch_size]
+                layout_outputs = self.model.infer_batch([self.LAYOUT_PROMPT] * len(batch), batch)
+                results.extend(self._to_batch(output) for output in layout_outputs)
+
+            return results
 
         except Exception as e:
             raise LayoutParsingError(f"Failed to parse layout: {str(e)}")
 
+    @staticmethod
+    def _to_batch(layout_output: str) -> LayoutElementBatch:
+        """Convert a Dolphin layout string into a LayoutElementBatch."""
+        # Coords are in normalized 896x896 space, converted for all elements at once
+        bboxes, labels = parse_layout_arrays(layout_output)
+
+        label_array = np.empty(len(labels), dtype=object)
+        label_array[:] = labels
+
+        return LayoutElementBatch(
+            bboxes=bboxes,
+            labels=label_array,
+            reading_order=np.arange(len(labels), dtype=np.int32),
+        )
+
+    @staticmethod
+    def _to_elements(layout_output: str) -> List[LayoutElement]:
+        """Convert a Dolphin layout string into LayoutElement objects."""
+        return LayoutParser._to_batch(layout_output).to_elements()
+
     def validate_input(self, image: Image.Image) -> None:  # type: ignore[override]
         """Validate image input."""
         if image is None:
@@ -2,8 +2,11 @@
 Markdown conversion processor for generating output files.
 """
 
-import json
+import logging
 from pathlib import Path
+from typing import List
+
+import orjson
 
 from rag_pipeline.pdf_parsing.config import OutputConfig
 from rag_pipeline.pdf_parsing.core.exceptions import OutputGenerationError
@@ -11,6 +14,8 @@ from rag_pipeline.pdf_parsing.data_models import DocumentResult
 from rag_pipeline.pdf_parsing.processors.base import BaseProcessor
 from rag_pipeline.pdf_parsing.utils.markdown_utils import MarkdownConverter as MarkdownConverterUtil
 
+logger = logging.getLogger(__name__)
+
 
 class MarkdownConverter(BaseProcessor[DocumentResult, None]):
     """
@@ -44,62 +49,67 @@ class MarkdownConverter(BaseProcessor[DocumentResult, None]):
 
             # Generate JSON output
             if self.config.output_dir:
-                self._save_json(doc_result, base_name)
+                self._save_json(doc_result, self.config.get_json_dir() / f"{base_name}.json")
 
             # Generate Markdown output
-            self._save_markdown(doc_result, base_name)
+            self._save_markdown(doc_result, self.config.get_markdown_dir() / f"{base_name}.md")
 
         except Exception as e:
             raise OutputGenerationError(f"Failed to generate outputs: {str(e)}")
 
-    def _save_json(self, doc_result: DocumentResult, base_name: str) -> Path:
+    def _save_json(self, doc_result: DocumentResult, json_path: Path) -> Path:
         """Save JSON output."""
         try:
-            json_path = self.config.get_json_dir() / f"{base_name}.json"
-
             # Convert to dictionary
             output_data = doc_result.to_dict()
 
-            # Save JSON
-            with open(json_path, "w", encoding="utf-8") as f:
-                json.dump(output_data, f, indent=2, ensure_ascii=False)
-
-            print(f"JSON saved to: {json_path}")
+            # Save JSON (orjson emits UTF-8 directly, like ensure_ascii=False)
+            json_path.write_bytes(
+                orjson.dumps(
+                    output_data,
+                    option=orjson.OPT_INDENT_2
+                    | orjson.OPT_SERIALIZE_NUMPY
+                    | orjson.OPT_NON_STR_KEYS,
+                )
+            )
+
+            logger.info("JSON saved to: %s", json_path)
             return json_path
 
         except Exception as e:
             raise OutputGenerationError(f"Failed to save JSON: {str(e)}")
 
-    def _save_markdown(self, doc_result: DocumentResult, base_name: str) -> Path:
+    def _save_markdown(self, doc_result: DocumentResult, markdown_path: Path) -> Path:
         """Save Markdown output."""
         try:
-            markdown_path = self.config.get_markdown_dir() / f"{base_name}.md"
-
-            # Combine all elements across pages
-            all_elements = []
-            for page_idx, page in enumerate(doc_result.pages):
+            # Combine all elements across pages, with a separator between pages. The
+            # final length is known, so fill a preallocated list by index.
+            pages = doc_result.pages
+            total = sum(len(page.elements) for page in pages) + max(len(pages) - 1, 0)
+            all_elements: List[dict] = [None] * total  # type: ignore[list-item]
+            index = 0
+            for page_idx, page in enumerate(pages):
                 # Add page separator if not first page
                 if page_idx > 0:
-                    all_elements.append(
-                        {
-                            "label": "page_separator",
-                            "text": "\n\n---\n\n",
-                            "reading_order": len(all_elements),
-                        }
-                    )
+                    all_elements[index] = {
+                        "label": "page_separator",
+                        "text": "\n\n---\n\n",
+                        "reading_order": index,
+                    }
+                    index += 1
 
                 # Convert ParsedElement to dict for markdown converter
                 for elem in page.elements:
-                    all_elements.append(elem.to_dict())
+                    all_elements[index] = elem.to_dict()
+                    index += 1
 
             # Generate markdown
             markdown_content = self.converter.convert(all_elements)
 
-            # Save markdown
-            with open(markdown_path, "w", encoding="utf-8") as f:
-                f.write(markdown_content)
+            # Save markdown in one write, skipping the text-mode wrapper
+            markdown_path.write_bytes(markdown_content.encode("utf-8"))
 
-            print(f"Markdown saved to: {markdown_path}")
+            logger.info("Markdown saved to: %s", markdown_path)
             return markdown_path
 
         except Exception as e:
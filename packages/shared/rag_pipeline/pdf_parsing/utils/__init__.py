@@ -2,24 +2,32 @@
 
 from rag_pipeline.pdf_parsing.utils.coordinate_utils import (
     map_to_original_coordinates,
+    parse_layout_arrays,
     parse_layout_string,
     process_coordinates,
+    process_coordinates_batch,
 )
 from rag_pipeline.pdf_parsing.utils.image_utils import (
     convert_pdf_to_images,
     crop_image_region,
+    iter_pdf_images,
     prepare_image,
     save_image,
 )
+from rag_pipeline.pdf_parsing.utils.inference_cache import InferenceCache
 from rag_pipeline.pdf_parsing.utils.markdown_utils import MarkdownConverter
 
 __all__ = [
     "map_to_original_coordinates",
+    "parse_layout_arrays",
     "parse_layout_string",
     "process_coordinates",
+    "process_coordinates_batch",
     "convert_pdf_to_images",
     "crop_image_region",
+    "iter_pdf_images",
     "prepare_image",
     "save_image",
+    "InferenceCache",
     "MarkdownConverter",
 ]
@@ -4,7 +4,8 @@ Coordinate transformation utilities for image processing.
 Handles coordinate mapping between padded and original image spaces.
 """
 
-from typing import Tuple, Optional
+import re
+from typing import Iterator, List, Optional, Tuple
 
 import numpy as np
 
@@ -115,6 +116,97 @@ def process_coordinates(
         return 0, 0, 100, 100, orig_x1, orig_y1, orig_x2, orig_y2, [0, 0, 100, 100]
 
 
+def process_coordinates_batch(
+    coords: np.ndarray, dims: ImageDimensions
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized :func:`process_coordinates` over all boxes of a page.
+
+    Scaling, clamping and the mapping back to original coordinates run as array
+    operations; only the overlap adjustment, which depends on the previous
+    adjusted box, is applied in a loop. Boxes are processed in array order.
+
+    Args:
+        coords: (N, 4) normalized coordinates in 896x896 space
+        dims: Image dimensions object
+
+    Returns:
+        Tuple of (padded_boxes, original_boxes), each an (N, 4) int64 array
+    """
+    padded_w, padded_h = dims.padded_width, dims.padded_height
+    sizes = np.array([padded_w, padded_h, padded_w, padded_h], dtype=np.float64)
+
+    # Convert normalized coordinates (896x896) to absolute coordinates; rint rounds
+    # half to even like round()
+    boxes = np.rint(np.asarray(coords, dtype=np.float64) / 896.0 * sizes).astype(np.int64)
+    boxes[:, 2:] += 1
+
+    # Ensure coordinates are within image bounds
+    x1 = np.clip(boxes[:, 0], 0, padded_w - 1)
+    y1 = np.clip(boxes[:, 1], 0, padded_h - 1)
+    x2 = np.clip(boxes[:, 2], 0, padded_w)
+    y2 = np.clip(boxes[:, 3], 0, padded_h)
+
+    # Ensure width and height are at least 1 pixel
+    x2 = np.where(x2 <= x1, np.minimum(x1 + 1, padded_w), x2)
+    y2 = np.where(y2 <= y1, np.minimum(y1 + 1, padded_h), y2)
+
+    # Push each box below the previous one when they overlap
+    y1_list, y2_list = y1.tolist(), y2.tolist()
+    x1_list, x2_list = x1.tolist(), x2.tolist()
+    for i in range(1, len(y1_list)):
+        if (
+            x1_list[i] < x2_list[i - 1]
+            and x2_list[i] > x1_list[i - 1]
+            and y1_list[i] < y2_list[i - 1]
+            and y2_list[i] > y1_list[i - 1]
+        ):
+            y1_list[i] = min(y2_list[i - 1], padded_h - 1)
+            if y2_list[i] <= y1_list[i]:
+                y2_list[i] = min(y1_list[i] + 1, padded_h)
+    y1 = np.array(y1_list, dtype=np.int64)
+    y2 = np.array(y2_list, dtype=np.int64)
+
+    padded_boxes = np.stack([x1, y1, x2, y2], axis=1)
+
+    # Map back to original coordinates
+    top = (padded_h - dims.original_height) // 2
+    left = (padded_w - dims.original_width) // 2
+    orig_x1 = np.maximum(0, x1 - left)
+    orig_y1 = np.maximum(0, y1 - top)
+    orig_x2 = np.minimum(dims.original_width, x2 - left)
+    orig_y2 = np.minimum(dims.original_height, y2 - top)
+    orig_x2 = np.where(orig_x2 <= orig_x1, np.minimum(orig_x1 + 1, dims.original_width), orig_x2)
+    orig_y2 = np.where(orig_y2 <= orig_y1, np.minimum(orig_y1 + 1, dims.original_height), orig_y2)
+
+    original_boxes = np.stack([orig_x1, orig_y1, orig_x2, orig_y2], axis=1)
+
+    return padded_boxes, original_boxes
+
+
+_LAYOUT_SEGMENT_SEP = re.compile(r"\[PAIR_SEP\]|\[RELATION_SEP\]")
+_LAYOUT_COORDS = re.compile(r"\[(\d*\.?\d+),(\d*\.?\d+),(\d*\.?\d+),(\d*\.?\d+)\]")
+_LAYOUT_LABEL = re.compile(r"\]\[([^\]]+)\]")
+
+
+def _iter_layout_segments(bbox_str: str) -> Iterator[Tuple[Tuple[str, ...], str]]:
+    """Yield the raw (coords, label) of each well-formed segment of a layout string."""
+    for segment in _LAYOUT_SEGMENT_SEP.split(bbox_str):
+        segment = segment.strip()
+        if not segment:
+            continue
+
+        coord_match = _LAYOUT_COORDS.search(segment)
+        if coord_match is None:
+            continue
+
+        label_match = _LAYOUT_LABEL.search(segment)
+        if label_match is None:
+            continue
+
+        yield coord_match.groups(), label_match.group(1).strip()
+
+
 def parse_layout_string(bbox_str: str) -> list:
     """
     Parse Dolphin layout string to extract bbox and category information.
@@ -130,30 +222,28 @@ def parse_layout_string(bbox_str: str) -> list:
     Returns:
         List of (coords, label) tuples
     """
-    import re
+    return [
+        ([float(c) for c in coords], label) for coords, label in _iter_layout_segments(bbox_str)
+    ]
 
-    parsed_results = []
 
-    segments = bbox_str.split("[PAIR_SEP]")
-    new_segments = []
-    for seg in segments:
-        new_segments.extend(seg.split("[RELATION_SEP]"))
-    segments = new_segments
-
-    for segment in segments:
-        segment = segment.strip()
-        if not segment:
-            continue
+def parse_layout_arrays(bbox_str: str) -> Tuple[np.ndarray, List[str]]:
+    """
+    Parse Dolphin layout string straight into a coordinate array.
 
-        coord_pattern = r"\[(\d*\.?\d+),(\d*\.?\d+),(\d*\.?\d+),(\d*\.?\d+)\]"
-        label_pattern = r"\]\[([^\]]+)\]"
+    Same parsing as :func:`parse_layout_string`, but the coordinates of all
+    elements are converted in one NumPy call instead of per element.
 
-        coord_match = re.search(coord_pattern, segment)
-        label_matches = re.findall(label_pattern, segment)
+    Args:
+        bbox_str: Layout string from Dolphin model
 
-        if coord_match and label_matches:
-            coords = [float(coord_match.group(i)) for i in range(1, 5)]
-            label = label_matches[0].strip()
-            parsed_results.append((coords, label))
+    Returns:
+        Tuple of (coords, labels): coords is an (N, 4) int32 array of
+        x1, y1, x2, y2 (truncated like ``int()``), labels the N element types
+    """
+    segments = list(_iter_layout_segments(bbox_str))
+    if not segments:
+        return np.empty((0, 4), dtype=np.int32), []
 
-    return parsed_results
+    coords, labels = zip(*segments)
+    return np.array(coords, dtype=np.float64).astype(np.int32), list(labels)
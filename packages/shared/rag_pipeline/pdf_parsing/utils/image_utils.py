@@ -2,9 +2,11 @@
 Image processing utilities.
 """
 
-import io
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import Deque, Iterator, List, Optional, Tuple
 
 import cv2
 import numpy as np
@@ -14,13 +16,104 @@ from PIL import Image
 from rag_pipeline.pdf_parsing.data_models import ImageDimensions
 
 
-def convert_pdf_to_images(pdf_path: Path, target_size: int = 896) -> List[Image.Image]:
+# Pages per rasterization task: large enough to amortize opening the PDF in
+# each worker, small enough to balance work across processes
+PAGES_PER_TASK = 10
+
+
+def _get_max_workers(page_count: int) -> int:
+    """Pick a worker count for rasterizing ``page_count`` pages."""
+    return min(os.cpu_count() or 1, page_count // 4 + 1)
+
+
+def _render_page(doc: "pymupdf.Document", page_num: int, target_size: int) -> Image.Image:
+    """Render one page so its longest dimension equals ``target_size``."""
+    page = doc[page_num]
+
+    # Calculate scale to make longest dimension equal to target_size
+    rect = page.rect
+    scale = target_size / max(rect.width, rect.height)
+
+    # Render page as image
+    mat = pymupdf.Matrix(scale, scale)
+    pix = page.get_pixmap(matrix=mat)
+
+    # Wrap the raw RGB samples directly instead of round-tripping through PNG
+    return Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+
+
+def _render_page_range(pdf_path: str, start: int, stop: int, target_size: int) -> List[Image.Image]:
+    """
+    Render pages ``[start, stop)`` of a PDF.
+
+    Opens its own document handle, since PyMuPDF documents cannot be shared
+    across processes. Module-level so it can run in a worker process.
+    """
+    with pymupdf.open(pdf_path) as doc:
+        return [_render_page(doc, page_num, target_size) for page_num in range(start, stop)]
+
+
+def iter_pdf_images(
+    pdf_path: Path, target_size: int = 896, max_workers: Optional[int] = None
+) -> Iterator[Image.Image]:
+    """
+    Lazily render PDF pages to images, in page order.
+
+    Rasterization is CPU-bound, so multi-page documents are rendered in blocks of
+    PAGES_PER_TASK pages on a process pool. Only one block per worker is in
+    flight at a time, so memory stays bounded however slowly pages are consumed.
+
+    Args:
+        pdf_path: Path to PDF file
+        target_size: Target size for the longest dimension
+        max_workers: Number of rendering processes (None picks one from the page
+            count, 1 renders in-process)
+
+    Yields:
+        One PIL Image per page
+    """
+    with pymupdf.open(str(pdf_path)) as doc:
+        page_count = len(doc)
+
+        workers = _get_max_workers(page_count) if max_workers is None else max_workers
+        if workers <= 1 or page_count <= PAGES_PER_TASK:
+            for page_num in range(page_count):
+                yield _render_page(doc, page_num, target_size)
+            return
+
+    block_starts = iter(range(0, page_count, PAGES_PER_TASK))
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: Deque[Future] = deque()
+
+        def submit_next() -> None:
+            start = next(block_starts, None)
+            if start is not None:
+                stop = min(start + PAGES_PER_TASK, page_count)
+                pending.append(
+                    pool.submit(_render_page_range, str(pdf_path), start, stop, target_size)
+                )
+
+        for _ in range(workers):
+            submit_next()
+
+        # Blocks complete out of order but are consumed in submission order
+        while pending:
+            images = pending.popleft().result()
+            submit_next()
+            yield from images
+
+
+def convert_pdf_to_images(
+    pdf_path: Path, target_size: int = 896, max_workers: Optional[int] = None
+) -> List[Image.Image]:
     """
     Convert PDF pages to images.
 
     Args:
         pdf_path: Path to PDF file
         target_size: Target size for the longest dimension
+        max_workers: Number of rendering processes (see iter_pdf_images)
 
     Returns:
         List of PIL Images, one per page
@@ -28,27 +121,8 @@ def convert_pdf_to_images(pdf_path: Path, target_size: int = 896) -> List[Image.
     Raises:
         Exception: If PDF cannot be opened or converted
     """
-    images = []
     try:
-        doc = pymupdf.open(str(pdf_path))
-
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-
-            # Calculate scale to make longest dimension equal to target_size
-            rect = page.rect
-            scale = target_size / max(rect.width, rect.height)
-
-            # Render page as image
-            mat = pymupdf.Matrix(scale, scale)
-            pix = page.get_pixmap(matrix=mat)
-
-            # Convert to PIL Image
-            img_data = pix.tobytes("png")
-            pil_image = Image.open(io.BytesIO(img_data))
-            images.append(pil_image)
-
-        doc.close()
+        images = list(iter_pdf_images(pdf_path, target_size, max_workers))
         print(f"Successfully converted {len(images)} pages from PDF")
         return images
 
@@ -0,0 +1,84 @@
+"""
+On-disk cache for model inference results.
+"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from PIL import Image
+
+
+class InferenceCache:
+    """
+    Caches model outputs keyed by prompt and image content.
+
+    Corpora often repeat pages (cover pages, boilerplate headers, reference
+    lists) and development re-runs re-parse the same PDFs, so identical
+    (prompt, image) pairs skip inference entirely. Each entry is a small text
+    file named after the key, written atomically so concurrent writers are safe.
+    """
+
+    def __init__(self, cache_dir: Path, namespace: str = ""):
+        """
+        Initialize inference cache.
+
+        Args:
+            cache_dir: Directory to store cached outputs in
+            namespace: Extra key material (e.g. the model path) so outputs of
+                different models never collide
+        """
+        self.cache_dir = cache_dir
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._namespace = namespace.encode("utf-8")
+
+    def key(self, prompt: str, image: Image.Image) -> str:
+        """
+        Compute the cache key for a prompt/image pair.
+
+        Args:
+            prompt: Text prompt for the model
+            image: Input image
+
+        Returns:
+            Hex digest identifying the pair
+        """
+        digest = hashlib.blake2b(self._namespace, digest_size=16)
+        digest.update(prompt.encode("utf-8"))
+        digest.update(f"{image.mode}:{image.width}x{image.height}".encode("ascii"))
+        digest.update(image.tobytes())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached output.
+
+        Args:
+            key: Cache key from :meth:`key`
+
+        Returns:
+            Cached model output, or None on a miss
+        """
+        try:
+            return (self.cache_dir / f"{key}.txt").read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: str, output: str) -> None:
+        """
+        Store a model output.
+
+        Args:
+            key: Cache key from :meth:`key`
+            output: Model output text
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(output)
+            os.replace(tmp_path, self.cache_dir / f"{key}.txt")
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
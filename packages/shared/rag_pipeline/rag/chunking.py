@@ -2,12 +2,59 @@
 Text chunking strategies for document processing
 """
 
-from typing import List, Dict, Optional, Any
+from typing import Callable, List, Dict, Optional, Any, Union
 import re
 import logging
 
+try:
+    # Optional Aho-Corasick automaton for multi-pattern citation matching
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    # Optional JIT for the per-chunk word counter
+    import numba
+except ImportError:
+    numba = None
+
 logger = logging.getLogger(__name__)
 
+# Sentence boundary: whitespace following terminal punctuation
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+")
+
+# Well-delimited citation keys ("[12]", "Smith2020"). Neither form can start inside
+# another match, so findall yields every occurrence of such a key in a text.
+_CITATION_TOKEN = re.compile(r"\[\d+\]|[A-Z][a-z]+\d{4}")
+
+
+if numba is not None:
+
+    @numba.njit(cache=True)
+    def _count_ascii_words(buf: bytes) -> int:
+        # ASCII characters for which str.isspace() is true: \t \n \v \f \r, \x1c-\x1f, space
+        count = 0
+        in_word = False
+        for byte in buf:
+            is_space = byte == 32 or 9 <= byte <= 13 or 28 <= byte <= 31
+            if not is_space and not in_word:
+                count += 1
+            in_word = not is_space
+        return count
+
+
+def _count_words(text: str) -> int:
+    """
+    Count whitespace-separated words, as ``len(text.split())`` does
+
+    With numba installed, ASCII text is counted by a compiled byte scan that
+    doesn't allocate a string per word. Without it, ``str.split`` is still the
+    fastest pure-Python counter (regex ``finditer``/``findall`` are slower).
+    """
+    if numba is not None and text.isascii():
+        return _count_ascii_words(text.encode("ascii"))
+    return len(text.split())
+
 
 class DocumentChunker:
     """
@@ -52,7 +99,9 @@ class DocumentChunker:
             # Split by paragraphs first
             paragraphs = text.split("\n\n")
 
-            current_chunk = ""
+            # Paragraphs of the chunk being built; joined only when the chunk is
+            # emitted, so growing a chunk doesn't copy the text built so far
+            current_parts: List[str] = []
             current_size = 0
             chunk_index = 0
 
@@ -66,12 +115,13 @@ class DocumentChunker:
                 # If paragraph alone exceeds chunk size, split it further
                 if para_size > self.chunk_size * 1.5:
                     # Save current chunk if exists
-                    if current_chunk:
+                    if current_parts:
+                        current_chunk = "\n\n".join(current_parts)
                         chunks.append(
                             self._create_chunk(current_chunk.strip(), chunk_index, metadata)
                         )
                         chunk_index += 1
-                        current_chunk = ""
+                        current_parts = []
                         current_size = 0
 
                     # Split long paragraph
@@ -82,7 +132,8 @@ class DocumentChunker:
 
                 # If adding paragraph exceeds chunk size, save current chunk
                 elif current_size + para_size > self.chunk_size:
-                    if current_chunk:
+                    if current_parts:
+                        current_chunk = "\n\n".join(current_parts)
                         chunks.append(
                             self._create_chunk(current_chunk.strip(), chunk_index, metadata)
                         )
@@ -90,21 +141,19 @@ class DocumentChunker:
 
                     # Start new chunk with overlap
                     if self.chunk_overlap > 0:
-                        overlap_text = self._get_overlap_text(current_chunk, self.chunk_overlap)
-                        current_chunk = overlap_text + "\n\n" + paragraph
+                        overlap_text = self._get_overlap_text(current_parts, self.chunk_overlap)
+                        current_parts = [overlap_text, paragraph]
                         current_size = len(overlap_text) + para_size
                     else:
-                        current_chunk = paragraph
+                        current_parts = [paragraph]
                         current_size = para_size
                 else:
                     # Add paragraph to current chunk
-                    if current_chunk:
-                        current_chunk += "\n\n" + paragraph
-                    else:
-                        current_chunk = paragraph
+                    current_parts.append(paragraph)
                     current_size += para_size
 
             # Add final chunk
+            current_chunk = "\n\n".join(current_parts)
             if current_chunk and len(current_chunk) >= self.min_chunk_size:
                 chunks.append(self._create_chunk(current_chunk.strip(), chunk_index, metadata))
 
@@ -165,21 +214,27 @@ class DocumentChunker:
             splits = self._recursive_split(text, self.separators)
 
             chunk_index = 0
-            current_chunk = ""
+            # Splits of the chunk being built and their total length
+            current_parts: List[str] = []
+            current_size = 0
 
             for split in splits:
-                if len(current_chunk) + len(split) > self.chunk_size:
-                    if current_chunk:
+                if current_size + len(split) > self.chunk_size:
+                    if current_size:
+                        current_chunk = "".join(current_parts)
                         chunks.append(
                             self._create_chunk(current_chunk.strip(), chunk_index, metadata)
                         )
                         chunk_index += 1
 
-                    current_chunk = split
+                    current_parts = [split]
+                    current_size = len(split)
                 else:
-                    current_chunk += split
+                    current_parts.append(split)
+                    current_size += len(split)
 
             # Add final chunk
+            current_chunk = "".join(current_parts)
             if current_chunk and len(current_chunk) >= self.min_chunk_size:
                 chunks.append(self._create_chunk(current_chunk.strip(), chunk_index, metadata))
 
@@ -192,32 +247,54 @@ class DocumentChunker:
 
     def _recursive_split(self, text: str, separators: List[str]) -> List[str]:
         """Recursively split text using separator hierarchy"""
-        if not separators:
-            return [text]
-
-        separator = separators[0]
-        remaining_separators = separators[1:]
-
-        splits = text.split(separator)
+        final_splits: List[str] = []
+        self._recursive_split_into(text, separators, 0, final_splits)
+        return final_splits
 
-        if len(splits) == 1:
-            return self._recursive_split(text, remaining_separators)
+    def _recursive_split_into(
+        self, text: str, separators: List[str], level: int, out: List[str]
+    ) -> None:
+        """
+        Append the splits of ``text`` to ``out``, starting at ``separators[level]``
 
-        final_splits = []
-        for split in splits:
-            if len(split) > self.chunk_size:
-                final_splits.extend(self._recursive_split(split, remaining_separators))
+        Pieces are located with ``str.find`` rather than materializing a
+        ``str.split`` list per level, and separators absent from the text are
+        skipped in place instead of through a recursive call each.
+        """
+        num_separators = len(separators)
+        while level < num_separators and separators[level] not in text:
+            level += 1
+
+        if level == num_separators:
+            out.append(text)
+            return
+
+        separator = separators[level]
+        if not separator:
+            raise ValueError("empty separator")
+
+        chunk_size = self.chunk_size
+        separator_len = len(separator)
+        start = 0
+        while True:
+            end = text.find(separator, start)
+            piece = text[start:] if end == -1 else text[start:end]
+
+            if len(piece) > chunk_size:
+                self._recursive_split_into(piece, separators, level + 1, out)
             else:
-                final_splits.append(split + separator)
+                out.append(piece + separator)
 
-        return final_splits
+            if end == -1:
+                return
+            start = end + separator_len
 
     def _split_long_text(self, text: str) -> List[str]:
         """Split text that exceeds chunk size"""
         chunks = []
 
         # Try to split by sentences
-        sentences = re.split(r"(?<=[.!?])\s+", text)
+        sentences = _SENTENCE_SPLIT.split(text)
 
         current_chunk = ""
         for sentence in sentences:
@@ -233,8 +310,21 @@ class DocumentChunker:
 
         return chunks
 
-    def _get_overlap_text(self, text: str, overlap_size: int) -> str:
-        """Get last N characters for overlap"""
+    def _get_overlap_text(self, text: Union[str, List[str]], overlap_size: int) -> str:
+        """Get last N characters for overlap (of a string or of paragraphs joined by blank lines)"""
+        if isinstance(text, list):
+            # Only the trailing paragraphs that cover the overlap need joining. Stop
+            # once strictly longer than the overlap, so a partial tail never takes
+            # the whole-text shortcut below.
+            tail: List[str] = []
+            tail_size = -2
+            for part in reversed(text):
+                tail.append(part)
+                tail_size += len(part) + 2
+                if tail_size > overlap_size:
+                    break
+            text = "\n\n".join(reversed(tail))
+
         if len(text) <= overlap_size:
             return text
 
@@ -255,7 +345,7 @@ class DocumentChunker:
             "text": text,
             "chunk_index": index,
             "length": len(text),
-            "word_count": len(text.split()),
+            "word_count": _count_words(text),
         }
 
         if metadata:
@@ -282,18 +372,47 @@ class DocumentChunker:
             chunks = self.semantic_chunking(text, metadata)
 
             # Associate citations with chunks
+            find_citations = self._citation_matcher(citations)
             for chunk in chunks:
-                chunk_citations = []
-                chunk_text = chunk["text"]
-
-                for citation in citations:
-                    if citation in chunk_text:
-                        chunk_citations.append(citation)
-
-                chunk["citations"] = chunk_citations
+                chunk["citations"] = find_citations(chunk["text"])
 
             return chunks
 
         except Exception as e:
             logger.error(f"Error chunking with citations: {e}")
             raise
+
+    @staticmethod
+    def _citation_matcher(citations: List[str]) -> Callable[[str], List[str]]:
+        """
+        Build a function returning the citations contained in a text
+
+        Citations are reported in the order (and multiplicity) of ``citations``,
+        exactly as a per-citation substring test would. When every citation is a
+        well-delimited key, the text is tokenized once and each citation is a set
+        lookup. Otherwise, with pyahocorasick installed, all citations are found
+        in one linear pass over the text instead of one substring scan per citation.
+        """
+        if citations and all(_CITATION_TOKEN.fullmatch(citation) for citation in citations):
+
+            def find_tokens(text: str) -> List[str]:
+                tokens = set(_CITATION_TOKEN.findall(text))
+                return [citation for citation in citations if citation in tokens]
+
+            return find_tokens
+
+        if ahocorasick is None or not any(citations):
+            return lambda text: [citation for citation in citations if citation in text]
+
+        automaton = ahocorasick.Automaton()
+        for citation in set(citations):
+            if citation:
+                automaton.add_word(citation, citation)
+        automaton.make_automaton()
+
+        def find(text: str) -> List[str]:
+            found = {citation for _, citation in automaton.iter(text)}
+            # An empty citation is a substring of every text
+            return [citation for citation in citations if not citation or citation in found]
+
+        return find
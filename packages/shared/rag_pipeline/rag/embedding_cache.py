@@ -0,0 +1,145 @@
+"""
+Persistent on-disk cache for embedding vectors
+"""
+
+import hashlib
+import sqlite3
+import string
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# Stay well below SQLite's bound-parameter limit in IN (...) lookups
+_MAX_QUERY_PARAMS = 500
+
+
+def normalize_text(text: str) -> str:
+    """
+    Canonical form of a text for near-duplicate cache lookups
+
+    Collapses runs of whitespace and strips trailing punctuation, so texts that
+    differ only in formatting share one cache entry.
+
+    Args:
+        text: Input text
+
+    Returns:
+        Normalized text
+    """
+    return " ".join(text.split()).rstrip(string.punctuation + " ")
+
+
+class EmbeddingCache:
+    """
+    SQLite-backed store of embedding vectors keyed by (model, dimensions, text)
+
+    Duplicate chunks and re-runs over the same corpus are served from disk
+    instead of the API. Recently used vectors are also kept in a small
+    in-process LRU, so hot entries skip the database entirely.
+    """
+
+    def __init__(self, cache_dir: Path, memory_size: int = 4096):
+        """
+        Open (or create) the cache
+
+        Args:
+            cache_dir: Directory holding the cache database
+            memory_size: Number of vectors kept in the in-process LRU
+        """
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self.path = cache_dir / "embeddings.sqlite"
+        self.memory_size = memory_size
+
+        # One connection shared across threads, serialized by the lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS cache (key BLOB PRIMARY KEY, vec BLOB)")
+        self._conn.commit()
+        self._memory: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+
+    @staticmethod
+    def key(model: str, dimensions: Optional[int], text: str, normalize: bool = False) -> bytes:
+        """
+        Compute the cache key for a text embedded with a given model
+
+        Args:
+            model: Embedding model name
+            dimensions: Requested output dimensions (None for the model default)
+            text: Input text
+            normalize: Key on :func:`normalize_text` of the text, so near-duplicates
+                share an entry (kept apart from exact keys)
+
+        Returns:
+            SHA-256 digest identifying the embedding
+        """
+        if normalize:
+            text = f"normalized:{normalize_text(text)}"
+        return hashlib.sha256(f"{model}:{dimensions}:{text}".encode("utf-8")).digest()
+
+    def get_many(self, keys: Iterable[bytes]) -> Dict[bytes, np.ndarray]:
+        """
+        Look up cached vectors
+
+        Args:
+            keys: Cache keys from :meth:`key`
+
+        Returns:
+            Mapping of the keys that were found to their float32 vectors
+        """
+        found: Dict[bytes, np.ndarray] = {}
+        with self._lock:
+            missing = []
+            for key in dict.fromkeys(keys):
+                vec = self._memory.get(key)
+                if vec is None:
+                    missing.append(key)
+                else:
+                    self._memory.move_to_end(key)
+                    found[key] = vec
+
+            for i in range(0, len(missing), _MAX_QUERY_PARAMS):
+                chunk = missing[i : i + _MAX_QUERY_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, vec FROM cache WHERE key IN ({placeholders})", chunk
+                )
+                for key, blob in rows:
+                    vec = np.frombuffer(blob, dtype=np.float32)
+                    found[key] = vec
+                    self._remember(key, vec)
+
+        return found
+
+    def put_many(self, items: Iterable[Tuple[bytes, List[float]]]) -> None:
+        """
+        Store vectors in the cache
+
+        Args:
+            items: (key, embedding) pairs
+        """
+        rows = []
+        with self._lock:
+            for key, embedding in items:
+                # Copy, so a cached row never pins the whole matrix it came from
+                vec = np.array(embedding, dtype=np.float32)
+                rows.append((key, vec.tobytes()))
+                self._remember(key, vec)
+
+            self._conn.executemany("INSERT OR IGNORE INTO cache (key, vec) VALUES (?, ?)", rows)
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
+
+    def _remember(self, key: bytes, vec: np.ndarray) -> None:
+        """Add a vector to the in-process LRU (caller holds the lock)"""
+        self._memory[key] = vec
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
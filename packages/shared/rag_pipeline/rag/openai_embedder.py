@@ -2,27 +2,212 @@
 OpenAI embeddings generation module
 """
 
-from openai import OpenAI
-from typing import List, Dict, Optional, Any
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import httpx
+from openai import AsyncOpenAI, OpenAI
+from pathlib import Path
+from typing import List, Dict, Final, Iterator, Mapping, Optional, Any, Tuple
 import logging
+import os
+import re
+import threading
 import time
+import numpy as np
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+from .embedding_cache import EmbeddingCache
+
+try:
+    import h2  # noqa: F401  # lets httpx negotiate HTTP/2
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Connection pool shared by every embedder in the process, so requests reuse
+# kept-alive TCP+TLS connections instead of handshaking again
+_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+_HTTP_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+_HTTP_CLIENT: Optional[httpx.Client] = None
+_HTTP_CLIENT_LOCK = threading.Lock()
+
+
+def get_http_client() -> httpx.Client:
+    """
+    Get the process-wide pooled HTTP client for OpenAI requests
+
+    Returns:
+        Shared httpx client with keep-alive connection pooling
+    """
+    global _HTTP_CLIENT
+
+    with _HTTP_CLIENT_LOCK:
+        if _HTTP_CLIENT is None or _HTTP_CLIENT.is_closed:
+            _HTTP_CLIENT = httpx.Client(
+                limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT, http2=HTTP2_AVAILABLE
+            )
+        return _HTTP_CLIENT
+
+
+# Durations in x-ratelimit-reset-* headers, e.g. "1s", "6m0s", "20ms"
+_RESET_DURATION = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_RESET_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def _parse_reset(value: Optional[str]) -> float:
+    """Convert an x-ratelimit-reset-* header value to seconds (0 if absent)"""
+    if not value:
+        return 0.0
+    return sum(float(n) * _RESET_UNITS[unit] for n, unit in _RESET_DURATION.findall(value))
+
+
+# Default output dimensions of known models
+_DIMENSIONS_MAP: Final[Dict[str, int]] = {
+    "text-embedding-3-large": 3072,
+    "text-embedding-3-small": 1536,
+    "text-embedding-ada-002": 1536,
+}
+
+# Pricing as of 2024 (USD per 1M tokens)
+_PRICING_MAP: Final[Dict[str, float]] = {
+    "text-embedding-3-large": 0.13,
+    "text-embedding-3-small": 0.02,
+    "text-embedding-ada-002": 0.10,
+}
+
+
+# Token budget of one embeddings request, kept under the API's 300k per-request cap
+_MAX_BATCH_TOKENS: Final = 250_000
+
+
+@functools.lru_cache(maxsize=8)
+def _get_encoder(model: str):
+    """tiktoken encoder for a model, built once per process"""
+    import tiktoken
+
+    return tiktoken.encoding_for_model(model)
+
+
+class RateLimiter:
+    """
+    Token bucket limiting how many requests are started per minute
+
+    The bucket is the baseline; on top of it, the x-ratelimit-* headers of each
+    response report the quota actually left, and requests that would exceed it
+    wait for the reported reset instead of provoking a 429.
+    """
+
+    def __init__(self, requests_per_minute: float):
+        """
+        Initialize rate limiter
+
+        Args:
+            requests_per_minute: Sustained request rate to allow
+        """
+        self.rate = requests_per_minute / 60.0
+        # Allow at most one second's worth of requests in a burst
+        self.capacity = max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+        # Server-reported quota, from the latest response headers
+        self._requests_blocked_until = 0.0
+        self._api_tokens_remaining: Optional[int] = None
+        self._api_tokens_reset_at = 0.0
+
+    def acquire(self, api_tokens: int = 0) -> None:
+        """
+        Block until a request may be sent
+
+        Args:
+            api_tokens: Estimated API tokens the request will consume
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                wait = self._requests_blocked_until - now
+                if (
+                    wait <= 0
+                    and self._api_tokens_remaining is not None
+                    and api_tokens > self._api_tokens_remaining
+                    and now < self._api_tokens_reset_at
+                ):
+                    wait = self._api_tokens_reset_at - now
+
+                if wait <= 0:
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        if self._api_tokens_remaining is not None:
+                            self._api_tokens_remaining -= api_tokens
+                        return
+
+                    wait = (1 - self._tokens) / self.rate
+
+            time.sleep(wait)
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """
+        Record the quota reported by a response's x-ratelimit-* headers
+
+        Args:
+            headers: Response headers
+        """
+        try:
+            remaining_requests = headers.get("x-ratelimit-remaining-requests")
+            remaining_tokens = headers.get("x-ratelimit-remaining-tokens")
+            requests_reset = _parse_reset(headers.get("x-ratelimit-reset-requests"))
+            tokens_reset = _parse_reset(headers.get("x-ratelimit-reset-tokens"))
+
+            with self._lock:
+                now = time.monotonic()
+                if remaining_requests is not None and int(remaining_requests) <= 0:
+                    self._requests_blocked_until = max(
+                        self._requests_blocked_until, now + requests_reset
+                    )
+                if remaining_tokens is not None:
+                    self._api_tokens_remaining = int(remaining_tokens)
+                    self._api_tokens_reset_at = now + tokens_reset
+
+        except ValueError as e:
+            logger.warning(f"Could not parse rate limit headers: {e}")
+
 
 class OpenAIEmbedder:
     """
     Generate embeddings using OpenAI's embedding models
     """
 
+    __slots__ = (
+        "client",
+        "model",
+        "dimensions",
+        "batch_size",
+        "max_retries",
+        "cache",
+        "semantic_cache",
+        "max_workers",
+        "rate_limiter",
+    )
+
     def __init__(
         self,
         api_key: str,
         model: str = "text-embedding-3-large",
         dimensions: Optional[int] = None,
-        batch_size: int = 100,
+        batch_size: int = 1024,
         max_retries: int = 3,
+        cache_dir: Optional[Path] = None,
+        max_workers: int = 8,
+        requests_per_minute: float = 3000,
+        semantic_cache: bool = False,
     ):
         """
         Initialize OpenAI embedder
@@ -31,49 +216,61 @@ class OpenAIEmbedder:
             api_key: OpenAI API key
             model: Embedding model to use
             dimensions: Output dimensions (if supported by model)
-            batch_size: Number of texts to process at once
+            batch_size: Maximum number of texts per request (requests are also capped
+                at a token budget)
             max_retries: Maximum retry attempts for failed requests
+            cache_dir: Directory for a persistent embedding cache (disabled if None)
+            max_workers: Number of batch requests in flight at once
+            requests_per_minute: Maximum rate at which batch requests are sent
+            semantic_cache: Key the cache on normalized text (whitespace collapsed,
+                trailing punctuation stripped) so near-duplicates share a vector
         """
-        self.client = OpenAI(api_key=api_key)
+        self.client = OpenAI(api_key=api_key, http_client=get_http_client())
         self.model = model
         self.dimensions = dimensions
         self.batch_size = batch_size
         self.max_retries = max_retries
+        self.cache = EmbeddingCache(Path(cache_dir)) if cache_dir is not None else None
+        self.semantic_cache = semantic_cache
+        self.max_workers = max_workers
+        self.rate_limiter = RateLimiter(requests_per_minute)
 
         logger.info(f"Initialized OpenAI embedder with model: {model}")
 
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
-    def generate_embedding(self, text: str) -> List[float]:
+    def generate_embedding(self, text: str, no_cache: bool = False) -> List[float]:
         """
         Generate embedding for a single text
 
         Args:
             text: Text to embed
+            no_cache: Bypass the embedding cache (e.g. for sensitive texts)
 
         Returns:
             Embedding vector
         """
         try:
-            # Prepare request parameters
-            params = {"model": self.model, "input": text}
-
-            # Add dimensions if specified (for text-embedding-3 models)
-            if self.dimensions and "text-embedding-3" in self.model:
-                params["dimensions"] = self.dimensions
+            key = None
+            if self.cache is not None and not no_cache:
+                key = self._cache_key(text)
+                cached = self.cache.get_many([key])
+                if key in cached:
+                    return cached[key].tolist()
 
             # Generate embedding
-            response = self.client.embeddings.create(**params)
+            response = self.client.embeddings.create(**self._request_params(text))
 
             embedding = response.data[0].embedding
+            if key is not None:
+                self.cache.put_many([(key, embedding)])
             return embedding
 
         except Exception as e:
             logger.error(f"Error generating embedding: {e}")
             raise
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
     def generate_embeddings_batch(
-        self, texts: List[str], show_progress: bool = False
+        self, texts: List[str], show_progress: bool = False, no_cache: bool = False
     ) -> List[List[float]]:
         """
         Generate embeddings for multiple texts
@@ -81,45 +278,209 @@ class OpenAIEmbedder:
         Args:
             texts: List of texts to embed
             show_progress: Whether to show progress
+            no_cache: Bypass the embedding cache (e.g. for sensitive texts)
 
         Returns:
             List of embedding vectors
         """
         try:
-            all_embeddings = []
+            if self.cache is None or no_cache:
+                # Embed each distinct text once, then scatter back to every position
+                unique: Dict[str, int] = {}
+                order = [unique.setdefault(text, len(unique)) for text in texts]
+                unique_embeddings = self._embed_batches(list(unique), show_progress)
+                all_embeddings = [unique_embeddings[i] for i in order]
+            else:
+                keys, cached, pending = self._partition_cached(texts)
+                embeddings = self._embed_batches(list(pending.values()), show_progress)
+                all_embeddings = self._merge_cached(keys, cached, pending, embeddings)
+
+            logger.info(f"Generated {len(all_embeddings)} embeddings")
+            return all_embeddings
+
+        except Exception as e:
+            logger.error(f"Error generating batch embeddings: {e}")
+            raise
+
+    def _cache_key(self, text: str) -> bytes:
+        """Cache key for a text under this embedder's model and settings"""
+        return EmbeddingCache.key(self.model, self.dimensions, text, normalize=self.semantic_cache)
+
+    def _partition_cached(
+        self, texts: List[str]
+    ) -> Tuple[List[bytes], Dict[bytes, np.ndarray], Dict[bytes, str]]:
+        """Look texts up in the cache, returning (keys, cached vectors, texts to embed)"""
+        keys = [self._cache_key(text) for text in texts]
+        cached = self.cache.get_many(keys)
 
-            # Process in batches
-            for i in range(0, len(texts), self.batch_size):
-                batch = texts[i : i + self.batch_size]
+        # Only embed texts not in the cache, each once however often it repeats
+        pending: Dict[bytes, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in cached:
+                pending.setdefault(key, text)
+
+        if cached:
+            logger.info(f"Embedding cache hits: {len(texts) - len(pending)}/{len(texts)}")
+
+        return keys, cached, pending
+
+    def _merge_cached(
+        self,
+        keys: List[bytes],
+        cached: Dict[bytes, np.ndarray],
+        pending: Dict[bytes, str],
+        embeddings: List[List[float]],
+    ) -> List[List[float]]:
+        """Store freshly embedded texts and reassemble all vectors in input order"""
+        fresh = dict(zip(pending, embeddings))
+        self.cache.put_many(fresh.items())
+
+        return [fresh[key] if key in fresh else cached[key].tolist() for key in keys]
+
+    def _embed_batches(self, texts: List[str], show_progress: bool) -> List[List[float]]:
+        """Embed texts with the API, packed into token-budgeted requests sent in parallel"""
+        all_embeddings: List[List[float]] = [None] * len(texts)  # type: ignore[list-item]
+        for start, batch_embeddings in self._dispatch_batches(texts, show_progress):
+            all_embeddings[start : start + len(batch_embeddings)] = batch_embeddings
+
+        return all_embeddings
+
+    def _embed_batches_array(self, texts: List[str], show_progress: bool) -> np.ndarray:
+        """Like _embed_batches, but fill each response straight into one float32 matrix"""
+        out: Optional[np.ndarray] = None
+        for start, batch_embeddings in self._dispatch_batches(texts, show_progress):
+            # The dimension is only known for certain once a response arrives
+            if out is None:
+                out = np.empty((len(texts), len(batch_embeddings[0])), dtype=np.float32)
+            out[start : start + len(batch_embeddings)] = batch_embeddings
+
+        if out is None:
+            return np.empty((0, self.get_embedding_dimension()), dtype=np.float32)
+        return out
+
+    def _dispatch_batches(
+        self, texts: List[str], show_progress: bool
+    ) -> Iterator[Tuple[int, List[List[float]]]]:
+        """Send batches in parallel, yielding (start offset, embeddings) as each completes"""
+        spans = self._plan_batches(texts)
+        if len(spans) <= 1:
+            for start, end in spans:
+                yield start, self._embed_one_batch(texts[start:end])
+            return
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(spans))) as executor:
+            futures = {
+                executor.submit(self._embed_one_batch, texts[start:end]): start
+                for start, end in spans
+            }
+
+            for done, future in enumerate(as_completed(futures), start=1):
+                yield futures[future], future.result()
 
                 if show_progress:
-                    logger.info(
-                        f"Processing batch {i // self.batch_size + 1}/{(len(texts) - 1) // self.batch_size + 1}"
-                    )
+                    logger.info(f"Processed batch {done}/{len(spans)}")
+
+    def _plan_batches(self, texts: List[str]) -> List[Tuple[int, int]]:
+        """
+        Split texts into (start, end) spans, one per request
+
+        A span is closed once it holds batch_size texts or the next text would
+        push it over the request token budget, so requests are packed as full
+        as the API allows.
+        """
+        spans: List[Tuple[int, int]] = []
+        start = 0
+        running_tokens = 0
+        for i, num_tokens in enumerate(self.calculate_tokens_batch(texts)):
+            if i > start and (
+                i - start == self.batch_size or running_tokens + num_tokens > _MAX_BATCH_TOKENS
+            ):
+                spans.append((start, i))
+                start = i
+                running_tokens = 0
+            running_tokens += num_tokens
+
+        if start < len(texts):
+            spans.append((start, len(texts)))
+        return spans
 
-                # Prepare request parameters
-                params = {"model": self.model, "input": batch}
+    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
+    def _embed_one_batch(self, batch: List[str]) -> List[List[float]]:
+        """Embed one batch of texts with a single (rate-limited) API request"""
+        self.rate_limiter.acquire(self._estimate_tokens(batch))
+        raw = self.client.embeddings.with_raw_response.create(**self._request_params(batch))
+        self.rate_limiter.update(raw.headers)
+        return [item.embedding for item in raw.parse().data]
 
-                if self.dimensions and "text-embedding-3" in self.model:
-                    params["dimensions"] = self.dimensions
+    @staticmethod
+    def _estimate_tokens(texts: List[str]) -> int:
+        """Rough API token count of a batch (4 chars per token)"""
+        return sum(len(text) for text in texts) // 4
 
-                # Generate embeddings
-                response = self.client.embeddings.create(**params)
+    def _request_params(self, texts) -> Dict[str, Any]:
+        """Build embeddings.create parameters for one text or a batch of texts"""
+        params: Dict[str, Any] = {"model": self.model, "input": texts}
 
-                # Extract embeddings
-                batch_embeddings = [item.embedding for item in response.data]
-                all_embeddings.extend(batch_embeddings)
+        # Add dimensions if specified (for text-embedding-3 models)
+        if self.dimensions and "text-embedding-3" in self.model:
+            params["dimensions"] = self.dimensions
 
-                # Rate limiting
-                time.sleep(0.1)
+        return params
 
-            logger.info(f"Generated {len(all_embeddings)} embeddings")
-            return all_embeddings
+    def generate_embeddings_array(
+        self,
+        texts: List[str],
+        show_progress: bool = False,
+        dtype: np.dtype = np.float32,
+        normalize: bool = False,
+        no_cache: bool = False,
+    ) -> np.ndarray:
+        """
+        Generate embeddings for multiple texts as one contiguous matrix
+
+        Much smaller than lists of Python floats, and directly usable by FAISS.
+
+        Args:
+            texts: List of texts to embed
+            show_progress: Whether to show progress
+            dtype: Output dtype (float32 for FAISS, float16 to halve memory again)
+            normalize: L2-normalize rows, so cosine similarity becomes a dot product
+            no_cache: Bypass the embedding cache (e.g. for sensitive texts)
+
+        Returns:
+            Array of shape (len(texts), dimension)
+        """
+        if not texts:
+            return np.empty((0, self.get_embedding_dimension()), dtype=dtype)
+
+        try:
+            if self.cache is None or no_cache:
+                # Embed each distinct text once, then gather rows back to every position
+                unique: Dict[str, int] = {}
+                order = [unique.setdefault(text, len(unique)) for text in texts]
+                embeddings = self._embed_batches_array(list(unique), show_progress)
+                if len(unique) < len(texts):
+                    embeddings = embeddings[order]
+            else:
+                keys, cached, pending = self._partition_cached(texts)
+                fresh_embeddings = self._embed_batches_array(list(pending.values()), show_progress)
+                self.cache.put_many(zip(pending, fresh_embeddings))
+
+                fresh = dict(zip(pending, fresh_embeddings))
+                embeddings = np.stack([fresh[key] if key in fresh else cached[key] for key in keys])
+
+            logger.info(f"Generated {len(embeddings)} embeddings")
 
         except Exception as e:
             logger.error(f"Error generating batch embeddings: {e}")
             raise
 
+        if normalize:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings /= np.maximum(norms, np.finfo(np.float32).tiny)
+
+        return embeddings.astype(dtype, copy=False)
+
     def generate_chunks_with_embeddings(
         self, chunks: List[Dict[str, Any]], text_field: str = "text"
     ) -> List[Dict[str, Any]]:
@@ -131,16 +492,16 @@ class OpenAIEmbedder:
             text_field: Field name containing text to embed
 
         Returns:
-            Chunks with added 'embedding' field
+            Chunks with added 'embedding' field (a float32 array row)
         """
         try:
             # Extract texts
             texts = [chunk[text_field] for chunk in chunks]
 
             # Generate embeddings
-            embeddings = self.generate_embeddings_batch(texts, show_progress=True)
+            embeddings = self.generate_embeddings_array(texts, show_progress=True)
 
-            # Add embeddings to chunks
+            # Add embeddings to chunks (rows are views into one matrix)
             for chunk, embedding in zip(chunks, embeddings):
                 chunk["embedding"] = embedding
 
@@ -160,14 +521,7 @@ class OpenAIEmbedder:
         if self.dimensions:
             return self.dimensions
 
-        # Default dimensions for known models
-        dimensions_map = {
-            "text-embedding-3-large": 3072,
-            "text-embedding-3-small": 1536,
-            "text-embedding-ada-002": 1536,
-        }
-
-        return dimensions_map.get(self.model, 1536)
+        return _DIMENSIONS_MAP.get(self.model, 1536)
 
     def calculate_tokens(self, text: str) -> int:
         """
@@ -180,17 +534,32 @@ class OpenAIEmbedder:
             Estimated token count
         """
         try:
-            import tiktoken
-
-            encoding = tiktoken.encoding_for_model(self.model)
-            tokens = encoding.encode(text)
-            return len(tokens)
+            return len(_get_encoder(self.model).encode(text))
 
         except Exception as e:
             # Fallback: rough estimation (4 chars per token)
             logger.warning(f"Could not calculate exact tokens: {e}")
             return len(text) // 4
 
+    def calculate_tokens_batch(self, texts: List[str]) -> List[int]:
+        """
+        Estimate token counts for many texts (encoded in parallel by tiktoken)
+
+        Args:
+            texts: Texts to count tokens for
+
+        Returns:
+            Estimated token count per text
+        """
+        try:
+            encoded = _get_encoder(self.model).encode_batch(texts, num_threads=os.cpu_count() or 4)
+            return [len(tokens) for tokens in encoded]
+
+        except Exception as e:
+            # Fallback: rough estimation (4 chars per token)
+            logger.warning(f"Could not calculate exact tokens: {e}")
+            return [len(text) // 4 for text in texts]
+
     def calculate_cost(self, num_tokens: int) -> float:
         """
         Calculate estimated cost for embeddings
@@ -201,14 +570,114 @@ class OpenAIEmbedder:
         Returns:
             Estimated cost in USD
         """
-        # Pricing as of 2024 (per 1M tokens)
-        pricing_map = {
-            "text-embedding-3-large": 0.13,
-            "text-embedding-3-small": 0.02,
-            "text-embedding-ada-002": 0.10,
-        }
-
-        price_per_million = pricing_map.get(self.model, 0.10)
+        price_per_million = _PRICING_MAP.get(self.model, 0.10)
         cost = (num_tokens / 1_000_000) * price_per_million
 
         return cost
+
+
+class AsyncOpenAIEmbedder(OpenAIEmbedder):
+    """
+    Generate embeddings from an event loop using AsyncOpenAI
+
+    Batches are awaited concurrently (at most max_workers in flight) instead of
+    blocking the loop, so async callers such as API handlers can embed without
+    threads. The synchronous methods of OpenAIEmbedder remain available.
+    """
+
+    __slots__ = ("aclient",)
+
+    def __init__(self, api_key: str, **kwargs: Any):
+        """
+        Initialize async OpenAI embedder
+
+        Args:
+            api_key: OpenAI API key
+            **kwargs: Same options as OpenAIEmbedder
+        """
+        super().__init__(api_key, **kwargs)
+        self.aclient = AsyncOpenAI(
+            api_key=api_key,
+            http_client=httpx.AsyncClient(
+                limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT, http2=HTTP2_AVAILABLE
+            ),
+        )
+
+    async def agenerate_embedding(self, text: str, no_cache: bool = False) -> List[float]:
+        """
+        Generate embedding for a single text
+
+        Args:
+            text: Text to embed
+            no_cache: Bypass the embedding cache (e.g. for sensitive texts)
+
+        Returns:
+            Embedding vector
+        """
+        embeddings = await self.agenerate_embeddings_batch([text], no_cache=no_cache)
+        return embeddings[0]
+
+    async def agenerate_embeddings_batch(
+        self, texts: List[str], show_progress: bool = False, no_cache: bool = False
+    ) -> List[List[float]]:
+        """
+        Generate embeddings for multiple texts
+
+        Args:
+            texts: List of texts to embed
+            show_progress: Whether to show progress
+            no_cache: Bypass the embedding cache (e.g. for sensitive texts)
+
+        Returns:
+            List of embedding vectors
+        """
+        try:
+            if self.cache is None or no_cache:
+                unique: Dict[str, int] = {}
+                order = [unique.setdefault(text, len(unique)) for text in texts]
+                unique_embeddings = await self._aembed_batches(list(unique), show_progress)
+                all_embeddings = [unique_embeddings[i] for i in order]
+            else:
+                keys, cached, pending = self._partition_cached(texts)
+                embeddings = await self._aembed_batches(list(pending.values()), show_progress)
+                all_embeddings = self._merge_cached(keys, cached, pending, embeddings)
+
+            logger.info(f"Generated {len(all_embeddings)} embeddings")
+            return all_embeddings
+
+        except Exception as e:
+            logger.error(f"Error generating batch embeddings: {e}")
+            raise
+
+    async def aclose(self) -> None:
+        """Close the async HTTP client"""
+        await self.aclient.close()
+
+    async def _aembed_batches(self, texts: List[str], show_progress: bool) -> List[List[float]]:
+        """Embed texts with the API, packed into token-budgeted requests sent concurrently"""
+        batches = [texts[start:end] for start, end in self._plan_batches(texts)]
+        semaphore = asyncio.Semaphore(self.max_workers)
+        done = 0
+
+        async def embed(batch: List[str]) -> List[List[float]]:
+            nonlocal done
+            async with semaphore:
+                embeddings = await self._aembed_one_batch(batch)
+
+            done += 1
+            if show_progress:
+                logger.info(f"Processed batch {done}/{len(batches)}")
+            return embeddings
+
+        # gather returns results in submission order
+        results = await asyncio.gather(*(embed(batch) for batch in batches))
+        return [emb for batch_embeddings in results for emb in batch_embeddings]
+
+    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
+    async def _aembed_one_batch(self, batch: List[str]) -> List[List[float]]:
+        """Embed one batch of texts with a single (rate-limited) API request"""
+        # The limiter blocks, so wait for a token off the event loop
+        await asyncio.to_thread(self.rate_limiter.acquire, self._estimate_tokens(batch))
+        raw = await self.aclient.embeddings.with_raw_response.create(**self._request_params(batch))
+        self.rate_limiter.update(raw.headers)
+        return [item.embedding for item in raw.parse().data]
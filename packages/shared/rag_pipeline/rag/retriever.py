@@ -13,17 +13,101 @@ Usage:
     results = retriever.search("What are the effects of climate change?", top_k=10)
 """
 
+import gzip
 import os
-import json
 import tempfile
-from typing import List, Dict, Optional
+from pathlib import Path
+from typing import List, Dict, Optional, Union
 from dataclasses import dataclass
 import numpy as np
+import orjson
+import pyarrow as pa
+import pyarrow.parquet as pq
 import requests
 import faiss
-import boto3
+from botocore.exceptions import ClientError
 
 from rag_pipeline.rag.openai_embedder import OpenAIEmbedder
+from rag_pipeline.storage.s3 import create_s3_client
+
+# Indexes downloaded from S3 are kept here, keyed by ETag, so warm starts skip the download
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "rag" / "faiss"
+
+
+def _download_cached(s3_client, bucket_name: str, key: str, cache_dir: Path) -> Path:
+    """Download an S3 object into cache_dir, unless that version (ETag) is already there."""
+    etag = s3_client.head_object(Bucket=bucket_name, Key=key)["ETag"].strip('"')
+    name = Path(key)
+    local_path = cache_dir / f"{name.stem}-{etag}{name.suffix}"
+
+    if local_path.exists():
+        print(f"Using cached s3://{bucket_name}/{key}")
+        return local_path
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    print(f"Downloading s3://{bucket_name}/{key}...")
+
+    # Download beside the target and rename, so a partial file is never picked up
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    os.close(fd)
+    try:
+        s3_client.download_file(bucket_name, key, tmp_path)
+        os.replace(tmp_path, local_path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+    # Drop superseded versions of the same object
+    for stale in cache_dir.glob(f"{name.stem}-*{name.suffix}"):
+        if stale != local_path:
+            stale.unlink(missing_ok=True)
+
+    return local_path
+
+
+def _read_index(index_path: Path) -> faiss.Index:
+    """
+    Open a FAISS index memory-mapped and read-only where the index type allows.
+
+    Pages are then shared through the OS page cache across processes and only
+    loaded as searches touch them; other index types are read into memory.
+    """
+    flags = getattr(faiss, "IO_FLAG_MMAP_IFC", faiss.IO_FLAG_MMAP) | faiss.IO_FLAG_READ_ONLY
+    try:
+        return faiss.read_index(str(index_path), flags)
+    except RuntimeError:
+        return faiss.read_index(str(index_path))
+
+
+def _load_metadata(
+    s3_client, bucket_name: str, index_prefix: str, chunk_type: str, cache_dir: Path
+) -> Union[pa.Table, Dict[str, Dict]]:
+    """
+    Load index metadata: the Parquet table if available, else the (gzipped or
+    plain) JSON mapping of older indexes.
+
+    The Parquet table is decompressed into Arrow buffers once at load time;
+    that is far more compact than one Python dict per chunk.
+    """
+    try:
+        metadata_path = _download_cached(
+            s3_client, bucket_name, f"{index_prefix}{chunk_type}_metadata.parquet", cache_dir
+        )
+        return pq.read_table(metadata_path)
+    except ClientError as e:
+        if e.response["Error"]["Code"] not in ("404", "NoSuchKey"):
+            raise
+
+    metadata_key = f"{index_prefix}{chunk_type}_metadata.json"
+    try:
+        metadata_path = _download_cached(s3_client, bucket_name, f"{metadata_key}.gz", cache_dir)
+        return orjson.loads(gzip.decompress(metadata_path.read_bytes()))
+    except ClientError as e:
+        if e.response["Error"]["Code"] not in ("404", "NoSuchKey"):
+            raise
+
+    metadata_path = _download_cached(s3_client, bucket_name, metadata_key, cache_dir)
+    return orjson.loads(metadata_path.read_bytes())
 
 
 @dataclass
@@ -42,13 +126,19 @@ class SearchResult:
 class FAISSRetriever:
     """FAISS-based vector similarity search."""
 
-    def __init__(self, index: faiss.Index, metadata: Dict[str, Dict], embedder: OpenAIEmbedder):
+    def __init__(
+        self,
+        index: faiss.Index,
+        metadata: Union[pa.Table, Dict[str, Dict]],
+        embedder: OpenAIEmbedder,
+    ):
         """
         Initialize FAISS retriever.
 
         Args:
             index: FAISS index
-            metadata: Dict mapping index position to chunk metadata
+            metadata: Table whose row i describes index position i, or (older
+                indexes) a dict mapping index position to chunk metadata
             embedder: OpenAI embedder for query encoding
         """
         self.index = index
@@ -57,7 +147,12 @@ class FAISSRetriever:
 
     @classmethod
     def from_s3(
-        cls, bucket_name: str, chunk_type: str, openai_api_key: str, index_prefix: str = "indexes/"
+        cls,
+        bucket_name: str,
+        chunk_type: str,
+        openai_api_key: str,
+        index_prefix: str = "indexes/",
+        cache_dir: Optional[Path] = None,
     ) -> "FAISSRetriever":
         """
         Load FAISS retriever from S3.
@@ -67,24 +162,17 @@ class FAISSRetriever:
             chunk_type: "coarse" or "fine"
             openai_api_key: OpenAI API key
             index_prefix: S3 prefix for indexes
+            cache_dir: Local download cache (defaults to ~/.cache/rag/faiss)
         """
-        s3_client = boto3.client("s3")
+        s3_client = create_s3_client()
+        cache_dir = cache_dir or DEFAULT_CACHE_DIR
 
-        # Download index
+        # Download index (reused from the local cache while its ETag matches)
         index_key = f"{index_prefix}{chunk_type}.faiss"
-        with tempfile.NamedTemporaryFile(suffix=".faiss", delete=False) as f:
-            index_path = f.name
-
-        print(f"Downloading index from s3://{bucket_name}/{index_key}...")
-        s3_client.download_file(bucket_name, index_key, index_path)
-        index = faiss.read_index(index_path)
-        os.unlink(index_path)
+        index = _read_index(_download_cached(s3_client, bucket_name, index_key, cache_dir))
 
         # Download metadata
-        metadata_key = f"{index_prefix}{chunk_type}_metadata.json"
-        print(f"Downloading metadata from s3://{bucket_name}/{metadata_key}...")
-        response = s3_client.get_object(Bucket=bucket_name, Key=metadata_key)
-        metadata = json.loads(response["Body"].read().decode("utf-8"))
+        metadata = _load_metadata(s3_client, bucket_name, index_prefix, chunk_type, cache_dir)
 
         # Initialize embedder
         embedder = OpenAIEmbedder(api_key=openai_api_key, model="text-embedding-3-small")
@@ -112,12 +200,15 @@ class FAISSRetriever:
         distances, indices = self.index.search(query_vector, top_k)
 
         # Build results
-        results = []
-        for rank, (idx, score) in enumerate(zip(indices[0], distances[0])):
-            if idx == -1:  # No more results
-                break
+        hits = [(idx, score) for idx, score in zip(indices[0], distances[0]) if idx != -1]
+        if isinstance(self.metadata, pa.Table):
+            # Convert only the returned rows to Python objects
+            rows = self.metadata.take([int(idx) for idx, _ in hits]).to_pylist()
+        else:
+            rows = [self.metadata[str(idx)] for idx, _ in hits]
 
-            meta = self.metadata[str(idx)]
+        results = []
+        for rank, ((idx, score), meta) in enumerate(zip(hits, rows)):
             results.append(
                 SearchResult(
                     chunk_id=meta["chunk_id"],
@@ -244,6 +335,7 @@ class HybridRetriever:
         zeroentropy_api_key: Optional[str] = None,
         chunk_type: str = "coarse",
         faiss_candidates: int = 75,
+        cache_dir: Optional[Path] = None,
     ) -> "HybridRetriever":
         """
         Load hybrid retriever from S3.
@@ -254,9 +346,13 @@ class HybridRetriever:
             zeroentropy_api_key: Optional ZeroEntropy API key
             chunk_type: "coarse" or "fine"
             faiss_candidates: Number of FAISS candidates
+            cache_dir: Local download cache (defaults to ~/.cache/rag/faiss)
         """
         faiss_retriever = FAISSRetriever.from_s3(
-            bucket_name=bucket_name, chunk_type=chunk_type, openai_api_key=openai_api_key
+            bucket_name=bucket_name,
+            chunk_type=chunk_type,
+            openai_api_key=openai_api_key,
+            cache_dir=cache_dir,
         )
 
         reranker = None
@@ -0,0 +1,5 @@
+"""Storage helpers."""
+
+from rag_pipeline.storage.s3 import S3_CLIENT_CONFIG, TRANSFER_CONFIG, create_s3_client
+
+__all__ = ["S3_CLIENT_CONFIG", "TRANSFER_CONFIG", "create_s3_client"]
@@ -0,0 +1,36 @@
+"""
+Shared S3 client configuration.
+"""
+
+import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+
+# One connection pool large enough for the threaded uploads/downloads, adaptive
+# retries for S3 throttling, and TCP keep-alive so idle pooled sockets survive
+S3_CLIENT_CONFIG = Config(
+    max_pool_connections=64,
+    retries={"max_attempts": 10, "mode": "adaptive"},
+    tcp_keepalive=True,
+)
+
+# Managed transfers (download_file/upload_file): PDFs and figures are often tens of
+# MB, so split them into larger parts fetched by more threads than the defaults
+# (8 MB threshold/parts, 10 threads, 256 KB reads)
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=16 * 1024 * 1024,
+    multipart_chunksize=32 * 1024 * 1024,
+    max_concurrency=20,
+    io_chunksize=1024 * 1024,
+    use_threads=True,
+)
+
+
+def create_s3_client():
+    """
+    Create an S3 client with the shared connection pool configuration.
+
+    Returns:
+        boto3 S3 client
+    """
+    return boto3.client("s3", config=S3_CLIENT_CONFIG)
@@ -11,9 +11,17 @@ This script helps diagnose:
 
 import os
 import sys
-from datetime import datetime, timedelta
-import boto3
-from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from collections import Counter
+
+from rag_pipeline.storage.s3 import create_s3_client
+
+
+def iter_objects(s3, bucket, prefix):
+    """Yield every object under a prefix, one listing page at a time."""
+    paginator = s3.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+        yield from page.get("Contents", [])
 
 
 def check_s3_status():
@@ -24,24 +32,37 @@ def check_s3_status():
     print("=" * 70)
 
     # Initialize S3 client
-    s3 = boto3.client("s3")
+    s3 = create_s3_client()
     bucket = os.getenv("S3_OUTPUT_BUCKET", "cs433-rag-project2")
     prefix = os.getenv("S3_OUTPUT_PREFIX", "processed/")
 
     print(f"\nBucket: s3://{bucket}/{prefix}")
     print()
 
-    # Count processed PDFs
+    # List the processed folder once, deriving the PDF count, the latest upload
+    # and the hourly upload histogram in the same pass
     print("📊 Counting processed PDFs...")
-    paginator = s3.get_paginator("list_objects_v2")
-    pages = paginator.paginate(Bucket=bucket, Prefix=prefix, Delimiter="/")
 
-    processed_pdfs = []
-    for page in pages:
-        if "CommonPrefixes" in page:
-            for prefix_obj in page["CommonPrefixes"]:
-                pdf_folder = prefix_obj["Prefix"].split("/")[-2]
-                processed_pdfs.append(pdf_folder)
+    # S3 LastModified timestamps are UTC
+    now = datetime.now(timezone.utc)
+    last_24h = now - timedelta(hours=24)
+
+    processed_pdfs = set()
+    last_upload = None
+    uploads_by_hour = Counter()
+
+    for file_obj in iter_objects(s3, bucket, prefix):
+        # Each processed PDF is a folder directly under the prefix
+        pdf_folder, sep, _ = file_obj["Key"][len(prefix) :].partition("/")
+        if sep:
+            processed_pdfs.add(pdf_folder)
+
+        file_time = file_obj["LastModified"]
+        if last_upload is None or file_time > last_upload["LastModified"]:
+            last_upload = file_obj
+
+        if file_time > last_24h:
+            uploads_by_hour[file_time.strftime("%Y-%m-%d %H:00")] += 1
 
     total_processed = len(processed_pdfs)
     print(f"✅ Total processed PDFs: {total_processed}")
@@ -49,12 +70,9 @@ def check_s3_status():
     # Check total available PDFs
     print("\n📊 Checking total available PDFs...")
     raw_prefix = os.getenv("S3_INPUT_PREFIX", "raw_pdfs/")
-    raw_pages = paginator.paginate(Bucket=bucket, Prefix=raw_prefix)
-
-    total_pdfs = 0
-    for page in raw_pages:
-        if "Contents" in page:
-            total_pdfs += len([obj for obj in page["Contents"] if obj["Key"].endswith(".pdf")])
+    total_pdfs = sum(
+        1 for obj in iter_objects(s3, bucket, raw_prefix) if obj["Key"].endswith(".pdf")
+    )
 
     print(f"📚 Total PDFs to process: {total_pdfs}")
     print(f"🎯 Progress: {total_processed}/{total_pdfs} ({total_processed * 100 // total_pdfs}%)")
@@ -63,21 +81,9 @@ def check_s3_status():
     # Check last upload time
     print("\n⏰ Checking last upload time...")
 
-    all_files = []
-    paginator = s3.get_paginator("list_objects_v2")
-    pages = paginator.paginate(Bucket=bucket, Prefix=prefix)
-
-    for page in pages:
-        if "Contents" in page:
-            all_files.extend(page["Contents"])
-
-    if all_files:
-        # Sort by last modified
-        all_files.sort(key=lambda x: x["LastModified"], reverse=True)
-
-        last_upload = all_files[0]
+    if last_upload is not None:
         last_time = last_upload["LastModified"]
-        time_ago = datetime.now(last_time.tzinfo) - last_time
+        time_ago = now - last_time
 
         print(f"📤 Last upload: {last_upload['Key']}")
         print(f"🕐 Timestamp: {last_time.strftime('%Y-%m-%d %H:%M:%S %Z')}")
@@ -95,17 +101,6 @@ def check_s3_status():
     # Check uploads by time
     print("\n📈 Upload activity (last 24 hours):")
 
-    now = datetime.now(last_time.tzinfo if all_files else None)
-    last_24h = now - timedelta(hours=24)
-
-    uploads_by_hour = defaultdict(int)
-
-    for file_obj in all_files:
-        file_time = file_obj["LastModified"]
-        if file_time > last_24h:
-            hour_key = file_time.strftime("%Y-%m-%d %H:00")
-            uploads_by_hour[hour_key] += 1
-
     # Show last 12 hours
     hours = sorted(uploads_by_hour.keys(), reverse=True)[:12]
     for hour in hours:
@@ -135,11 +130,7 @@ def check_s3_status():
     # Check for failure reports
     print("\n🔍 Checking for failure reports...")
     try:
-        failure_pages = paginator.paginate(Bucket=bucket, Prefix="failures/")
-        failure_files = []
-        for page in failure_pages:
-            if "Contents" in page:
-                failure_files.extend(page["Contents"])
+        failure_files = list(iter_objects(s3, bucket, "failures/"))
 
         if failure_files:
             print(f"⚠️  Found {len(failure_files)} failure report(s):")
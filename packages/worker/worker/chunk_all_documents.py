@@ -9,18 +9,18 @@ Usage:
 """
 
 import sys
-import json
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Set
 from tqdm import tqdm
-import boto3
-from botocore.exceptions import ClientError
+import orjson
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from rag_pipeline.rag.markdown_chunker import MarkdownChunker, Chunk
+from rag_pipeline.storage.s3 import create_s3_client
 from scripts.utils.markdown_s3_loader import S3MarkdownLoader
 
 
@@ -29,15 +29,23 @@ BUCKET_NAME = "cs433-rag-project2"
 INPUT_PREFIX = "processed/"
 OUTPUT_PREFIX = "chunks/"
 
+# Uploads run here so a paper's coarse and fine chunk files are put concurrently
+_UPLOAD_POOL = ThreadPoolExecutor(max_workers=32, thread_name_prefix="chunk-upload")
 
-def check_chunks_exist(s3_client, bucket: str, paper_id: str) -> bool:
-    """Check if chunks already exist for a paper."""
-    coarse_key = f"{OUTPUT_PREFIX}{paper_id}_coarse.json"
-    try:
-        s3_client.head_object(Bucket=bucket, Key=coarse_key)
-        return True
-    except ClientError:
-        return False
+
+def list_chunked_papers(s3_client, bucket: str) -> Set[str]:
+    """List the IDs of papers that already have chunks, in one paginated pass."""
+    suffix = "_coarse.json"
+    existing = set()
+
+    paginator = s3_client.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=bucket, Prefix=OUTPUT_PREFIX):
+        for obj in page.get("Contents", []):
+            key = obj["Key"]
+            if key.endswith(suffix):
+                existing.add(key[len(OUTPUT_PREFIX) : -len(suffix)])
+
+    return existing
 
 
 def save_chunks(
@@ -57,7 +65,8 @@ def save_chunks(
     s3_client.put_object(
         Bucket=bucket,
         Key=key,
-        Body=json.dumps(data, indent=2).encode("utf-8"),
+        # Compact orjson output is several times smaller and faster than indented json
+        Body=orjson.dumps(data),
         ContentType="application/json",
     )
 
@@ -88,9 +97,12 @@ def process_paper(
         coarse_chunks = chunks["coarse"]
         fine_chunks = chunks["fine"]
 
-        # Save to S3
+        # Save to S3, uploading the fine chunks while the coarse ones go up
+        fine_upload = _UPLOAD_POOL.submit(
+            save_chunks, s3_client, BUCKET_NAME, paper_id, paper_title, fine_chunks, "fine"
+        )
         save_chunks(s3_client, BUCKET_NAME, paper_id, paper_title, coarse_chunks, "coarse")
-        save_chunks(s3_client, BUCKET_NAME, paper_id, paper_title, fine_chunks, "fine")
+        fine_upload.result()
 
         return {
             "paper_id": paper_id,
@@ -110,6 +122,9 @@ def main():
     parser.add_argument(
         "--force", action="store_true", help="Re-chunk papers that already have chunks"
     )
+    parser.add_argument(
+        "--workers", type=int, default=16, help="Number of papers processed concurrently"
+    )
     args = parser.parse_args()
 
     print("=" * 60)
@@ -117,7 +132,7 @@ def main():
     print("=" * 60)
 
     # Initialize clients
-    s3_client = boto3.client("s3")
+    s3_client = create_s3_client()
     loader = S3MarkdownLoader(bucket_name=BUCKET_NAME, prefix=INPUT_PREFIX)
     chunker = MarkdownChunker()
 
@@ -134,10 +149,8 @@ def main():
     # Filter out already processed papers
     if not args.force:
         print("\nChecking for existing chunks...")
-        papers_to_process = []
-        for paper_id in tqdm(paper_ids, desc="Checking existing"):
-            if not check_chunks_exist(s3_client, BUCKET_NAME, paper_id):
-                papers_to_process.append(paper_id)
+        existing = list_chunked_papers(s3_client, BUCKET_NAME)
+        papers_to_process = [paper_id for paper_id in paper_ids if paper_id not in existing]
 
         skipped = len(paper_ids) - len(papers_to_process)
         if skipped > 0:
@@ -160,9 +173,19 @@ def main():
         "failed_papers": [],
     }
 
-    for paper_id in tqdm(paper_ids, desc="Chunking papers"):
-        result = process_paper(loader, chunker, s3_client, paper_id)
+    # Papers are independent: S3 I/O and tiktoken encoding both release the GIL,
+    # and boto3 clients are safe to share between threads
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        futures = {
+            executor.submit(process_paper, loader, chunker, s3_client, paper_id): paper_id
+            for paper_id in paper_ids
+        }
+        results = [
+            (futures[future], future.result())
+            for future in tqdm(as_completed(futures), total=len(futures), desc="Chunking papers")
+        ]
 
+    for paper_id, result in results:
         if result:
             stats["processed"] += 1
             stats["total_coarse"] += result["coarse_count"]
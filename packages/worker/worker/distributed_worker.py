@@ -2,18 +2,26 @@
 """
 Distributed PDF processing worker.
 
-Each worker processes a subset of PDFs from S3 in parallel.
+Each worker processes a subset of PDFs from S3 in parallel. PDFs are either
+pulled from a shared SQS work queue (PDF_QUEUE_URL) or, without a queue, split
+statically across workers by WORKER_ID/TOTAL_WORKERS.
 """
 
+import atexit
 import os
 import sys
 import json
 import tempfile
+import shutil
 import logging
+import queue
+import threading
+import time
 from pathlib import Path
-from typing import List, Dict
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Optional, Tuple
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 import boto3
+from s3transfer.manager import TransferManager
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -22,11 +30,20 @@ from scripts.utils.s3_utils import (
     list_pdfs_from_s3,
     download_from_s3,
     upload_to_s3,
-    s3_object_exists,
+    list_s3_keys,
+)
+from scripts.utils.pdf_manifest import read_pdf_manifest
+from scripts.utils.pdf_queue import (
+    count_in_flight,
+    delete_pdf_message,
+    extend_pdf_messages,
+    receive_pdf_messages,
+    release_pdf_message,
 )
 from scripts.utils.worker_distribution import get_worker_pdfs, get_output_key, extract_pdf_id
 from rag_pipeline.pdf_parsing.core.pipeline import PDFParsingPipeline
 from rag_pipeline.pdf_parsing.config import PDFParsingConfig
+from rag_pipeline.storage.s3 import TRANSFER_CONFIG, create_s3_client
 
 
 # Configure logging (simple format first, will add worker_id later)
@@ -37,6 +54,73 @@ logging.basicConfig(
 )
 
 
+# PDFs downloaded ahead of the ones being parsed
+PREFETCH_PDFS = 2
+
+# Keep downloaded PDFs in RAM (tmpfs) when it has room for them; Docker's
+# default /dev/shm is only 64 MB
+SHM_DIR = Path("/dev/shm")
+SHM_MIN_FREE = 1024**3
+
+
+def create_scratch_dir() -> Path:
+    """Create the worker's PDF scratch directory, removed again at exit."""
+    use_shm = SHM_DIR.is_dir() and shutil.disk_usage(SHM_DIR).free >= SHM_MIN_FREE
+    scratch = Path(tempfile.mkdtemp(prefix="pdf-", dir=SHM_DIR if use_shm else None))
+    atexit.register(shutil.rmtree, scratch, ignore_errors=True)
+    return scratch
+
+
+class DocumentBatcher:
+    """
+    Collect PDFs from concurrent process_pdf calls into shared parse_documents calls.
+
+    Each caller blocks in parse() until its PDF is parsed. PDFs that arrive
+    within `linger` seconds of each other (up to `max_batch`) go through the
+    model together, so their pages share GPU batches. If a batch fails, its
+    PDFs are retried one by one so only the broken one reports the error.
+    """
+
+    def __init__(self, pipeline: PDFParsingPipeline, max_batch: int, linger: float = 0.5):
+        self.pipeline = pipeline
+        self.max_batch = max_batch
+        self.linger = linger
+        self._queue: "queue.Queue[Tuple[Path, Future]]" = queue.Queue()
+        threading.Thread(target=self._run, name="parse-batcher", daemon=True).start()
+
+    def parse(self, pdf_path: Path) -> None:
+        """Parse one PDF as part of the next batch, re-raising its error if any."""
+        future: Future = Future()
+        self._queue.put((pdf_path, future))
+        future.result()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.linger
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get(timeout=max(0.0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+
+            try:
+                self.pipeline.parse_documents([path for path, _ in batch])
+            except Exception as e:
+                if len(batch) == 1:
+                    batch[0][1].set_exception(e)
+                    continue
+                for path, future in batch:
+                    try:
+                        self.pipeline.parse_document(path)
+                        future.set_result(None)
+                    except Exception as e:
+                        future.set_exception(e)
+            else:
+                for _, future in batch:
+                    future.set_result(None)
+
+
 class DistributedWorker:
     """Worker for distributed PDF processing."""
 
@@ -50,6 +134,11 @@ class DistributedWorker:
         self.s3_output_prefix = os.getenv("S3_OUTPUT_PREFIX", "processed/")
         self.max_retries = int(os.getenv("MAX_RETRIES", "2"))
         self.concurrent_pdfs = int(os.getenv("CONCURRENT_PDFS", "3"))  # Process 3 PDFs at once
+        self.queue_url = os.getenv("PDF_QUEUE_URL")  # Pull PDFs from SQS instead of slicing
+        self.manifest_key = os.getenv("PDF_MANIFEST_KEY")  # Read PDF list instead of listing
+        self.queue_visibility_timeout = int(os.getenv("QUEUE_VISIBILITY_TIMEOUT", "900"))
+        # PDFs whose pages are parsed together (at most CONCURRENT_PDFS are ready at once)
+        self.pdf_batch_size = int(os.getenv("PDF_BATCH_SIZE", "1"))
 
         # Validate configuration
         if not self.s3_input_bucket:
@@ -58,7 +147,20 @@ class DistributedWorker:
             raise ValueError("S3_OUTPUT_BUCKET environment variable required")
 
         # Initialize S3 client
-        self.s3 = boto3.client("s3")
+        self.s3 = create_s3_client()
+        self.sqs = boto3.client("sqs") if self.queue_url else None
+
+        # Downloads run on their own threads, ahead of GPU parsing, into one
+        # scratch directory instead of a temporary directory per PDF
+        self.scratch_dir = create_scratch_dir()
+        self.download_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="download")
+        # Outputs of every PDF go through one manager, so all of them upload at once
+        self.transfer_manager = TransferManager(self.s3, TRANSFER_CONFIG)
+
+        # Outputs that already exist, listed once instead of a HeadObject per PDF
+        self.done_keys = list_s3_keys(
+            self.s3, self.s3_output_bucket, self.s3_output_prefix, suffix="/document.md"
+        )
 
         # Initialize PDF parsing config with temp output directory
         from rag_pipeline.pdf_parsing.config import OutputConfig, DolphinModelConfig
@@ -68,6 +170,8 @@ class DistributedWorker:
             output=OutputConfig(output_dir=Path("/tmp/pdf_output")),
         )
         self.pipeline = None  # Lazy load to avoid loading model unless needed
+        self.batcher: Optional[DocumentBatcher] = None
+        self._pipeline_lock = threading.Lock()
 
         # Track failures
         self.failures: List[Dict] = []
@@ -79,19 +183,58 @@ class DistributedWorker:
         )
 
     def get_pipeline(self) -> PDFParsingPipeline:
-        """Lazy load PDF parsing pipeline."""
-        if self.pipeline is None:
-            self.logger.info("Initializing PDF parsing pipeline with Dolphin model...")
-            self.pipeline = PDFParsingPipeline(self.config)
-            self.logger.info("Pipeline initialized successfully")
+        """Lazy load PDF parsing pipeline (once, even with concurrent callers)."""
+        with self._pipeline_lock:
+            if self.pipeline is None:
+                self.logger.info("Initializing PDF parsing pipeline with Dolphin model...")
+                self.pipeline = PDFParsingPipeline(self.config)
+                if self.pdf_batch_size > 1:
+                    self.batcher = DocumentBatcher(self.pipeline, self.pdf_batch_size)
+                self.logger.info("Pipeline initialized successfully")
         return self.pipeline
 
-    def process_pdf(self, pdf_key: str) -> bool:
+    def download_pdf(self, pdf_key: str) -> Optional[Path]:
+        """
+        Download a PDF into the scratch directory.
+
+        Runs on the download pool, ahead of the GPU, so the next PDF is already
+        on disk when a processing slot frees up.
+
+        Args:
+            pdf_key: S3 key of PDF file
+
+        Returns:
+            Local path of the PDF, or None if it has already been processed
+        """
+        # Get output key: processed/{PDF_ID}/document.md
+        output_key = get_output_key(pdf_key, self.s3_input_prefix, self.s3_output_prefix)
+
+        # Check if already processed
+        if output_key in self.done_keys:
+            self.logger.info(f"Skipping {pdf_key} (already processed at {output_key})")
+            return None
+
+        local_pdf = self.scratch_dir / Path(pdf_key).name
+        try:
+            self.logger.info(f"Downloading {pdf_key}...")
+            download_from_s3(self.s3, self.s3_input_bucket, pdf_key, str(local_pdf))
+        except Exception:
+            local_pdf.unlink(missing_ok=True)
+            raise
+        return local_pdf
+
+    def submit_pdf(self, executor: ThreadPoolExecutor, pdf_key: str) -> Future:
+        """Start downloading a PDF and queue it for processing on the executor."""
+        download = self.download_pool.submit(self.download_pdf, pdf_key)
+        return executor.submit(self.process_pdf, pdf_key, download)
+
+    def process_pdf(self, pdf_key: str, download: Optional[Future] = None) -> bool:
         """
         Process a single PDF.
 
         Args:
             pdf_key: S3 key of PDF file (e.g., 'raw_pdfs/00002_W2122361802_Title.pdf')
+            download: Pending download_pdf result (downloaded here if None)
 
         Returns:
             True if successful, False otherwise
@@ -100,102 +243,106 @@ class DistributedWorker:
             Creates: processed/{PDF_ID}/document.md
             Example: processed/00002_W2122361802/document.md
         """
-        # Get output key: processed/{PDF_ID}/document.md
-        output_key = get_output_key(pdf_key, self.s3_input_prefix, self.s3_output_prefix)
-
-        # Check if already processed
-        if s3_object_exists(self.s3, self.s3_output_bucket, output_key):
-            self.logger.info(f"Skipping {pdf_key} (already processed at {output_key})")
-            return True
+        local_pdf = None
 
-        # Download PDF to temporary file
-        with tempfile.TemporaryDirectory() as tmpdir:
-            local_pdf = Path(tmpdir) / Path(pdf_key).name
-
-            try:
-                self.logger.info(f"Downloading {pdf_key}...")
-                download_from_s3(self.s3, self.s3_input_bucket, pdf_key, str(local_pdf))
+        try:
+            local_pdf = download.result() if download else self.download_pdf(pdf_key)
+            if local_pdf is None:
+                return True
 
-                # Process with Dolphin model
-                self.logger.info(f"Processing {pdf_key} with Dolphin...")
-                pipeline = self.get_pipeline()
+            # Process with Dolphin model
+            self.logger.info(f"Processing {pdf_key} with Dolphin...")
+            pipeline = self.get_pipeline()
+            if self.batcher is not None:
+                self.batcher.parse(local_pdf)
+            else:
                 pipeline.parse_document(local_pdf)
 
-                # Get output paths
-                pdf_id = extract_pdf_id(pdf_key)
-                base_s3_path = f"{self.s3_output_prefix}{pdf_id}/"
+            # Get output paths
+            pdf_id = extract_pdf_id(pdf_key)
+            base_s3_path = f"{self.s3_output_prefix}{pdf_id}/"
+            uploads = []
 
-                # 1. Upload markdown as document.md
-                markdown_dir = self.config.output.get_markdown_dir()
-                markdown_path = markdown_dir / f"{local_pdf.stem}.md"
+            # 1. Upload markdown as document.md
+            markdown_dir = self.config.output.get_markdown_dir()
+            markdown_path = markdown_dir / f"{local_pdf.stem}.md"
 
-                if not markdown_path.exists():
-                    raise FileNotFoundError(f"Markdown not generated: {markdown_path}")
+            if not markdown_path.exists():
+                raise FileNotFoundError(f"Markdown not generated: {markdown_path}")
 
-                self.logger.info("Uploading document.md...")
-                upload_to_s3(
-                    self.s3,
-                    self.s3_output_bucket,
-                    f"{base_s3_path}document.md",
-                    markdown_path.read_text(),
+            self.logger.info("Uploading document.md...")
+            uploads.append(
+                self.transfer_manager.upload(
+                    str(markdown_path), self.s3_output_bucket, f"{base_s3_path}document.md"
                 )
+            )
 
-                # 2. Upload metadata.json
-                json_dir = self.config.output.get_json_dir()
-                json_path = json_dir / f"{local_pdf.stem}.json"
-
-                if json_path.exists():
-                    self.logger.info("Uploading metadata.json...")
-                    upload_to_s3(
-                        self.s3,
-                        self.s3_output_bucket,
-                        f"{base_s3_path}metadata.json",
-                        json_path.read_text(),
+            # 2. Upload metadata.json
+            json_dir = self.config.output.get_json_dir()
+            json_path = json_dir / f"{local_pdf.stem}.json"
+
+            if json_path.exists():
+                self.logger.info("Uploading metadata.json...")
+                uploads.append(
+                    self.transfer_manager.upload(
+                        str(json_path), self.s3_output_bucket, f"{base_s3_path}metadata.json"
                     )
+                )
 
-                # 3. Upload all figures
-                figures_dir = self.config.output.get_figures_dir()
-                if figures_dir.exists():
-                    for figure_file in figures_dir.glob("*.png"):
-                        self.logger.info(f"Uploading figures/{figure_file.name}...")
-                        # Upload binary file (image)
-                        self.s3.upload_file(
+            # 3. Upload all figures
+            figures_dir = self.config.output.get_figures_dir()
+            if figures_dir.exists():
+                for figure_file in figures_dir.glob("*.png"):
+                    self.logger.info(f"Uploading figures/{figure_file.name}...")
+                    # Upload binary file (image)
+                    uploads.append(
+                        self.transfer_manager.upload(
                             str(figure_file),
                             self.s3_output_bucket,
                             f"{base_s3_path}figures/{figure_file.name}",
                         )
+                    )
 
-                self.logger.info(f"✓ Successfully processed {pdf_key}")
+            # Wait for the uploads, so success means the outputs are in S3
+            for upload in uploads:
+                upload.result()
 
-                # Clear GPU cache to prevent memory fragmentation
-                try:
-                    import torch
+            self.done_keys.add(get_output_key(pdf_key, self.s3_input_prefix, self.s3_output_prefix))
+            self.logger.info(f"✓ Successfully processed {pdf_key}")
 
-                    if torch.cuda.is_available():
-                        torch.cuda.empty_cache()
-                        torch.cuda.synchronize()
-                except Exception:
-                    pass
+            # Clear GPU cache to prevent memory fragmentation
+            try:
+                import torch
 
-                return True
+                if torch.cuda.is_available():
+                    torch.cuda.empty_cache()
+                    torch.cuda.synchronize()
+            except Exception:
+                pass
 
-            except Exception as e:
-                self.logger.error(f"✗ Failed to process {pdf_key}: {e}")
-                self.failures.append(
-                    {"pdf_key": pdf_key, "error": str(e), "error_type": type(e).__name__}
-                )
+            return True
 
-                # Clear GPU cache even on failure
-                try:
-                    import torch
+        except Exception as e:
+            self.logger.error(f"✗ Failed to process {pdf_key}: {e}")
+            self.failures.append(
+                {"pdf_key": pdf_key, "error": str(e), "error_type": type(e).__name__}
+            )
+
+            # Clear GPU cache even on failure
+            try:
+                import torch
 
-                    if torch.cuda.is_available():
-                        torch.cuda.empty_cache()
-                        torch.cuda.synchronize()
-                except Exception:
-                    pass
+                if torch.cuda.is_available():
+                    torch.cuda.empty_cache()
+                    torch.cuda.synchronize()
+            except Exception:
+                pass
 
-                return False
+            return False
+
+        finally:
+            if local_pdf is not None:
+                local_pdf.unlink(missing_ok=True)
 
     def run(self):
         """Main worker processing loop."""
@@ -203,9 +350,24 @@ class DistributedWorker:
         self.logger.info(f"Input: s3://{self.s3_input_bucket}/{self.s3_input_prefix}")
         self.logger.info(f"Output: s3://{self.s3_output_bucket}/{self.s3_output_prefix}")
 
-        # List all PDFs
-        self.logger.info("Listing PDFs from S3...")
-        all_pdfs = list_pdfs_from_s3(self.s3, self.s3_input_bucket, self.s3_input_prefix)
+        if self.queue_url:
+            self.logger.info(f"Queue: {self.queue_url}")
+            successful, failed = self.consume_queue()
+            self.finish(successful, failed, successful + failed)
+            return
+
+        # List all PDFs (from the manifest if the job wrote one)
+        all_pdfs = None
+        if self.manifest_key:
+            self.logger.info(f"Reading PDF manifest {self.manifest_key}...")
+            all_pdfs = read_pdf_manifest(
+                self.s3, self.s3_input_bucket, self.s3_input_prefix, self.manifest_key
+            )
+            if all_pdfs is None:
+                self.logger.warning("No manifest for this input prefix - listing instead")
+        if all_pdfs is None:
+            self.logger.info("Listing PDFs from S3...")
+            all_pdfs = list_pdfs_from_s3(self.s3, self.s3_input_bucket, self.s3_input_prefix)
         self.logger.info(f"Found {len(all_pdfs)} total PDFs")
 
         # Get this worker's slice
@@ -225,28 +387,120 @@ class DistributedWorker:
         )
 
         with ThreadPoolExecutor(max_workers=self.concurrent_pdfs) as executor:
-            # Submit all PDF processing tasks
-            future_to_pdf = {
-                executor.submit(self.process_pdf, pdf_key): pdf_key for pdf_key in my_pdfs
-            }
-
-            # Process results as they complete
-            for i, future in enumerate(as_completed(future_to_pdf), 1):
-                pdf_key = future_to_pdf[future]
-                try:
+            # Keep a few PDFs queued beyond the running ones, so their downloads
+            # overlap with parsing without pulling the whole slice to disk
+            remaining = iter(my_pdfs)
+            future_to_pdf = {}
+            i = 0
+
+            while True:
+                while len(future_to_pdf) < self.concurrent_pdfs + PREFETCH_PDFS:
+                    pdf_key = next(remaining, None)
+                    if pdf_key is None:
+                        break
+                    future_to_pdf[self.submit_pdf(executor, pdf_key)] = pdf_key
+
+                if not future_to_pdf:
+                    break
+
+                # Process results as they complete
+                done, _ = wait(future_to_pdf, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pdf_key = future_to_pdf.pop(future)
+                    i += 1
+                    try:
+                        if future.result():
+                            successful += 1
+                        else:
+                            failed += 1
+                    except Exception as e:
+                        self.logger.error(f"Unexpected error processing {pdf_key}: {e}")
+                        failed += 1
+
+                    # Log progress
+                    self.logger.info(
+                        f"Progress: {i}/{len(my_pdfs)} ({i * 100 // len(my_pdfs)}%) - Success: {successful}, Failed: {failed}"
+                    )
+
+        self.finish(successful, failed, len(my_pdfs))
+
+    def consume_queue(self) -> Tuple[int, int]:
+        """
+        Process PDFs pulled from the shared work queue until it is drained.
+
+        New PDFs are claimed whenever a slot frees up, so the worker stays busy
+        as long as there is work left anywhere. A PDF is deleted from the queue
+        once processed; a failed one is released for an immediate retry, until
+        it has been tried 1 + MAX_RETRIES times. Claimed PDFs have their
+        visibility extended while they wait or run, and the worker only exits
+        once no PDF is in flight anywhere (one may still fail and reappear).
+
+        Returns:
+            (successful, failed) PDF counts
+        """
+        successful = 0
+        failed = 0
+        pending: Dict = {}
+        # Extend claims well before they expire
+        heartbeat = max(self.queue_visibility_timeout // 3, 1)
+        last_extended = time.monotonic()
+
+        with ThreadPoolExecutor(max_workers=self.concurrent_pdfs) as executor:
+            while True:
+                free_slots = self.concurrent_pdfs + PREFETCH_PDFS - len(pending)
+                if free_slots > 0:
+                    # Only long-poll when there is nothing else to wait for
+                    messages = receive_pdf_messages(
+                        self.sqs,
+                        self.queue_url,
+                        free_slots,
+                        self.queue_visibility_timeout,
+                        wait_seconds=0 if pending else 20,
+                    )
+                    for message in messages:
+                        pending[self.submit_pdf(executor, message["Body"])] = message
+
+                if not pending:
+                    in_flight = count_in_flight(self.sqs, self.queue_url)
+                    if in_flight == 0:
+                        break
+                    self.logger.info(f"Queue empty, {in_flight} PDFs in flight - polling again")
+                    continue
+
+                done, _ = wait(pending, timeout=heartbeat, return_when=FIRST_COMPLETED)
+
+                if time.monotonic() - last_extended >= heartbeat:
+                    unfinished = [
+                        message for future, message in pending.items() if future not in done
+                    ]
+                    try:
+                        extend_pdf_messages(
+                            self.sqs, self.queue_url, unfinished, self.queue_visibility_timeout
+                        )
+                    except Exception as e:
+                        self.logger.warning(f"Failed to extend queue visibility: {e}")
+                    last_extended = time.monotonic()
+
+                for future in done:
+                    message = pending.pop(future)
+                    attempts = int(message["Attributes"]["ApproximateReceiveCount"])
+
                     if future.result():
                         successful += 1
-                    else:
+                    elif attempts > self.max_retries:
                         failed += 1
-                except Exception as e:
-                    self.logger.error(f"Unexpected error processing {pdf_key}: {e}")
-                    failed += 1
+                    else:
+                        self.logger.info(f"Releasing {message['Body']} for retry")
+                        release_pdf_message(self.sqs, self.queue_url, message)
+                        continue
 
-                # Log progress
-                self.logger.info(
-                    f"Progress: {i}/{len(my_pdfs)} ({i * 100 // len(my_pdfs)}%) - Success: {successful}, Failed: {failed}"
-                )
+                    delete_pdf_message(self.sqs, self.queue_url, message)
+                    self.logger.info(f"Progress: Success: {successful}, Failed: {failed}")
+
+        return successful, failed
 
+    def finish(self, successful: int, failed: int, total: int):
+        """Upload the failure report, log a summary and exit non-zero on failures."""
         # Upload failure report if any
         if self.failures:
             self.upload_failure_report()
@@ -254,8 +508,8 @@ class DistributedWorker:
         # Summary
         self.logger.info(f"\n{'=' * 60}")
         self.logger.info(f"Worker {self.worker_id} completed!")
-        self.logger.info(f"  Successful: {successful}/{len(my_pdfs)}")
-        self.logger.info(f"  Failed: {failed}/{len(my_pdfs)}")
+        self.logger.info(f"  Successful: {successful}/{total}")
+        self.logger.info(f"  Failed: {failed}/{total}")
         self.logger.info(f"{'=' * 60}\n")
 
         # Exit with error code if any failures
@@ -6,40 +6,76 @@ Usage:
     python scripts/embed_and_index.py
     python scripts/embed_and_index.py --chunk-type coarse  # Only coarse chunks
     python scripts/embed_and_index.py --dry-run            # Estimate costs without processing
+    python scripts/embed_and_index.py --index-type flat    # Exact (brute-force) index
 """
 
 import sys
 import os
-import json
+import io
+import hashlib
 import argparse
 import numpy as np
 from pathlib import Path
-from typing import List, Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Set, Tuple
 from tqdm import tqdm
-import boto3
 import faiss
+import orjson
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from rag_pipeline.rag.openai_embedder import OpenAIEmbedder
+from rag_pipeline.storage.s3 import create_s3_client
 
 
 # Configuration
 BUCKET_NAME = "cs433-rag-project2"
 CHUNKS_PREFIX = "chunks/"
 INDEX_PREFIX = "indexes/"
+CHECKPOINT_PREFIX = f"{INDEX_PREFIX}partial/"
+EMBEDDING_CACHE_DIR = Path.home() / ".cache" / "rag" / "embeddings"
 EMBEDDING_MODEL = "text-embedding-3-small"
 EMBEDDING_DIM = 1536
-BATCH_SIZE = 100
-
-
-def load_all_chunks(s3_client, chunk_type: str) -> Tuple[List[Dict], List[str]]:
+BATCH_SIZE = 1024
+LOAD_WORKERS = 32
+EMBED_WORKERS = 16
+COST_SAMPLE_SIZE = 200
+
+# Chunk fields kept as index metadata
+METADATA_COLUMNS = (
+    "chunk_id",
+    "paper_id",
+    "paper_title",
+    "text",
+    "section_hierarchy",
+    "chunk_index",
+    "char_start",
+    "char_end",
+)
+
+# FAISS index parameters
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 200
+HNSW_EF_SEARCH = 128
+IVF_MAX_LISTS = 4096
+IVF_MIN_TRAIN = 10_000
+IVF_NPROBE = 32
+PQ_SUBQUANTIZERS = 64  # must divide EMBEDDING_DIM
+
+
+def load_all_chunks(s3_client, chunk_type: str) -> Tuple[pa.Table, List[str]]:
     """
     Load all chunks of a given type from S3.
 
+    Chunk metadata is gathered column by column (one list per field, then one
+    Arrow table) rather than as a dict per chunk, which keeps the per-chunk
+    Python object overhead out of large corpora.
+
     Returns:
-        Tuple of (list of chunk dicts, list of texts for embedding)
+        Tuple of (table of chunk metadata, one row per chunk, list of texts for embedding)
     """
     print(f"\nLoading {chunk_type} chunks from S3...")
 
@@ -56,80 +92,180 @@ def load_all_chunks(s3_client, chunk_type: str) -> Tuple[List[Dict], List[str]]:
 
     print(f"Found {len(chunk_files)} {chunk_type} chunk files")
 
-    # Load all chunks
-    all_chunks = []
-    all_texts = []
+    # Load all chunks, one list per metadata column
+    columns: Dict[str, list] = {name: [] for name in METADATA_COLUMNS}
 
-    for key in tqdm(chunk_files, desc=f"Loading {chunk_type} chunks"):
+    def fetch(key: str) -> Optional[List[Tuple]]:
+        """Download one chunk file and convert its chunks to metadata rows."""
         try:
             response = s3_client.get_object(Bucket=BUCKET_NAME, Key=key)
-            data = json.loads(response["Body"].read().decode("utf-8"))
-
-            for chunk in data.get("chunks", []):
-                # Store full chunk metadata
-                all_chunks.append(
-                    {
-                        "chunk_id": chunk["chunk_id"],
-                        "paper_id": chunk["paper_id"],
-                        "paper_title": chunk["paper_title"],
-                        "text": chunk["text"],
-                        "section_hierarchy": chunk["section_hierarchy"],
-                        "chunk_index": chunk["chunk_index"],
-                        "char_start": chunk["char_start"],
-                        "char_end": chunk["char_end"],
-                    }
-                )
-                all_texts.append(chunk["text"])
-
+            data = orjson.loads(response["Body"].read())
+            # Build every row before returning, so a malformed chunk skips the
+            # whole file instead of leaving the columns ragged
+            return [
+                tuple(chunk[name] for name in METADATA_COLUMNS) for chunk in data.get("chunks", [])
+            ]
         except Exception as e:
             print(f"\nError loading {key}: {e}")
-            continue
+            return None
+
+    # Many small files: keep GETs in flight concurrently; map() keeps file order
+    with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as executor:
+        for rows in tqdm(
+            executor.map(fetch, chunk_files),
+            total=len(chunk_files),
+            desc=f"Loading {chunk_type} chunks",
+        ):
+            if rows is None:
+                continue
+
+            # Store full chunk metadata
+            for row in rows:
+                for values, value in zip(columns.values(), row):
+                    values.append(value)
+
+    all_texts = columns["text"]
+    table = pa.table(columns)
 
-    print(f"Loaded {len(all_chunks)} {chunk_type} chunks total")
-    return all_chunks, all_texts
+    print(f"Loaded {table.num_rows} {chunk_type} chunks total")
+    return table, all_texts
 
 
 def estimate_cost(texts: List[str], embedder: OpenAIEmbedder) -> Tuple[float, int]:
-    """Estimate embedding cost."""
-    total_tokens = sum(
-        embedder.calculate_tokens(text) for text in tqdm(texts[:100], desc="Estimating tokens")
-    )
-    avg_tokens = total_tokens / min(len(texts), 100)
+    """Estimate embedding cost from the token count of a sample, projected to all texts."""
+    # One batched (multi-threaded) tiktoken call over the sample
+    sample = texts[:COST_SAMPLE_SIZE]
+    total_tokens = sum(embedder.calculate_tokens_batch(sample))
+    avg_tokens = total_tokens / len(sample)
     total_estimated_tokens = int(avg_tokens * len(texts))
     cost = embedder.calculate_cost(total_estimated_tokens)
     return cost, total_estimated_tokens
 
 
+def checkpoint_key(prefix: str, start: int, texts: List[str]) -> str:
+    """S3 key of the checkpoint for the slab of texts starting at start."""
+    digest = hashlib.sha256("\0".join(texts).encode("utf-8")).hexdigest()[:16]
+    return f"{prefix}{start:09d}-{digest}.npy"
+
+
+def list_checkpoints(s3_client, prefix: str) -> Set[str]:
+    """List the embedding checkpoints saved under prefix."""
+    paginator = s3_client.get_paginator("list_objects_v2")
+    return {
+        obj["Key"]
+        for page in paginator.paginate(Bucket=BUCKET_NAME, Prefix=prefix)
+        for obj in page.get("Contents", [])
+    }
+
+
+def clear_checkpoints(s3_client, prefix: str):
+    """Delete the embedding checkpoints saved under prefix."""
+    keys = sorted(list_checkpoints(s3_client, prefix))
+    for i in range(0, len(keys), 1000):
+        s3_client.delete_objects(
+            Bucket=BUCKET_NAME,
+            Delete={"Objects": [{"Key": key} for key in keys[i : i + 1000]]},
+        )
+
+
 def generate_embeddings(
-    texts: List[str], embedder: OpenAIEmbedder, batch_size: int = 100
+    texts: List[str],
+    embedder: OpenAIEmbedder,
+    batch_size: int = BATCH_SIZE,
+    s3_client=None,
+    checkpoint_prefix: Optional[str] = None,
 ) -> np.ndarray:
-    """Generate embeddings for all texts with progress bar."""
+    """
+    Generate embeddings for all texts with progress bar.
+
+    With a checkpoint prefix, each slab is saved to S3 as soon as it is embedded
+    and slabs saved by an earlier (crashed) run are loaded instead of paid for
+    again. Checkpoint keys include a digest of the slab's texts, so a changed
+    corpus never reuses stale vectors.
+    """
     print(f"\nGenerating embeddings for {len(texts)} texts...")
 
-    all_embeddings = []
+    # Fill one preallocated matrix instead of joining per-slab blocks at the end
+    embeddings = np.empty((len(texts), embedder.get_embedding_dimension()), dtype=np.float32)
+
+    # Hand the embedder enough texts per call to keep all of its request
+    # threads busy, rather than one batch (one serial request) at a time
+    step = batch_size * embedder.max_workers
+
+    saved = list_checkpoints(s3_client, checkpoint_prefix) if checkpoint_prefix else set()
+    if saved:
+        print(f"Found {len(saved)} embedding checkpoints to resume from")
+
+    with tqdm(total=len(texts), desc="Embedding", unit="text") as progress:
+        for i in range(0, len(texts), step):
+            batch = texts[i : i + step]
+            key = checkpoint_key(checkpoint_prefix, i, batch) if checkpoint_prefix else None
+
+            slab = embeddings[i : i + len(batch)]
+
+            if key in saved:
+                body = s3_client.get_object(Bucket=BUCKET_NAME, Key=key)["Body"].read()
+                slab[:] = np.load(io.BytesIO(body))
+            else:
+                # Generate embeddings for the slab straight into its rows
+                slab[:] = embedder.generate_embeddings_array(batch)
 
-    for i in tqdm(range(0, len(texts), batch_size), desc="Embedding batches"):
-        batch = texts[i : i + batch_size]
+                # Normalize for cosine similarity while the slab is still in cache
+                faiss.normalize_L2(slab)
 
-        # Generate embeddings for batch
-        batch_embeddings = embedder.generate_embeddings_batch(batch)
-        all_embeddings.extend(batch_embeddings)
+                if key is not None:
+                    buffer = io.BytesIO()
+                    np.save(buffer, slab)
+                    s3_client.put_object(Bucket=BUCKET_NAME, Key=key, Body=buffer.getvalue())
 
-    # Convert to numpy array and normalize for cosine similarity
-    embeddings = np.array(all_embeddings, dtype=np.float32)
-    faiss.normalize_L2(embeddings)
+            progress.update(len(batch))
 
     print(f"Generated {len(embeddings)} embeddings with shape {embeddings.shape}")
     return embeddings
 
 
-def build_faiss_index(embeddings: np.ndarray) -> faiss.Index:
-    """Build FAISS index from embeddings."""
-    print("\nBuilding FAISS index...")
+def build_faiss_index(embeddings: np.ndarray, index_type: str = "hnsw") -> faiss.Index:
+    """
+    Build FAISS index from embeddings.
+
+    All index types score by inner product, i.e. cosine similarity on the
+    normalized vectors:
+      - flat: exact brute-force search, O(N) per query
+      - hnsw: graph search, sublinear per query at a small recall cost
+      - ivfpq: inverted lists over product-quantized codes (64 bytes per vector),
+        for corpora too large to keep as full float32 vectors
+    """
+    print(f"\nBuilding FAISS index ({index_type})...")
 
-    # Use IndexFlatIP for cosine similarity (with normalized vectors)
     dimension = embeddings.shape[1]
-    index = faiss.IndexFlatIP(dimension)
+
+    if index_type == "ivfpq" and len(embeddings) < IVF_MIN_TRAIN:
+        print(f"Only {len(embeddings)} vectors - too few to train IVFPQ, using HNSW")
+        index_type = "hnsw"
+
+    if index_type == "flat":
+        index = faiss.IndexFlatIP(dimension)
+
+    elif index_type == "hnsw":
+        index = faiss.IndexHNSWFlat(dimension, HNSW_M, faiss.METRIC_INNER_PRODUCT)
+        index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+        # Saved with the index, so the API searches with it too
+        index.hnsw.efSearch = HNSW_EF_SEARCH
+
+    elif index_type == "ivfpq":
+        # ~4 * sqrt(N) lists, capped so each centroid has the 39 training points
+        # k-means asks for
+        n = len(embeddings)
+        nlist = min(IVF_MAX_LISTS, int(4 * np.sqrt(n)), n // 39)
+        quantizer = faiss.IndexFlatIP(dimension)
+        index = faiss.IndexIVFPQ(
+            quantizer, dimension, nlist, PQ_SUBQUANTIZERS, 8, faiss.METRIC_INNER_PRODUCT
+        )
+        index.train(embeddings)
+        index.nprobe = IVF_NPROBE
+
+    else:
+        raise ValueError(f"Unknown index type: {index_type}")
 
     # Add vectors
     index.add(embeddings)
@@ -138,7 +274,7 @@ def build_faiss_index(embeddings: np.ndarray) -> faiss.Index:
     return index
 
 
-def save_to_s3(s3_client, index: faiss.Index, metadata: List[Dict], chunk_type: str):
+def save_to_s3(s3_client, index: faiss.Index, metadata: pa.Table, chunk_type: str):
     """Save FAISS index and metadata to S3."""
     import tempfile
 
@@ -154,16 +290,18 @@ def save_to_s3(s3_client, index: faiss.Index, metadata: List[Dict], chunk_type:
     s3_client.upload_file(index_path, BUCKET_NAME, index_key)
     os.unlink(index_path)
 
-    # Save metadata (mapping index position to chunk details)
-    metadata_dict = {str(i): meta for i, meta in enumerate(metadata)}
-    metadata_key = f"{INDEX_PREFIX}{chunk_type}_metadata.json"
+    # Save metadata (row i describes index position i) as Parquet: columnar,
+    # dictionary-encoded (paper ids/titles repeat across chunks) and compressed
+    metadata_key = f"{INDEX_PREFIX}{chunk_type}_metadata.parquet"
+    buffer = io.BytesIO()
+    pq.write_table(metadata, buffer, compression="zstd")
 
     print(f"Uploading metadata to s3://{BUCKET_NAME}/{metadata_key}...")
     s3_client.put_object(
         Bucket=BUCKET_NAME,
         Key=metadata_key,
-        Body=json.dumps(metadata_dict, indent=2).encode("utf-8"),
-        ContentType="application/json",
+        Body=buffer.getvalue(),
+        ContentType="application/vnd.apache.parquet",
     )
 
     print(f"Saved index ({index.ntotal} vectors) and metadata to S3")
@@ -177,6 +315,12 @@ def main():
         default="both",
         help="Which chunk type to process",
     )
+    parser.add_argument(
+        "--index-type",
+        choices=["flat", "hnsw", "ivfpq"],
+        default="hnsw",
+        help="FAISS index to build (flat = exact search)",
+    )
     parser.add_argument("--dry-run", action="store_true", help="Estimate costs without processing")
     args = parser.parse_args()
 
@@ -193,8 +337,15 @@ def main():
     print(f"Dimensions: {EMBEDDING_DIM}")
 
     # Initialize clients
-    s3_client = boto3.client("s3")
-    embedder = OpenAIEmbedder(api_key=api_key, model=EMBEDDING_MODEL, batch_size=BATCH_SIZE)
+    s3_client = create_s3_client()
+    embedder = OpenAIEmbedder(
+        api_key=api_key,
+        model=EMBEDDING_MODEL,
+        batch_size=BATCH_SIZE,
+        max_workers=EMBED_WORKERS,
+        # Texts shared across runs and chunk types are embedded (and billed) once
+        cache_dir=EMBEDDING_CACHE_DIR,
+    )
 
     chunk_types = ["coarse", "fine"] if args.chunk_type == "both" else [args.chunk_type]
 
@@ -206,7 +357,7 @@ def main():
         # Load chunks
         chunks, texts = load_all_chunks(s3_client, chunk_type)
 
-        if not chunks:
+        if chunks.num_rows == 0:
             print(f"No {chunk_type} chunks found!")
             continue
 
@@ -225,14 +376,20 @@ def main():
             continue
 
         # Generate embeddings
-        embeddings = generate_embeddings(texts, embedder, BATCH_SIZE)
+        checkpoint_prefix = f"{CHECKPOINT_PREFIX}{chunk_type}/"
+        embeddings = generate_embeddings(
+            texts, embedder, BATCH_SIZE, s3_client, checkpoint_prefix=checkpoint_prefix
+        )
 
         # Build index
-        index = build_faiss_index(embeddings)
+        index = build_faiss_index(embeddings, args.index_type)
 
         # Save to S3
         save_to_s3(s3_client, index, chunks, chunk_type)
 
+        # The index is saved, so the checkpoints are no longer needed
+        clear_checkpoints(s3_client, checkpoint_prefix)
+
     print("\n" + "=" * 60)
     print("COMPLETE")
     print("=" * 60)
@@ -9,7 +9,6 @@ from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List
 
-import boto3
 from loguru import logger
 
 from rag_pipeline.pdf_parsing import (
@@ -18,6 +17,7 @@ from rag_pipeline.pdf_parsing import (
     DolphinModelConfig,
     OutputConfig,
 )
+from rag_pipeline.storage.s3 import create_s3_client
 
 # Configure loguru for production use
 logger.remove()  # Remove default handler
@@ -127,7 +127,7 @@ def main():
     logger.info(f"Using S3 bucket: {bucket}")
 
     # Initialize S3 client
-    s3_client = boto3.client("s3")
+    s3_client = create_s3_client()
 
     # Find unprocessed PDFs
     unprocessed = find_unprocessed_pdfs(s3_client, bucket)
@@ -13,6 +13,7 @@ import argparse
 from typing import Dict, List, Callable
 import json
 import logging
+import os
 from tqdm.auto import tqdm
 import numpy as np
 from dotenv import load_dotenv
@@ -24,6 +25,7 @@ from rag_pipeline.benchmarking import (
     calculate_chunk_statistics,
     calculate_coherence_score,
     calculate_boundary_quality,
+    embed_sentences,
     evaluate_citation_integrity,
     ChunkMetrics,
     create_size_distribution_plot,
@@ -42,18 +44,33 @@ logger = logging.getLogger(__name__)
 # Load environment variables from .env
 load_dotenv()
 
+# Texts per embedding request and requests in flight for --with-embeddings
+EMBED_BATCH_SIZE = 128
+EMBED_CONCURRENCY = 8
+
 
 def get_embedding_function(use_openai: bool = False):
     """Get embedding function for coherence/boundary analysis."""
     if use_openai:
         try:
-            from openai import OpenAI
+            from rag_pipeline.rag.openai_embedder import OpenAIEmbedder
 
-            client = OpenAI()
+            # Requests of EMBED_BATCH_SIZE texts, EMBED_CONCURRENCY of them in flight
+            embedder = OpenAIEmbedder(
+                api_key=os.environ["OPENAI_API_KEY"],
+                model="text-embedding-3-small",
+                batch_size=EMBED_BATCH_SIZE,
+                max_workers=EMBED_CONCURRENCY,
+            )
 
             def embed_fn(texts: List[str]) -> np.ndarray:
-                response = client.embeddings.create(model="text-embedding-3-small", input=texts)
-                return np.array([item.embedding for item in response.data])
+                # Sort by length so each request carries similarly sized inputs,
+                # then scatter the rows back to the caller's order
+                order = np.argsort([len(text) for text in texts], kind="stable")
+                sorted_embeddings = embedder.generate_embeddings_array([texts[i] for i in order])
+                embeddings = np.empty_like(sorted_embeddings)
+                embeddings[order] = sorted_embeddings
+                return embeddings
 
             return embed_fn
         except Exception as e:
@@ -113,9 +130,15 @@ def evaluate_strategy(
         sample_size = min(20, len(all_coarse_chunks))
         sample_indices = np.random.choice(len(all_coarse_chunks), sample_size, replace=False)
 
-        for idx in tqdm(sample_indices, desc=f"{strategy_name}: Coherence", leave=False):
-            chunk = all_coarse_chunks[idx]
-            score = calculate_coherence_score(chunk.text, embedding_fn)
+        # Embed every sampled sentence in one batched call, then score per chunk
+        sample_texts = [all_coarse_chunks[idx].text for idx in sample_indices]
+        embeddings, offsets = embed_sentences(sample_texts, embedding_fn)
+
+        for i, text in enumerate(
+            tqdm(sample_texts, desc=f"{strategy_name}: Coherence", leave=False)
+        ):
+            block = embeddings[offsets[i] : offsets[i + 1]]
+            score = calculate_coherence_score(text, precomputed=block)
             coherence_scores.append(score)
 
     # Boundary quality analysis (optional - expensive)
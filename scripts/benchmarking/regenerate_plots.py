@@ -11,9 +11,12 @@ Usage:
 
 import argparse
 import sys
-import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import orjson
+import plotly.io as pio
+
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -58,8 +61,8 @@ def main():
         print(f"Error: JSON file not found: {json_path}")
         sys.exit(1)
 
-    with open(json_path, "r") as f:
-        data = json.load(f)
+    # orjson parses the whole report several times faster than json.load
+    data = orjson.loads(json_path.read_bytes())
 
     print(f"Loaded data from {json_path}")
 
@@ -94,21 +97,33 @@ def main():
 
     print(f"Saving plots to {plots_dir}...")
     plot_files = {}
-    for plot_name, fig in plots.items():
-        # Save as HTML (interactive)
-        html_path = plots_dir / f"{plot_name}.html"
-        fig.write_html(str(html_path))
-        plot_files[f"{plot_name}.html"] = html_path
-
+    for plot_name in plots:
+        for ext in ("html", "png", "pdf"):
+            plot_files[f"{plot_name}.{ext}"] = plots_dir / f"{plot_name}.{ext}"
+
+    figs = list(plots.values())
+    with ThreadPoolExecutor() as executor:
+        # Save as HTML (interactive) in the background; pure Python, no Kaleido
+        html_writes = [
+            executor.submit(fig.write_html, str(plot_files[f"{plot_name}.html"]))
+            for plot_name, fig in plots.items()
+        ]
+
+        # Static exports go through write_images, which renders every figure in a
+        # single Kaleido browser session instead of starting one per write_image
         # Save as PNG (static, high resolution)
-        png_path = plots_dir / f"{plot_name}.png"
-        fig.write_image(str(png_path), width=1200, height=800, scale=2)
-        plot_files[f"{plot_name}.png"] = png_path
-
+        pio.write_images(
+            figs,
+            [str(plot_files[f"{name}.png"]) for name in plots],
+            width=1200,
+            height=800,
+            scale=2,
+        )
         # Save as PDF (vector, publication quality)
-        pdf_path = plots_dir / f"{plot_name}.pdf"
-        fig.write_image(str(pdf_path))
-        plot_files[f"{plot_name}.pdf"] = pdf_path
+        pio.write_images(figs, [str(plot_files[f"{name}.pdf"]) for name in plots])
+
+        for write in html_writes:
+            write.result()
 
     print(f"✓ Saved {len(plots)} plots in 3 formats (HTML, PNG, PDF)")
 
@@ -2,11 +2,13 @@
 AWS S3 utilities for loading markdown documents and metadata.
 """
 
-import boto3
 import json
+import orjson
 from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 
+from rag_pipeline.storage.s3 import create_s3_client
+
 
 class S3MarkdownLoader:
     """Load markdown documents and metadata from S3"""
@@ -21,7 +23,7 @@ class S3MarkdownLoader:
         """
         self.bucket_name = bucket_name
         self.prefix = prefix
-        self.s3_client = boto3.client("s3")
+        self.s3_client = create_s3_client()
 
     def list_paper_ids(self) -> List[str]:
         """
@@ -148,11 +150,10 @@ class S3MarkdownLoader:
         key = f"{output_prefix}{paper_id}_{chunk_type}_chunks.json"
 
         try:
-            json_data = json.dumps(chunks, indent=2)
             self.s3_client.put_object(
                 Bucket=self.bucket_name,
                 Key=key,
-                Body=json_data.encode("utf-8"),
+                Body=orjson.dumps(chunks),
                 ContentType="application/json",
             )
             print(f"Saved {len(chunks)} {chunk_type} chunks to s3://{self.bucket_name}/{key}")
@@ -0,0 +1,87 @@
+"""PDF manifest for distributed workers.
+
+Listing thousands of PDFs takes many paginated ListObjectsV2 calls, and every
+worker would otherwise repeat the same full listing only to keep 1/N of it.
+Instead, list once when launching the job and store the keys as a manifest;
+workers started with PDF_MANIFEST_KEY read that single object.
+
+    S3_INPUT_BUCKET=... python -m scripts.utils.pdf_manifest
+"""
+
+import os
+from typing import List, Optional
+
+import orjson
+from botocore.exceptions import ClientError
+
+from scripts.utils.s3_utils import list_pdfs_from_s3
+
+DEFAULT_MANIFEST_KEY = "manifest/pdfs.json"
+
+
+def write_pdf_manifest(s3_client, bucket: str, prefix: str, manifest_key: str) -> List[str]:
+    """
+    List the PDFs under a prefix once and store them as a manifest.
+
+    Args:
+        s3_client: boto3 S3 client
+        bucket: S3 bucket holding the PDFs (the manifest is stored there too)
+        prefix: Prefix of the PDFs (e.g., 'raw_pdfs/')
+        manifest_key: S3 key of the manifest
+
+    Returns:
+        Sorted list of PDF object keys
+    """
+    pdf_keys = list_pdfs_from_s3(s3_client, bucket, prefix)
+    s3_client.put_object(
+        Bucket=bucket,
+        Key=manifest_key,
+        Body=orjson.dumps({"prefix": prefix, "pdfs": pdf_keys}),
+        ContentType="application/json",
+    )
+    return pdf_keys
+
+
+def read_pdf_manifest(
+    s3_client, bucket: str, prefix: str, manifest_key: str
+) -> Optional[List[str]]:
+    """
+    Read the PDF keys from a manifest.
+
+    Args:
+        s3_client: boto3 S3 client
+        bucket: S3 bucket holding the manifest
+        prefix: Prefix the caller expects the PDFs under
+        manifest_key: S3 key of the manifest
+
+    Returns:
+        Sorted list of PDF object keys, or None if there is no manifest for
+        this prefix (the caller should list the bucket instead)
+    """
+    try:
+        response = s3_client.get_object(Bucket=bucket, Key=manifest_key)
+    except ClientError as e:
+        if e.response["Error"]["Code"] in ("404", "NoSuchKey"):
+            return None
+        raise
+
+    manifest = orjson.loads(response["Body"].read())
+    if manifest.get("prefix") != prefix:
+        return None
+    return manifest["pdfs"]
+
+
+def main():
+    """List the input PDFs once and upload the manifest."""
+    from rag_pipeline.storage.s3 import create_s3_client
+
+    bucket = os.environ["S3_INPUT_BUCKET"]
+    prefix = os.getenv("S3_INPUT_PREFIX", "pdfs/")
+    manifest_key = os.getenv("PDF_MANIFEST_KEY", DEFAULT_MANIFEST_KEY)
+
+    pdf_keys = write_pdf_manifest(create_s3_client(), bucket, prefix, manifest_key)
+    print(f"Wrote manifest of {len(pdf_keys)} PDFs to s3://{bucket}/{manifest_key}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""SQS work queue utilities for distributed PDF processing.
+
+Instead of each worker taking a fixed slice of the PDFs, the keys are pushed
+once into a shared queue and every worker pulls the next PDF as soon as it has
+capacity, so fast workers never sit idle while a slow one finishes its slice.
+
+Seed the queue once per job:
+
+    PDF_QUEUE_URL=... S3_INPUT_BUCKET=... python -m scripts.utils.pdf_queue
+"""
+
+import hashlib
+import os
+from typing import Dict, List
+
+# SQS accepts at most 10 messages per batch call
+SQS_BATCH_SIZE = 10
+
+
+def seed_pdf_queue(sqs_client, queue_url: str, pdf_keys: List[str]) -> int:
+    """
+    Push PDF keys into the work queue.
+
+    Args:
+        sqs_client: boto3 SQS client
+        queue_url: URL of the work queue
+        pdf_keys: S3 keys of the PDFs to process
+
+    Returns:
+        Number of keys enqueued
+    """
+    fifo = queue_url.endswith(".fifo")
+    enqueued = 0
+
+    for i in range(0, len(pdf_keys), SQS_BATCH_SIZE):
+        entries = []
+        for j, pdf_key in enumerate(pdf_keys[i : i + SQS_BATCH_SIZE]):
+            entry = {"Id": str(j), "MessageBody": pdf_key}
+            if fifo:
+                # One group per key, so receivers are not serialized behind each other
+                digest = hashlib.sha256(pdf_key.encode("utf-8")).hexdigest()
+                entry["MessageGroupId"] = digest
+                entry["MessageDeduplicationId"] = digest
+            entries.append(entry)
+
+        response = sqs_client.send_message_batch(QueueUrl=queue_url, Entries=entries)
+        failed = response.get("Failed", [])
+        if failed:
+            raise RuntimeError(f"Failed to enqueue {len(failed)} PDFs: {failed[0]}")
+        enqueued += len(entries)
+
+    return enqueued
+
+
+def receive_pdf_messages(
+    sqs_client,
+    queue_url: str,
+    max_messages: int,
+    visibility_timeout: int,
+    wait_seconds: int = 20,
+) -> List[Dict]:
+    """
+    Claim up to max_messages PDFs from the work queue.
+
+    Claimed messages are hidden from other workers for visibility_timeout
+    seconds; if they are not deleted by then (e.g. the worker crashed), they
+    reappear and another worker retries them.
+
+    Args:
+        sqs_client: boto3 SQS client
+        queue_url: URL of the work queue
+        max_messages: Maximum number of messages to claim (at most 10)
+        visibility_timeout: Seconds a claimed message stays hidden
+        wait_seconds: Long-poll duration when the queue is empty
+
+    Returns:
+        Claimed messages (Body is the PDF key), empty if the queue is drained
+    """
+    response = sqs_client.receive_message(
+        QueueUrl=queue_url,
+        MaxNumberOfMessages=min(max_messages, SQS_BATCH_SIZE),
+        VisibilityTimeout=visibility_timeout,
+        WaitTimeSeconds=wait_seconds,
+        AttributeNames=["ApproximateReceiveCount"],
+    )
+    return response.get("Messages", [])
+
+
+def delete_pdf_message(sqs_client, queue_url: str, message: Dict) -> None:
+    """
+    Remove a finished PDF from the work queue.
+
+    Args:
+        sqs_client: boto3 SQS client
+        queue_url: URL of the work queue
+        message: Message returned by receive_pdf_messages
+    """
+    sqs_client.delete_message(QueueUrl=queue_url, ReceiptHandle=message["ReceiptHandle"])
+
+
+def extend_pdf_messages(
+    sqs_client, queue_url: str, messages: List[Dict], visibility_timeout: int
+) -> None:
+    """
+    Keep claimed PDFs hidden from other workers for another visibility_timeout.
+
+    Called periodically while PDFs wait or run locally, so a long PDF (or one
+    buffered behind others) is not handed to a second worker mid-processing.
+
+    Args:
+        sqs_client: boto3 SQS client
+        queue_url: URL of the work queue
+        messages: Messages returned by receive_pdf_messages
+        visibility_timeout: Seconds from now the messages stay hidden
+    """
+    for i in range(0, len(messages), SQS_BATCH_SIZE):
+        entries = [
+            {
+                "Id": str(j),
+                "ReceiptHandle": message["ReceiptHandle"],
+                "VisibilityTimeout": visibility_timeout,
+            }
+            for j, message in enumerate(messages[i : i + SQS_BATCH_SIZE])
+        ]
+        sqs_client.change_message_visibility_batch(QueueUrl=queue_url, Entries=entries)
+
+
+def release_pdf_message(sqs_client, queue_url: str, message: Dict) -> None:
+    """
+    Make a claimed PDF visible again right away, so it is retried without
+    waiting for its visibility timeout to expire.
+
+    Args:
+        sqs_client: boto3 SQS client
+        queue_url: URL of the work queue
+        message: Message returned by receive_pdf_messages
+    """
+    sqs_client.change_message_visibility(
+        QueueUrl=queue_url, ReceiptHandle=message["ReceiptHandle"], VisibilityTimeout=0
+    )
+
+
+def count_in_flight(sqs_client, queue_url: str) -> int:
+    """
+    Approximate number of PDFs currently claimed by some worker.
+
+    Args:
+        sqs_client: boto3 SQS client
+        queue_url: URL of the work queue
+
+    Returns:
+        Messages received but not yet deleted (they may still reappear)
+    """
+    response = sqs_client.get_queue_attributes(
+        QueueUrl=queue_url, AttributeNames=["ApproximateNumberOfMessagesNotVisible"]
+    )
+    return int(response["Attributes"]["ApproximateNumberOfMessagesNotVisible"])
+
+
+def main():
+    """Seed the work queue with every PDF under the input prefix."""
+    import boto3
+
+    from rag_pipeline.storage.s3 import create_s3_client
+    from scripts.utils.s3_utils import list_pdfs_from_s3
+
+    queue_url = os.environ["PDF_QUEUE_URL"]
+    bucket = os.environ["S3_INPUT_BUCKET"]
+    prefix = os.getenv("S3_INPUT_PREFIX", "pdfs/")
+
+    pdf_keys = list_pdfs_from_s3(create_s3_client(), bucket, prefix)
+    enqueued = seed_pdf_queue(boto3.client("sqs"), queue_url, pdf_keys)
+    print(f"Enqueued {enqueued} PDFs from s3://{bucket}/{prefix} into {queue_url}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Move legacy flat markdown outputs into the per-PDF folder layout.
+
+Older runs wrote processed/{PDF_NAME}.md; workers now write and check
+processed/{PDF_ID}/document.md. Copying the old files into place (server-side,
+no re-processing and no data through this machine) lets workers skip PDFs that
+were already parsed.
+
+    S3_OUTPUT_BUCKET=... python -m scripts.utils.relocate_outputs
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict
+
+from rag_pipeline.storage.s3 import create_s3_client
+from scripts.utils.s3_utils import copy_in_s3, list_s3_keys
+from scripts.utils.worker_distribution import extract_pdf_id
+
+COPY_WORKERS = 16
+
+
+def plan_relocations(s3_client, bucket: str, prefix: str) -> Dict[str, str]:
+    """
+    Find legacy outputs that have no document.md in the new layout yet.
+
+    Args:
+        s3_client: boto3 S3 client
+        bucket: S3 bucket name
+        prefix: Output prefix (e.g., 'processed/')
+
+    Returns:
+        Mapping of legacy key to its new document.md key
+    """
+    keys = list_s3_keys(s3_client, bucket, prefix, suffix=".md")
+    moves = {}
+
+    for key in keys:
+        # Legacy files sit directly under the prefix, not in a PDF folder
+        name = key[len(prefix) :]
+        if "/" in name:
+            continue
+
+        # extract_pdf_id only strips .pdf, so hand it the name without .md
+        dest_key = f"{prefix}{extract_pdf_id(Path(name).stem)}/document.md"
+        if dest_key not in keys:
+            moves[key] = dest_key
+
+    return moves
+
+
+def main():
+    """Copy every legacy output to its document.md key."""
+    bucket = os.environ["S3_OUTPUT_BUCKET"]
+    prefix = os.getenv("S3_OUTPUT_PREFIX", "processed/")
+    s3_client = create_s3_client()
+
+    moves = plan_relocations(s3_client, bucket, prefix)
+    print(f"Relocating {len(moves)} legacy outputs in s3://{bucket}/{prefix}")
+
+    with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+        # Consume the results so a failed copy is raised
+        list(
+            executor.map(
+                lambda move: copy_in_s3(s3_client, bucket, *move),
+                moves.items(),
+            )
+        )
+
+    print("Done (legacy files were left in place)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,10 @@
 """S3 utility functions for distributed PDF processing."""
 
-from typing import List
+from typing import List, Set
 from botocore.exceptions import ClientError
 
+from rag_pipeline.storage.s3 import TRANSFER_CONFIG
+
 
 def list_pdfs_from_s3(s3_client, bucket: str, prefix: str) -> List[str]:
     """
@@ -57,7 +59,7 @@ def download_from_s3(s3_client, bucket: str, key: str, local_path: str) -> str:
     Returns:
         Local file path
     """
-    s3_client.download_file(bucket, key, local_path)
+    s3_client.download_file(bucket, key, local_path, Config=TRANSFER_CONFIG)
     return local_path
 
 
@@ -93,3 +95,48 @@ def s3_object_exists(s3_client, bucket: str, key: str) -> bool:
         if e.response["Error"]["Code"] == "404":
             return False
         raise
+
+
+def list_s3_keys(s3_client, bucket: str, prefix: str, suffix: str = "") -> Set[str]:
+    """
+    List object keys under a prefix in one paginated sweep.
+
+    One ListObjectsV2 call returns up to 1000 keys, so checking many keys
+    against this set replaces one HeadObject round trip per key.
+
+    Args:
+        s3_client: boto3 S3 client
+        bucket: S3 bucket name
+        prefix: Prefix to list (e.g., 'processed/')
+        suffix: Only keep keys ending with this (e.g., '/document.md')
+
+    Returns:
+        Set of matching object keys
+    """
+    keys = set()
+    paginator = s3_client.get_paginator("list_objects_v2")
+
+    for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+        for obj in page.get("Contents", []):
+            if obj["Key"].endswith(suffix):
+                keys.add(obj["Key"])
+
+    return keys
+
+
+def copy_in_s3(s3_client, bucket: str, source_key: str, dest_key: str) -> None:
+    """
+    Copy an object within a bucket server-side.
+
+    The bytes never pass through this process, unlike a download followed by
+    an upload.
+
+    Args:
+        s3_client: boto3 S3 client
+        bucket: S3 bucket name
+        source_key: Key of the existing object
+        dest_key: Key to copy it to
+    """
+    s3_client.copy_object(
+        Bucket=bucket, Key=dest_key, CopySource={"Bucket": bucket, "Key": source_key}
+    )